@@ -116,6 +116,57 @@ struct AbilityData: Codable {
 struct TranslationDictionary: Codable {
     let moves: [String: String]
     let abilities: [String: String]
+    // 1文ごとの訳（段落の訳はここから組み立てる。translation_memory.py の compact_dictionary）
+    let sentences: [String: String]?
+}
+
+// 区切りの正規表現で分割し、区切り自体も返す
+func splitKeepingSeparators(_ text: String, _ regex: NSRegularExpression) -> (parts: [String], separators: [String]) {
+    let nsText = text as NSString
+    var parts: [String] = []
+    var separators: [String] = []
+    var start = 0
+    for match in regex.matches(in: text, range: NSRange(location: 0, length: nsText.length)) {
+        parts.append(nsText.substring(with: NSRange(location: start, length: match.range.location - start)))
+        separators.append(nsText.substring(with: match.range))
+        start = match.range.location + match.range.length
+    }
+    parts.append(nsText.substring(from: start))
+    return (parts, separators)
+}
+
+let lineBreakRegex = try! NSRegularExpression(pattern: "\\s*\\n\\s*")
+let sentenceBreakRegex = try! NSRegularExpression(pattern: "(?<=[.!?])\\s+")
+
+// 段落の訳が辞書に無い効果文を1文ごとの訳から組み立てる（SentenceMemory.translate と同じ分け方。未知の文があれば nil）
+func assembleFromSentences(_ text: String, _ sentences: [String: String]) -> String? {
+    let trimmed = text.trimmingCharacters(in: .whitespacesAndNewlines)
+    if trimmed.isEmpty {
+        return nil
+    }
+    let lines = splitKeepingSeparators(trimmed, lineBreakRegex)
+    var result = ""
+    for (i, line) in lines.parts.enumerated() {
+        var translatedLine = ""
+        for sentence in splitKeepingSeparators(line, sentenceBreakRegex).parts where !sentence.isEmpty {
+            guard let translation = sentences[sentence] else {
+                return nil
+            }
+            translatedLine += translatedLine.isEmpty || translatedLine.hasSuffix("。") ? translation : " " + translation
+        }
+        result += translatedLine
+        if i < lines.separators.count {
+            result += String(repeating: "\n", count: lines.separators[i].filter { $0 == "\n" }.count)
+        }
+    }
+    return result
+}
+
+func lookupTranslation(_ effect: String, _ paragraphs: [String: String], _ sentences: [String: String]) -> String? {
+    if let translation = paragraphs[effect] {
+        return translation
+    }
+    return assembleFromSentences(effect, sentences)
 }
 
 // Main process
@@ -140,6 +191,7 @@ guard let dict = try? decoder.decode(TranslationDictionary.self, from: dictData)
 print("✅ Translation dictionary loaded")
 print("  - Move translations: \(dict.moves.count)")
 print("  - Ability translations: \(dict.abilities.count)")
+print("  - Sentence translations: \(dict.sentences?.count ?? 0)")
 
 // Read JSON
 guard let jsonData = try? Data(contentsOf: URL(fileURLWithPath: jsonPath)) else {
@@ -164,7 +216,7 @@ for i in 0..<data.moves.count {
     effect = effect.replacingOccurrences(of: "\u{201C}", with: "\"") // " -> "
     effect = effect.replacingOccurrences(of: "\u{201D}", with: "\"") // " -> "
 
-    if let translation = dict.moves[effect] {
+    if let translation = lookupTranslation(effect, dict.moves, dict.sentences ?? [:]) {
         data.moves[i].effectJa = translation
         movesTranslated += 1
     }
@@ -179,7 +231,7 @@ for i in 0..<data.abilities.count {
     effect = effect.replacingOccurrences(of: "\u{201C}", with: "\"") // " -> "
     effect = effect.replacingOccurrences(of: "\u{201D}", with: "\"") // " -> "
 
-    if let translation = dict.abilities[effect] {
+    if let translation = lookupTranslation(effect, dict.abilities, dict.sentences ?? [:]) {
         data.abilities[i].effectJa = translation
         abilitiesTranslated += 1
     }
@@ -6,8 +6,17 @@ Uses the existing translation_dictionary.json for moves.
 
 import json
 from pathlib import Path
+import re
 import sys
 
+from dataset_patch import save_dataset
+from tool_runner import install_hooks
+from translation_cache import TranslationCache, content_hash
+from translation_memory import SentenceMemory, TranslationMemory
+
+# Near-match dictionary translations are listed here for a human to check
+REVIEW_PATH = Path('/tmp/translation_review.json')
+
 
 def load_translation_dictionary(dict_path: Path) -> dict:
     """Load the translation dictionary for moves."""
@@ -20,78 +29,303 @@ def load_translation_dictionary(dict_path: Path) -> dict:
         return {}
 
 
+def _trie_pattern(words) -> str:
+    """
+    Build a regex from a trie of words so that alternatives sharing a prefix
+    are tried together; greedy optional groups make the longest word win.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        is_end = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if is_end:
+            return ('(?:' + body + ')' if len(branches) == 1 and len(body) > 1 else body) + '?'
+        return body
+
+    return build(trie)
+
+
+def compile_replacements(pairs: list[tuple[str, str]]):
+    """
+    Compile (source, replacement) pairs into a single-pass replacer.
+
+    The text is scanned once from left to right; at each position the longest
+    matching source wins (e.g. "Special Attack" before "Attack"), and replaced
+    text is never matched again.
+    """
+    table = dict(pairs)
+    pattern = re.compile(_trie_pattern(table))
+    return lambda text: pattern.sub(lambda m: table[m.group(0)], text)
+
+
+# Polite form (ですます調) → plain form (だ・である調)
+DA_DEARU_CONVERSIONS = [
+    ("します。", "する。"),
+    ("します", "する"),
+    ("されます。", "される。"),
+    ("されます", "される"),
+    ("なります。", "なる。"),
+    ("なります", "なる"),
+    ("あります。", "ある。"),
+    ("あります", "ある"),
+    ("できます。", "できる。"),
+    ("できます", "できる"),
+    ("ません。", "ない。"),
+    ("ません", "ない"),
+    ("与えます。", "与える。"),
+    ("与えます", "与える"),
+    ("回復します。", "回復する。"),
+    ("回復します", "回復する"),
+    ("上昇します。", "上昇する。"),
+    ("上昇します", "上昇する"),
+    ("減少します。", "減少する。"),
+    ("減少します", "減少する"),
+    ("失敗します。", "失敗する。"),
+    ("失敗します", "失敗する"),
+    ("終了します。", "終了する。"),
+    ("終了します", "終了する"),
+    ("解除します。", "解除する。"),
+    ("解除します", "解除する"),
+    ("破壊します。", "破壊する。"),
+    ("破壊します", "破壊する"),
+    ("変更します。", "変更する。"),
+    ("変更します", "変更する"),
+    ("追加します。", "追加する。"),
+    ("追加します", "追加する"),
+    ("軽減します。", "軽減する。"),
+    ("軽減します", "軽減する"),
+    ("無視します。", "無視する。"),
+    ("無視します", "無視する"),
+    ("持続します。", "持続する。"),
+    ("持続します", "持続する"),
+    ("発動します。", "発動する。"),
+    ("発動します", "発動する"),
+    ("引き継ぎます。", "引き継ぐ。"),
+    ("引き継ぎます", "引き継ぐ"),
+    ("入れ替わります。", "入れ替わる。"),
+    ("入れ替わります", "入れ替わる"),
+    ("受けません。", "受けない。"),
+    ("受けません", "受けない"),
+    ("吸収します。", "吸収する。"),
+    ("吸収します", "吸収する"),
+    ("選ばれません。", "選ばれない。"),
+    ("選ばれません", "選ばれない"),
+    ("コピーできません。", "コピーできない。"),
+    ("コピーできません", "コピーできない"),
+    ("使用できません。", "使用できない。"),
+    ("使用できません", "使用できない"),
+    ("行動できなくします。", "行動できなくする。"),
+    ("行動できなくします", "行動できなくする"),
+]
+
+_replace_polite_forms = compile_replacements(DA_DEARU_CONVERSIONS)
+
+# Joins texts for batch conversion; never part of a conversion pattern
+_BATCH_SEPARATOR = '\x00'
+
+
 def convert_to_da_dearu(text: str) -> str:
     """
     Convert Japanese text from polite form (ですます調) to plain form (だ・である調).
+
+    Single scan; the longest matching pattern wins (e.g. 回復します before します).
     """
     if not text:
         return text
+    return _replace_polite_forms(text)
+
+
+def convert_to_da_dearu_batch(texts: list[str]) -> list[str]:
+    """Convert many texts with one scan over their concatenation."""
+    if not texts:
+        return []
+    joined = _BATCH_SEPARATOR.join(text or '' for text in texts)
+    converted = _replace_polite_forms(joined).split(_BATCH_SEPARATOR)
+    # Keep None / empty inputs as they were
+    return [c if text else text for text, c in zip(texts, converted)]
+
+
+# Core Pokemon terms - case sensitive replacements
+ABILITY_TERM_REPLACEMENTS = [
+    # Pronouns and basic terms
+    ("This Pokémon's", "このポケモンの"),
+    ("This Pokémon", "このポケモン"),
+    ("this Pokémon", "このポケモン"),
+    ("the user", "使用者"),
+    ("the target", "相手"),
+    ("The target", "相手"),
+
+    # Stats
+    (" HP", " HP"),
+    (" PP", " PP"),
+    ("Attack", "攻撃"),
+    ("attack", "攻撃"),
+    ("Defense", "防御"),
+    ("defense", "防御"),
+    ("Special Attack", "特攻"),
+    ("special attack", "特攻"),
+    ("Special Defense", "特防"),
+    ("special defense", "特防"),
+    ("Speed", "素早さ"),
+    ("speed", "素早さ"),
+    ("accuracy", "命中率"),
+    ("evasion", "回避率"),
+
+    # Status conditions
+    ("paralyzed", "まひ状態"),
+    ("paralyze", "まひ"),
+    ("paralysis", "まひ"),
+    ("poisoned", "どく状態"),
+    ("poison", "どく"),
+    ("badly poisoned", "もうどく状態"),
+    ("burned", "やけど状態"),
+    ("burn", "やけど"),
+    ("frozen", "こおり状態"),
+    ("freeze", "こおり"),
+    ("asleep", "ねむり状態"),
+    ("sleep", "ねむり"),
+    ("confused", "こんらん状態"),
+    ("confusion", "こんらん"),
+    ("flinch", "ひるみ"),
+    ("flinching", "ひるみ"),
+    ("infatuated", "メロメロ状態"),
+    ("infatuation", "メロメロ"),
+
+    # Battle mechanics
+    ("critical hit", "急所"),
+    ("critical hits", "急所"),
+    (" stage", " 段階"),
+    (" stages", " 段階"),
+    (" turn", " ターン"),
+    (" turns", " ターン"),
+    ("damage", "ダメージ"),
+    ("heals", "回復する"),
+    ("heal", "回復"),
+    ("faints", "ひんし状態になる"),
+    ("faint", "ひんし"),
+    ("move", "技"),
+    ("moves", "技"),
+    ("ability", "特性"),
+    ("abilities", "特性"),
+    (" field", " 場"),
+    ("battle", "戦闘"),
+    ("weather", "天候"),
+    ("makes contact", "接触"),
+
+    # Types (with hyphen)
+    ("normal-type", "ノーマルタイプ"),
+    ("fire-type", "ほのおタイプ"),
+    ("water-type", "みずタイプ"),
+    ("electric-type", "でんきタイプ"),
+    ("grass-type", "くさタイプ"),
+    ("ice-type", "こおりタイプ"),
+    ("fighting-type", "かくとうタイプ"),
+    ("poison-type", "どくタイプ"),
+    ("ground-type", "じめんタイプ"),
+    ("flying-type", "ひこうタイプ"),
+    ("psychic-type", "エスパータイプ"),
+    ("bug-type", "むしタイプ"),
+    ("rock-type", "いわタイプ"),
+    ("ghost-type", "ゴーストタイプ"),
+    ("dragon-type", "ドラゴンタイプ"),
+    ("dark-type", "あくタイプ"),
+    ("steel-type", "はがねタイプ"),
+    ("fairy-type", "フェアリータイプ"),
+
+    # Common phrases
+    (" has a ", " には"),
+    ("% chance", "%の確率"),
+    ("chance to", "の確率で"),
+    (" to ", " で"),
+    ("when ", "とき"),
+    ("When ", "とき"),
+    ("Whenever ", "するたびに"),
+    ("While ", "の間"),
+    ("If ", "もし"),
+    ("will ", "する"),
+    ("cannot ", "できない"),
+    ("cannot be", "できない"),
+    (" is ", " は"),
+    (" are ", " は"),
+    (" at the end of every turn", " 毎ターン終了時"),
+    (" at the end of each turn", " 毎ターン終了時"),
+    (" at the start of the turn", " ターン開始時"),
+    ("for five turns", "5ターンの間"),
+    ("for 5 turns", "5ターンの間"),
+    (" will fail", " 失敗する"),
+    (" raises ", " 上げる"),
+    (" lowers ", " 下げる"),
+    (" doubled", " 2倍"),
+    (" halved", " 半減"),
+    (" ignores ", " 無視する"),
+    (" with each hit", " 命中するたびに"),
+    ("may ", "可能性がある"),
+    (" by one stage", " 1段階"),
+    (" by two stages", " 2段階"),
+    (" one stage", " 1段階"),
+    (" two stages", " 2段階"),
+
+    # Weather
+    ("sandstorm", "すなあらし"),
+    ("rain", "あめ"),
+    ("sunshine", "にほんばれ"),
+    ("sunny day", "にほんばれ"),
+    ("hail", "あられ"),
+
+    # Specific ability/move names (some common ones)
+    ("substitute", "みがわり"),
+    ("protect", "まもる"),
+    ("detect", "みきり"),
+]
+
+_replace_ability_terms = compile_replacements(ABILITY_TERM_REPLACEMENTS)
+
+# Bump when translation logic changes in a way the tables below don't capture
+TRANSLATOR_REVISION = 2
+
+
+def translator_version() -> str:
+    """
+    Version string for the translation cache: changes whenever the revision
+    or the replacement tables change. Dictionary entries are tracked per
+    effect instead (see translation_sources).
+    """
+    return content_hash(
+        str(TRANSLATOR_REVISION),
+        json.dumps(ABILITY_TERM_REPLACEMENTS, ensure_ascii=False),
+        json.dumps(DA_DEARU_CONVERSIONS, ensure_ascii=False),
+    )[:16]
+
+
+def translation_sources(english_text: str, sentence_memory: SentenceMemory,
+                        memory: TranslationMemory | None = None) -> str:
+    """
+    Hash of the dictionary entries a translation is built from: the matching
+    paragraph entry, or the known sentences it is assembled from. Editing
+    other dictionary entries leaves it unchanged, so cached translations stay
+    valid.
+    """
+    match = memory.lookup(english_text) if memory else None
+    if match:
+        return content_hash('entry', match.translation)[:16]
+    known = sentence_memory.known_sentences(english_text)
+    return content_hash('sentences', *(translation or '' for translation in known))[:16]
 
-    # Apply conversions in order (more specific patterns first)
-    conversions = [
-        ("します。", "する。"),
-        ("します", "する"),
-        ("されます。", "される。"),
-        ("されます", "される"),
-        ("なります。", "なる。"),
-        ("なります", "なる"),
-        ("あります。", "ある。"),
-        ("あります", "ある"),
-        ("できます。", "できる。"),
-        ("できます", "できる"),
-        ("ません。", "ない。"),
-        ("ません", "ない"),
-        ("与えます。", "与える。"),
-        ("与えます", "与える"),
-        ("回復します。", "回復する。"),
-        ("回復します", "回復する"),
-        ("上昇します。", "上昇する。"),
-        ("上昇します", "上昇する"),
-        ("減少します。", "減少する。"),
-        ("減少します", "減少する"),
-        ("失敗します。", "失敗する。"),
-        ("失敗します", "失敗する"),
-        ("終了します。", "終了する。"),
-        ("終了します", "終了する"),
-        ("解除します。", "解除する。"),
-        ("解除します", "解除する"),
-        ("破壊します。", "破壊する。"),
-        ("破壊します", "破壊する"),
-        ("変更します。", "変更する。"),
-        ("変更します", "変更する"),
-        ("追加します。", "追加する。"),
-        ("追加します", "追加する"),
-        ("軽減します。", "軽減する。"),
-        ("軽減します", "軽減する"),
-        ("無視します。", "無視する。"),
-        ("無視します", "無視する"),
-        ("持続します。", "持続する。"),
-        ("持続します", "持続する"),
-        ("発動します。", "発動する。"),
-        ("発動します", "発動する"),
-        ("引き継ぎます。", "引き継ぐ。"),
-        ("引き継ぎます", "引き継ぐ"),
-        ("入れ替わります。", "入れ替わる。"),
-        ("入れ替わります", "入れ替わる"),
-        ("受けません。", "受けない。"),
-        ("受けません", "受けない"),
-        ("吸収します。", "吸収する。"),
-        ("吸収します", "吸収する"),
-        ("選ばれません。", "選ばれない。"),
-        ("選ばれません", "選ばれない"),
-        ("コピーできません。", "コピーできない。"),
-        ("コピーできません", "コピーできない"),
-        ("使用できません。", "使用できない。"),
-        ("使用できません", "使用できない"),
-        ("行動できなくします。", "行動できなくする。"),
-        ("行動できなくします", "行動できなくする"),
-    ]
-
-    result = text
-    for polite, plain in conversions:
-        result = result.replace(polite, plain)
-
-    return result
+
+def _translate_ability_terms(english_text: str) -> str:
+    """Term-by-term translation, still in polite form."""
+    if not english_text or english_text.strip() == "":
+        return ""
+    return _replace_ability_terms(english_text)
 
 
 def translate_ability_effect(english_text: str) -> str:
@@ -99,160 +333,64 @@ def translate_ability_effect(english_text: str) -> str:
     Translate ability effect from English to Japanese.
     This provides basic translations for common Pokemon terms.
     """
-    if not english_text or english_text.strip() == "":
-        return ""
+    # Convert to plain form (だ・である調)
+    return convert_to_da_dearu(_translate_ability_terms(english_text))
 
-    # For abilities, we'll do a comprehensive term-by-term translation
-    # Start with the original text
-    japanese = english_text
-
-    # Core Pokemon terms - case sensitive replacements
-    term_replacements = [
-        # Pronouns and basic terms
-        ("This Pokémon's", "このポケモンの"),
-        ("This Pokémon", "このポケモン"),
-        ("this Pokémon", "このポケモン"),
-        ("the user", "使用者"),
-        ("the target", "相手"),
-        ("The target", "相手"),
-
-        # Stats
-        (" HP", " HP"),
-        (" PP", " PP"),
-        ("Attack", "攻撃"),
-        ("attack", "攻撃"),
-        ("Defense", "防御"),
-        ("defense", "防御"),
-        ("Special Attack", "特攻"),
-        ("special attack", "特攻"),
-        ("Special Defense", "特防"),
-        ("special defense", "特防"),
-        ("Speed", "素早さ"),
-        ("speed", "素早さ"),
-        ("accuracy", "命中率"),
-        ("evasion", "回避率"),
-
-        # Status conditions
-        ("paralyzed", "まひ状態"),
-        ("paralyze", "まひ"),
-        ("paralysis", "まひ"),
-        ("poisoned", "どく状態"),
-        ("poison", "どく"),
-        ("badly poisoned", "もうどく状態"),
-        ("burned", "やけど状態"),
-        ("burn", "やけど"),
-        ("frozen", "こおり状態"),
-        ("freeze", "こおり"),
-        ("asleep", "ねむり状態"),
-        ("sleep", "ねむり"),
-        ("confused", "こんらん状態"),
-        ("confusion", "こんらん"),
-        ("flinch", "ひるみ"),
-        ("flinching", "ひるみ"),
-        ("infatuated", "メロメロ状態"),
-        ("infatuation", "メロメロ"),
-
-        # Battle mechanics
-        ("critical hit", "急所"),
-        ("critical hits", "急所"),
-        (" stage", " 段階"),
-        (" stages", " 段階"),
-        (" turn", " ターン"),
-        (" turns", " ターン"),
-        ("damage", "ダメージ"),
-        ("heals", "回復する"),
-        ("heal", "回復"),
-        ("faints", "ひんし状態になる"),
-        ("faint", "ひんし"),
-        ("move", "技"),
-        ("moves", "技"),
-        ("ability", "特性"),
-        ("abilities", "特性"),
-        (" field", " 場"),
-        ("battle", "戦闘"),
-        ("weather", "天候"),
-        ("makes contact", "接触"),
-
-        # Types (with hyphen)
-        ("normal-type", "ノーマルタイプ"),
-        ("fire-type", "ほのおタイプ"),
-        ("water-type", "みずタイプ"),
-        ("electric-type", "でんきタイプ"),
-        ("grass-type", "くさタイプ"),
-        ("ice-type", "こおりタイプ"),
-        ("fighting-type", "かくとうタイプ"),
-        ("poison-type", "どくタイプ"),
-        ("ground-type", "じめんタイプ"),
-        ("flying-type", "ひこうタイプ"),
-        ("psychic-type", "エスパータイプ"),
-        ("bug-type", "むしタイプ"),
-        ("rock-type", "いわタイプ"),
-        ("ghost-type", "ゴーストタイプ"),
-        ("dragon-type", "ドラゴンタイプ"),
-        ("dark-type", "あくタイプ"),
-        ("steel-type", "はがねタイプ"),
-        ("fairy-type", "フェアリータイプ"),
-
-        # Common phrases
-        (" has a ", " には"),
-        ("% chance", "%の確率"),
-        ("chance to", "の確率で"),
-        (" to ", " で"),
-        ("when ", "とき"),
-        ("When ", "とき"),
-        ("Whenever ", "するたびに"),
-        ("While ", "の間"),
-        ("If ", "もし"),
-        ("will ", "する"),
-        ("cannot ", "できない"),
-        ("cannot be", "できない"),
-        (" is ", " は"),
-        (" are ", " は"),
-        (" at the end of every turn", " 毎ターン終了時"),
-        (" at the end of each turn", " 毎ターン終了時"),
-        (" at the start of the turn", " ターン開始時"),
-        ("for five turns", "5ターンの間"),
-        ("for 5 turns", "5ターンの間"),
-        (" will fail", " 失敗する"),
-        (" raises ", " 上げる"),
-        (" lowers ", " 下げる"),
-        (" doubled", " 2倍"),
-        (" halved", " 半減"),
-        (" ignores ", " 無視する"),
-        (" with each hit", " 命中するたびに"),
-        ("may ", "可能性がある"),
-        (" by one stage", " 1段階"),
-        (" by two stages", " 2段階"),
-        (" one stage", " 1段階"),
-        (" two stages", " 2段階"),
-
-        # Weather
-        ("sandstorm", "すなあらし"),
-        ("rain", "あめ"),
-        ("sunshine", "にほんばれ"),
-        ("sunny day", "にほんばれ"),
-        ("hail", "あられ"),
-
-        # Specific ability/move names (some common ones)
-        ("substitute", "みがわり"),
-        ("protect", "まもる"),
-        ("detect", "みきり"),
-    ]
-
-    # Apply replacements in order
-    for en, ja in term_replacements:
-        japanese = japanese.replace(en, ja)
 
-    # Convert to plain form (だ・である調)
-    japanese = convert_to_da_dearu(japanese)
+def _needs_translation(item: dict) -> bool:
+    return 'effect' in item and 'effectJa' in item and (not item['effectJa'] or item['effectJa'].strip() == "")
 
-    return japanese
 
+def _translate_pending(items: list[dict], kind: str, to_polite, cache: TranslationCache | None, sources_of) -> int:
+    """
+    Fill effectJa for items, reusing cached translations whose dictionary
+    sources (sources_of(effect)) are unchanged.
 
-def translate_json_files(base_path: Path, translation_dict: dict):
+    Returns the number of effects that actually had to be translated.
+    """
+    misses = []
+    for item in items:
+        sources = sources_of(item['effect']) if cache else ''
+        cached = cache.get(kind, item['effect'], sources) if cache else None
+        if cached is None:
+            misses.append((item, sources))
+        else:
+            item['effectJa'] = cached
+
+    translated = convert_to_da_dearu_batch([to_polite(item['effect']) for item, _ in misses])
+    for (item, sources), effect_ja in zip(misses, translated):
+        item['effectJa'] = effect_ja
+        if cache:
+            cache.put(kind, item['effect'], effect_ja, sources)
+    return len(misses)
+
+
+def translate_json_files(base_path: Path, translation_dict: dict, cache: TranslationCache | None = None,
+                         sentence_memory: SentenceMemory | None = None):
     """
     Translate effectJa fields in JSON files.
+
+    Effects found in the cache are filled without retranslating, and a file is
+    only written when something needed translation. Effects missing from the
+    dictionary are assembled sentence by sentence from sentence_memory; only
+    unknown sentences fall back to the term replacer.
     """
+    if sentence_memory is None:
+        sentence_memory = SentenceMemory(translation_dict)
+    new_sentences = set()
+    memory = TranslationMemory(translation_dict)
+
+    def ability_sources(english_text: str) -> str:
+        return translation_sources(english_text, sentence_memory)
+
+    def move_sources(english_text: str) -> str:
+        return translation_sources(english_text, sentence_memory, memory)
+
+    def assemble(english_text: str) -> str:
+        translated, missing = sentence_memory.translate(english_text, fallback=_translate_ability_terms)
+        new_sentences.update(missing)
+        return translated or ""
+
     # Process ability_metadata.json
     ability_metadata_path = base_path / 'ability_metadata.json'
     if ability_metadata_path.exists():
@@ -261,17 +399,14 @@ def translate_json_files(base_path: Path, translation_dict: dict):
         with open(ability_metadata_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
 
-        count = 0
-        for item in data:
-            if 'effect' in item and 'effectJa' in item:
-                if not item['effectJa'] or item['effectJa'].strip() == "":
-                    item['effectJa'] = translate_ability_effect(item['effect'])
-                    count += 1
+        pending = [item for item in data if _needs_translation(item)]
+        translated_count = _translate_pending(pending, 'ability', assemble, cache, ability_sources)
+        count = len(pending)
 
-        with open(ability_metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if count:
+            save_dataset(ability_metadata_path, data, message=f"Translate {count} ability effects")
 
-        print(f"  ✓ Translated {count} abilities")
+        print(f"  ✓ Translated {count} abilities ({count - translated_count} from cache)")
 
     # Process scarlet_violet.json
     scarlet_violet_path = base_path / 'scarlet_violet.json'
@@ -281,36 +416,54 @@ def translate_json_files(base_path: Path, translation_dict: dict):
         with open(scarlet_violet_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
 
-        ability_count = 0
-        move_count = 0
-
         # Process abilities
-        if 'abilities' in data:
-            for ability in data['abilities']:
-                if 'effect' in ability and 'effectJa' in ability:
-                    if not ability['effectJa'] or ability['effectJa'].strip() == "":
-                        ability['effectJa'] = translate_ability_effect(ability['effect'])
-                        ability_count += 1
+        abilities = [a for a in data.get('abilities', []) if _needs_translation(a)]
+        translated_count = _translate_pending(abilities, 'ability', assemble, cache, ability_sources)
 
         # Process moves using the translation dictionary
-        if 'moves' in data:
-            for move in data['moves']:
-                if 'effect' in move and 'effectJa' in move:
-                    if not move['effectJa'] or move['effectJa'].strip() == "":
-                        # Try to find translation in dictionary
-                        english_effect = move['effect']
-                        if english_effect in translation_dict:
-                            # Apply da-dearu conversion to dictionary translation
-                            move['effectJa'] = convert_to_da_dearu(translation_dict[english_effect])
-                        else:
-                            # Fall back to basic translation
-                            move['effectJa'] = translate_ability_effect(english_effect)
-                        move_count += 1
-
-        with open(scarlet_violet_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-
-        print(f"  ✓ Translated {ability_count} abilities and {move_count} moves")
+        # (normalized matches are reused; near matches only go to the review list,
+        # since a one-word user/target swap still scores above 0.9)
+        near_matches = []
+
+        def move_to_polite(english_effect: str) -> str:
+            match = memory.lookup(english_effect)
+            if match:
+                return match.translation
+            # Paragraphs split into dictionary sentences are assembled as-is
+            assembled, missing = sentence_memory.translate(english_effect)
+            if not missing:
+                return assembled
+            near = memory.near_match(english_effect)
+            if near:
+                near_matches.append({
+                    'effect': english_effect,
+                    'candidate': near.source,
+                    'candidateJa': near.translation,
+                    'confidence': round(near.confidence, 3),
+                })
+            # Fall back to known sentences, then basic translation
+            return assemble(english_effect)
+
+        moves = [m for m in data.get('moves', []) if _needs_translation(m)]
+        translated_count += _translate_pending(moves, 'move', move_to_polite, cache, move_sources)
+
+        ability_count = len(abilities)
+        move_count = len(moves)
+
+        if ability_count or move_count:
+            save_dataset(scarlet_violet_path, data, message=f"Translate {ability_count} ability and {move_count} move effects")
+
+        print(f"  ✓ Translated {ability_count} abilities and {move_count} moves ({ability_count + move_count - translated_count} from cache)")
+        if near_matches:
+            with open(REVIEW_PATH, 'w', encoding='utf-8') as f:
+                json.dump(near_matches, f, ensure_ascii=False, indent=2)
+            print(f"  ! {len(near_matches)} moves have a near-match dictionary entry to review: {REVIEW_PATH}")
+
+    if new_sentences:
+        print(f"  ! {len(new_sentences)} sentences are not in the dictionary yet (term translation used)")
+
+    if cache:
+        cache.save()
 
 
 def main():
@@ -321,13 +474,19 @@ def main():
     # Load translation dictionary
     print("Loading translation dictionary...")
     translation_dict = load_translation_dictionary(dict_path)
-    print(f"  ✓ Loaded {len(translation_dict)} move translations")
+    print(f"  ✓ Loaded {len(translation_dict)} move paragraph translations")
+
+    sentence_memory = SentenceMemory.load(dict_path) if dict_path.exists() else None
+    if sentence_memory is not None:
+        print(f"  ✓ Loaded {len(sentence_memory)} sentence translations")
+    cache = TranslationCache(translator_version())
 
     # Translate JSON files
-    translate_json_files(base_path, translation_dict)
+    translate_json_files(base_path, translation_dict, cache, sentence_memory)
 
     print("\nTranslation complete!")
 
 
 if __name__ == '__main__':
+    install_hooks()
     main()
@@ -12,6 +12,9 @@
 import json
 import requests
 import time
+from dataset_patch import save_dataset
+from form_id_registry import FormIdRegistry
+from tool_runner import install_hooks
 
 INPUT_FILE = '/Users/yusuke/Development/Pokedex-SwiftUI/Pokedex/Pokedex/Resources/PreloadedData/scarlet_violet.json'
 OUTPUT_FILE = INPUT_FILE
@@ -94,9 +97,11 @@ def create_pokemon_from_api(api_data, name_ja, pokedex_numbers=None):
 
     return pokemon_entry
 
-def create_cosmetic_variant(base_pokemon, form_name, name_ja):
+def create_cosmetic_variant(base_pokemon, form_name, name_ja, registry):
     """コスメティックフォーム（性能同じ）を作成"""
     variant = base_pokemon.copy()
+    # IDはレジストリから取得（再生成しても同じIDになる）
+    variant['id'] = registry.allocate(form_name, 'cosmetic')
     variant['name'] = form_name
     variant['nameJa'] = name_ja
     # 図鑑番号は引き継がない（一覧に表示しない）
@@ -111,6 +116,8 @@ def main():
         data = json.load(f)
 
     pokemon_list = data['pokemon']
+    registry = FormIdRegistry()
+    registry.bootstrap(pokemon_list)
     added_count = 0
 
     # ===== カラナクシ・トリトドン（東西） =====
@@ -125,7 +132,7 @@ def main():
         ]
         for form_name, name_ja in forms:
             if not any(p['name'] == form_name for p in pokemon_list):
-                variant = create_cosmetic_variant(shellos_base, form_name, name_ja)
+                variant = create_cosmetic_variant(shellos_base, form_name, name_ja, registry)
                 pokemon_list.append(variant)
                 print(f"  ✅ {form_name} ({name_ja})")
                 added_count += 1
@@ -137,7 +144,7 @@ def main():
         ]
         for form_name, name_ja in forms:
             if not any(p['name'] == form_name for p in pokemon_list):
-                variant = create_cosmetic_variant(gastrodon_base, form_name, name_ja)
+                variant = create_cosmetic_variant(gastrodon_base, form_name, name_ja, registry)
                 pokemon_list.append(variant)
                 print(f"  ✅ {form_name} ({name_ja})")
                 added_count += 1
@@ -156,7 +163,7 @@ def main():
         ]
         for form_name, name_ja in forms:
             if not any(p['name'] == form_name for p in pokemon_list):
-                variant = create_cosmetic_variant(deerling_base, form_name, name_ja)
+                variant = create_cosmetic_variant(deerling_base, form_name, name_ja, registry)
                 pokemon_list.append(variant)
                 print(f"  ✅ {form_name} ({name_ja})")
                 added_count += 1
@@ -170,7 +177,7 @@ def main():
         ]
         for form_name, name_ja in forms:
             if not any(p['name'] == form_name for p in pokemon_list):
-                variant = create_cosmetic_variant(sawsbuck_base, form_name, name_ja)
+                variant = create_cosmetic_variant(sawsbuck_base, form_name, name_ja, registry)
                 pokemon_list.append(variant)
                 print(f"  ✅ {form_name} ({name_ja})")
                 added_count += 1
@@ -204,7 +211,7 @@ def main():
         ]
         for form_name, name_ja in forms:
             if not any(p['name'] == form_name for p in pokemon_list):
-                variant = create_cosmetic_variant(vivillon_base, form_name, name_ja)
+                variant = create_cosmetic_variant(vivillon_base, form_name, name_ja, registry)
                 pokemon_list.append(variant)
                 print(f"  ✅ {form_name} ({name_ja})")
                 added_count += 1
@@ -225,7 +232,7 @@ def main():
         ]
         for form_name, name_ja in forms:
             if not any(p['name'] == form_name for p in pokemon_list):
-                variant = create_cosmetic_variant(flabebe_base, form_name, name_ja)
+                variant = create_cosmetic_variant(flabebe_base, form_name, name_ja, registry)
                 pokemon_list.append(variant)
                 print(f"  ✅ {form_name} ({name_ja})")
                 added_count += 1
@@ -240,7 +247,7 @@ def main():
         ]
         for form_name, name_ja in forms:
             if not any(p['name'] == form_name for p in pokemon_list):
-                variant = create_cosmetic_variant(floette_base, form_name, name_ja)
+                variant = create_cosmetic_variant(floette_base, form_name, name_ja, registry)
                 pokemon_list.append(variant)
                 print(f"  ✅ {form_name} ({name_ja})")
                 added_count += 1
@@ -255,19 +262,20 @@ def main():
         ]
         for form_name, name_ja in forms:
             if not any(p['name'] == form_name for p in pokemon_list):
-                variant = create_cosmetic_variant(florges_base, form_name, name_ja)
+                variant = create_cosmetic_variant(florges_base, form_name, name_ja, registry)
                 pokemon_list.append(variant)
                 print(f"  ✅ {form_name} ({name_ja})")
                 added_count += 1
 
     # 保存
     data['pokemon'] = pokemon_list
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_dataset(OUTPUT_FILE, data)
+    registry.save()
 
     print(f"\n{'='*70}")
     print(f"✅ 完了: {added_count}フォームを追加")
     print(f"📝 保存先: {OUTPUT_FILE}")
 
 if __name__ == '__main__':
+    install_hooks()
     main()
@@ -7,6 +7,9 @@
 """
 
 import json
+from dataset_patch import save_dataset
+from form_id_registry import FormIdRegistry
+from tool_runner import install_hooks
 
 INPUT_FILE = '/Users/yusuke/Development/Pokedex-SwiftUI/Pokedex/Pokedex/Resources/PreloadedData/scarlet_violet.json'
 OUTPUT_FILE = INPUT_FILE
@@ -19,6 +22,8 @@ def main():
         data = json.load(f)
 
     pokemon_list = data['pokemon']
+    registry = FormIdRegistry()
+    registry.bootstrap(pokemon_list)
 
     # 基本形のアルセウスを取得
     arceus_base = next((p for p in pokemon_list if p['name'] == 'arceus'), None)
@@ -64,6 +69,8 @@ def main():
 
         # 基本形をコピー
         variant = arceus_base.copy()
+        # IDはレジストリから取得（再生成しても同じIDになる）
+        variant['id'] = registry.allocate(form_name, 'arceus')
         variant['name'] = form_name
         variant['nameJa'] = name_ja
 
@@ -86,12 +93,13 @@ def main():
 
     # 保存
     data['pokemon'] = pokemon_list
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_dataset(OUTPUT_FILE, data)
+    registry.save()
 
     print(f"\n{'='*60}")
     print(f"✅ 完了: {added_count}フォームを追加")
     print(f"📝 保存先: {OUTPUT_FILE}")
 
 if __name__ == '__main__':
+    install_hooks()
     main()
@@ -9,6 +9,8 @@
 
 import json
 import sys
+from dataset_patch import save_dataset
+from tool_runner import install_hooks
 
 def add_base_forms(input_file, output_file):
     """基本フォームを追加"""
@@ -70,12 +72,12 @@ def add_base_forms(input_file, output_file):
         added_count += 1
 
     # 保存
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_dataset(output_file, data)
 
     print(f"\n追加完了: {added_count}件")
 
 if __name__ == '__main__':
+    install_hooks()
     input_file = 'Pokedex/Pokedex/Resources/PreloadedData/scarlet_violet.json'
     output_file = input_file  # 上書き
 
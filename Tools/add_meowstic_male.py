@@ -7,6 +7,8 @@
 
 import json
 import sys
+from dataset_patch import save_dataset
+from tool_runner import install_hooks
 
 def add_meowstic_male(input_file, output_file):
     """ニャオニクス（オス）のデータを追加"""
@@ -49,12 +51,12 @@ def add_meowstic_male(input_file, output_file):
     print(f"  pokedexNumbers: {meowstic_male['pokedexNumbers']}")
 
     # 保存
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_dataset(output_file, data)
 
     print("\n追加完了: 1件")
 
 if __name__ == '__main__':
+    install_hooks()
     input_file = 'Pokedex/Pokedex/Resources/PreloadedData/scarlet_violet.json'
     output_file = input_file  # 上書き
 
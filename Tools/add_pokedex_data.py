@@ -6,6 +6,8 @@ Scarlet/Violetのポケモン図鑑データをscarlet_violet.jsonに追加
 import json
 import requests
 import time
+from dataset_patch import save_dataset
+from tool_runner import install_hooks
 
 POKEDEX_NAMES = ["paldea", "kitakami", "blueberry"]
 
@@ -47,12 +49,12 @@ def main():
     data["pokedexes"] = pokedexes
 
     # 保存
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_dataset(json_path, data)
 
     print(f"\n✅ Added {len(pokedexes)} pokedexes to scarlet_violet.json")
     for pokedex in pokedexes:
         print(f"  - {pokedex['name']}: {len(pokedex['speciesIds'])} species")
 
 if __name__ == "__main__":
+    install_hooks()
     main()
@@ -11,6 +11,9 @@
 import json
 import requests
 import time
+from dataset_patch import save_dataset
+from form_id_registry import FormIdRegistry
+from tool_runner import install_hooks
 
 INPUT_FILE = '/Users/yusuke/Development/Pokedex-SwiftUI/Pokedex/Pokedex/Resources/PreloadedData/scarlet_violet.json'
 OUTPUT_FILE = INPUT_FILE
@@ -27,9 +30,11 @@ def fetch_pokemon_form_data(form_name):
         print(f"  ⚠️  フォームデータ取得失敗: {form_name} - {e}")
         return None
 
-def create_form_variant(base_pokemon, form_name, form_name_ja):
+def create_form_variant(base_pokemon, form_name, form_name_ja, registry):
     """基本形からフォームバリアントを作成"""
     variant = base_pokemon.copy()
+    # IDはレジストリから取得（再生成しても同じIDになる）
+    variant['id'] = registry.allocate(form_name, 'cosmetic')
     variant['name'] = form_name
     variant['nameJa'] = form_name_ja
 
@@ -47,6 +52,8 @@ def main():
         data = json.load(f)
 
     pokemon_list = data['pokemon']
+    registry = FormIdRegistry()
+    registry.bootstrap(pokemon_list)
     added_count = 0
 
     # シキジカ (deerling)
@@ -66,7 +73,7 @@ def main():
                 print(f"  ✓ {form_name} は既に存在")
                 continue
 
-            variant = create_form_variant(deerling_base, form_name, form_name_ja)
+            variant = create_form_variant(deerling_base, form_name, form_name_ja, registry)
             pokemon_list.append(variant)
             print(f"  ✅ 追加: {form_name} ({form_name_ja})")
             added_count += 1
@@ -87,7 +94,7 @@ def main():
                 print(f"  ✓ {form_name} は既に存在")
                 continue
 
-            variant = create_form_variant(sawsbuck_base, form_name, form_name_ja)
+            variant = create_form_variant(sawsbuck_base, form_name, form_name_ja, registry)
             pokemon_list.append(variant)
             print(f"  ✅ 追加: {form_name} ({form_name_ja})")
             added_count += 1
@@ -124,18 +131,19 @@ def main():
                 print(f"  ✓ {form_name} は既に存在")
                 continue
 
-            variant = create_form_variant(vivillon_base, form_name, form_name_ja)
+            variant = create_form_variant(vivillon_base, form_name, form_name_ja, registry)
             pokemon_list.append(variant)
             print(f"  ✅ 追加: {form_name} ({form_name_ja})")
             added_count += 1
 
     # 保存
     data['pokemon'] = pokemon_list
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_dataset(OUTPUT_FILE, data)
+    registry.save()
 
     print(f"\n✅ 完了: {added_count}フォームを追加")
     print(f"📝 保存先: {OUTPUT_FILE}")
 
 if __name__ == '__main__':
+    install_hooks()
     main()
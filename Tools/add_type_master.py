@@ -4,6 +4,8 @@
 """
 
 import json
+from dataset_patch import save_dataset
+from tool_runner import install_hooks
 
 # 18種類のタイプとその日本語名
 TYPE_MASTER = {
@@ -41,10 +43,10 @@ def main():
 
     # 保存
     print(f"💾 Writing to {input_file}...")
-    with open(input_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_dataset(input_file, data)
 
     print("✨ Done!")
 
 if __name__ == "__main__":
+    install_hooks()
     main()
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the data tools
+データツールのベンチマーク（所要時間・スループット・ピークメモリ）
+
+実データ（scarlet_violet.json）と、それを複製して拡大した合成データセット（×10, ×100 ...）で計測する。
+--synthetic では synthetic_dataset.py で生成したデータセットを使う（実データが無くても計測できる）。
+--record で benchmark_baseline.json に基準値を記録し、--check で基準値と比較して遅くなったケースを報告する。
+基準値はマシンに依存するので、同じマシンで記録したものと比較すること。
+
+使い方:
+  python benchmarks.py [--dataset json_path | --synthetic] [--scales 1,10] [--cases name,name] [--repeat N]
+                       [--record | --check [--tolerance 0.25]] [--json report.json]
+"""
+
+import copy
+import importlib.util
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+from tool_runner import install_hooks
+
+DEFAULT_DATASET_PATH = Path(__file__).parent.parent / 'Pokedex' / 'Pokedex' / 'Resources' / 'PreloadedData' / 'scarlet_violet.json'
+DEFAULT_BASELINE_PATH = Path(__file__).parent / 'benchmark_baseline.json'
+
+# 複製ごとにずらす量（元のデータと重ならない大きさ）
+ID_STRIDE = 100000
+NATIONAL_STRIDE = 10000
+CHAIN_STRIDE = 10000
+MOVE_STRIDE = 10000
+ABILITY_STRIDE = 10000
+
+
+class Workload(NamedTuple):
+    items: int
+    run: Callable
+    # 計測のたびに呼ぶ準備（計測時間に含めない）。戻り値を run に渡す
+    setup: Callable | None = None
+
+
+# ケース名 → (関数, 単位)
+CASES = {}
+
+
+def case(name: str, unit: str):
+    """ベンチマークケースを登録するデコレーター（関数は (data, json_path) → Workload）"""
+    def register(fn):
+        CASES[name] = (fn, unit)
+        return fn
+    return register
+
+
+def _offset(value, stride: int, k: int):
+    return value + stride * k if value is not None else None
+
+
+def scale_dataset(data: dict, factor: int) -> dict:
+    """
+    データセットを factor 倍に複製する
+
+    複製ごとに ID・全国図鑑番号・チェーンID・技ID・特性ID をずらし、地方図鑑は別の図鑑（paldea-s1 ...）にする。
+    進化・技・特性・図鑑の参照は複製の中で閉じているので、どの複製も元のデータと同じ形になる。
+    """
+    if factor <= 1:
+        return data
+
+    scaled = {key: value for key, value in data.items() if key not in ('pokemon', 'moves', 'abilities', 'pokedexes')}
+    scaled['pokemon'] = list(data['pokemon'])
+    scaled['moves'] = list(data.get('moves', []))
+    scaled['abilities'] = list(data.get('abilities', []))
+    scaled['pokedexes'] = list(data.get('pokedexes', []))
+
+    for k in range(1, factor):
+        suffix = f"-s{k}"
+        for pokemon in data['pokemon']:
+            p = copy.deepcopy(pokemon)
+            p['id'] = _offset(p['id'], ID_STRIDE, k)
+            p['name'] += suffix
+            if p.get('nationalDexNumber'):
+                p['nationalDexNumber'] = _offset(p['nationalDexNumber'], NATIONAL_STRIDE, k)
+            if p.get('varieties'):
+                p['varieties'] = [_offset(v, ID_STRIDE, k) for v in p['varieties']]
+            if p.get('pokedexNumbers'):
+                p['pokedexNumbers'] = {f"{name}{suffix}": number for name, number in p['pokedexNumbers'].items()}
+            evolution_chain = p.get('evolutionChain')
+            if evolution_chain:
+                evolution_chain['chainId'] = _offset(evolution_chain.get('chainId'), CHAIN_STRIDE, k)
+                evolution_chain['evolvesFrom'] = _offset(evolution_chain.get('evolvesFrom'), ID_STRIDE, k)
+                evolution_chain['evolvesTo'] = [_offset(i, ID_STRIDE, k) for i in evolution_chain.get('evolvesTo') or []]
+            for move in p.get('moves', []):
+                move['moveId'] = _offset(move['moveId'], MOVE_STRIDE, k)
+            abilities = p.get('abilities')
+            if isinstance(abilities, dict):
+                abilities['primary'] = [_offset(a, ABILITY_STRIDE, k) for a in abilities.get('primary', [])]
+                abilities['hidden'] = _offset(abilities.get('hidden'), ABILITY_STRIDE, k)
+            scaled['pokemon'].append(p)
+
+        for move in data.get('moves', []):
+            scaled['moves'].append({**move, 'id': _offset(move['id'], MOVE_STRIDE, k), 'name': move['name'] + suffix})
+        for ability in data.get('abilities', []):
+            scaled['abilities'].append({**ability, 'id': _offset(ability['id'], ABILITY_STRIDE, k), 'name': ability['name'] + suffix})
+        for pokedex in data.get('pokedexes', []):
+            scaled['pokedexes'].append({
+                **pokedex,
+                'name': pokedex['name'] + suffix,
+                'speciesIds': [_offset(s, NATIONAL_STRIDE, k) for s in pokedex.get('speciesIds', [])],
+            })
+    return scaled
+
+
+# ---- ケース ----
+
+@case('json.load', 'pokemon')
+def bench_load(data, json_path):
+    def run():
+        with open(json_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return Workload(len(data['pokemon']), run)
+
+
+@case('load_compact', 'pokemon')
+def bench_load_compact(data, json_path):
+    from compact_dataset import load_compact
+    # json.load と比べる（peakMiB の差がレコード化・intern・逐次読み込みで減った分）
+    return Workload(len(data['pokemon']), lambda: load_compact(json_path))
+
+
+@case('json.dump', 'pokemon')
+def bench_dump(data, json_path):
+    # ツールが保存するときと同じ形式（ensure_ascii=False, indent=2）
+    return Workload(len(data['pokemon']), lambda: json.dumps(data, ensure_ascii=False, indent=2))
+
+
+@case('detect_move_categories', 'moves')
+def bench_detect_move_categories(data, json_path):
+    from move_categories import detect_move_categories
+    moves = data.get('moves', [])
+    return Workload(len(moves), lambda: [detect_move_categories(m) for m in moves])
+
+
+@case('detect_move_categories_batch', 'moves')
+def bench_detect_move_categories_batch(data, json_path):
+    from move_categories import detect_move_categories_batch
+    moves = data.get('moves', [])
+    return Workload(len(moves), lambda: detect_move_categories_batch(moves))
+
+
+def _effects(data: dict) -> list[dict]:
+    return [item for key in ('abilities', 'moves') for item in data.get(key, []) if item.get('effect')]
+
+
+@case('translate_ability_effect', 'effects')
+def bench_translate_ability_effect(data, json_path):
+    from TranslateEffects import translate_ability_effect
+    texts = [item['effect'] for item in _effects(data)]
+    return Workload(len(texts), lambda: [translate_ability_effect(t) for t in texts])
+
+
+@case('convert_to_da_dearu', 'effects')
+def bench_convert_to_da_dearu(data, json_path):
+    from TranslateEffects import _translate_ability_terms, convert_to_da_dearu
+    # 日本語の効果文（無ければ用語置換だけした です・ます調の文）
+    texts = [item.get('effectJa') or _translate_ability_terms(item['effect']) for item in _effects(data)]
+    return Workload(len(texts), lambda: [convert_to_da_dearu(t) for t in texts])
+
+
+@case('inherit_evolution_moves', 'pokemon')
+def bench_inherit_evolution_moves(data, json_path):
+    from evolution_inheritance import inherit_evolution_moves
+
+    def setup():
+        # inherit_evolution_moves は技リストを書き換えるので、毎回コピーを渡す
+        return [{**p, 'moves': list(p.get('moves', []))} for p in data['pokemon']]
+    return Workload(len(data['pokemon']), inherit_evolution_moves, setup)
+
+
+@case('pokedex_analyzer', 'pokemon')
+def bench_pokedex_analyzer(data, json_path):
+    from pokedex_analyzer import analyze_dataset
+    return Workload(len(data['pokemon']), lambda: analyze_dataset(data))
+
+
+# pokemon_frame は NumPy が必要なので、入っている環境でだけ計測する
+if importlib.util.find_spec('numpy'):
+    @case('pokemon_frame.build', 'pokemon')
+    def bench_frame_build(data, json_path):
+        from pokemon_frame import frame_from_dataset
+        return Workload(len(data['pokemon']), lambda: frame_from_dataset(data))
+
+    @case('pokemon_frame.query', 'pokemon')
+    def bench_frame_query(data, json_path):
+        # 図鑑ごとの最速とタイプ別の分布（フレームの構築は計測に含めない）
+        from pokemon_frame import frame_from_dataset
+
+        def run(frame):
+            for mask in frame.dex_masks.values():
+                frame.top('speed', 1, mask)
+            return frame.stats_by_type('total')
+        return Workload(len(data['pokemon']), run, lambda: frame_from_dataset(data))
+
+
+def _register_check_cases():
+    """check_* スクリプトは validation_engine のルールとして実装されているので、ルールごとに計測する"""
+    from validation_engine import load_rules, validate
+
+    def make(rule_ids):
+        def bench(data, json_path):
+            return Workload(len(data['pokemon']), lambda: validate(data, rule_ids))
+        return bench
+
+    for rule_id in load_rules():
+        CASES[f"check:{rule_id}"] = (make([rule_id]), 'pokemon')
+    CASES['check:all'] = (make(None), 'pokemon')
+
+
+# ---- 計測 ----
+
+def measure(workload: Workload, repeat: int) -> dict:
+    """最速時間（repeat 回）と tracemalloc のピーク（別に1回実行）"""
+    times = []
+    for _ in range(repeat):
+        args = (workload.setup(),) if workload.setup else ()
+        started = time.perf_counter()
+        workload.run(*args)
+        times.append(time.perf_counter() - started)
+
+    args = (workload.setup(),) if workload.setup else ()
+    tracemalloc.start()
+    try:
+        workload.run(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    best = min(times)
+    return {
+        'items': workload.items,
+        'bestMs': round(best * 1000, 3),
+        'meanMs': round(sum(times) / len(times) * 1000, 3),
+        'throughput': round(workload.items / best, 1) if best > 0 else None,
+        'peakMiB': round(peak / (1 << 20), 3),
+    }
+
+
+def run_suite(data: dict | None, scales: list[int], case_names: list[str] | None = None, repeat: int = 3) -> dict:
+    """
+    data が None なら各スケールの合成データセットを生成する
+
+    Returns:
+        {"x1": {case: result}, "x10": {...}, ...}（合成データセットは "synthetic-x1" ...）
+    """
+    names = case_names or list(CASES)
+    unknown = [n for n in names if n not in CASES]
+    if unknown:
+        raise KeyError(f"Unknown case(s): {', '.join(unknown)}")
+
+    results = {}
+    for scale in scales:
+        if data is None:
+            from synthetic_dataset import generate
+            label, dataset = f"synthetic-x{scale}", generate(scale)
+        else:
+            label, dataset = f"x{scale}", scale_dataset(data, scale)
+        # json.load は拡大したデータセットもファイルから読む
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = Path(tmp) / 'dataset.json'
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(dataset, f, ensure_ascii=False, indent=2)
+
+            print(f"📏 {label}: {len(dataset['pokemon'])}匹 / {len(dataset.get('moves', []))}技")
+            results[label] = {}
+            for name in names:
+                fn, unit = CASES[name]
+                result = measure(fn(dataset, json_path), repeat)
+                result['unit'] = unit
+                results[label][name] = result
+                print(f"  {name:<32} {result['bestMs']:>10.2f} ms  "
+                      f"{result['throughput'] or 0:>12,.0f} {unit}/s  {result['peakMiB']:>8.2f} MiB")
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[dict]:
+    """基準値より (1 + tolerance) 倍以上遅い・メモリを使うケース"""
+    regressions = []
+    for label, cases in results.items():
+        for name, result in cases.items():
+            base = baseline.get(label, {}).get(name)
+            if not base:
+                continue
+            for metric in ('bestMs', 'peakMiB'):
+                if base[metric] and result[metric] > base[metric] * (1 + tolerance):
+                    regressions.append({
+                        'scale': label, 'case': name, 'metric': metric,
+                        'baseline': base[metric], 'current': result[metric],
+                        'ratio': round(result[metric] / base[metric], 2),
+                    })
+    return regressions
+
+
+def _pop_option(args: list[str], name: str) -> str | None:
+    if name not in args:
+        return None
+    i = args.index(name)
+    value = args[i + 1]
+    del args[i:i + 2]
+    return value
+
+
+def _pop_flag(args: list[str], name: str) -> bool:
+    if name not in args:
+        return False
+    args.remove(name)
+    return True
+
+
+def main():
+    args = sys.argv[1:]
+    json_path = Path(_pop_option(args, '--dataset') or DEFAULT_DATASET_PATH)
+    scales = [int(s) for s in (_pop_option(args, '--scales') or '1,10').split(',')]
+    case_names = _pop_option(args, '--cases')
+    repeat = int(_pop_option(args, '--repeat') or 3)
+    tolerance = float(_pop_option(args, '--tolerance') or 0.25)
+    report_path = _pop_option(args, '--json')
+    record = _pop_flag(args, '--record')
+    check = _pop_flag(args, '--check')
+    synthetic = _pop_flag(args, '--synthetic')
+
+    _register_check_cases()
+    data = None
+    if not synthetic:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+    print(f"⏱️  Benchmark: {'synthetic_dataset' if synthetic else json_path.name}（{repeat}回の最速）")
+    results = run_suite(data, scales, case_names.split(',') if case_names else None, repeat)
+
+    exit_code = 0
+    baseline = {}
+    if DEFAULT_BASELINE_PATH.exists():
+        with open(DEFAULT_BASELINE_PATH, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    if check:
+        if not baseline:
+            print(f"⚠️  基準値がありません（--record で {DEFAULT_BASELINE_PATH.name} を作成）")
+        regressions = compare(results, baseline, tolerance)
+        for r in regressions:
+            print(f"  ❌ {r['scale']} {r['case']}: {r['metric']} {r['baseline']} → {r['current']} (×{r['ratio']})")
+        if baseline and not regressions:
+            print(f"✅ 基準値から {tolerance:.0%} 以上悪化したケースはありません")
+        exit_code = 1 if regressions else 0
+
+    if record:
+        for label, cases in results.items():
+            baseline.setdefault(label, {}).update(cases)
+        with open(DEFAULT_BASELINE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2)
+        print(f"📝 Baseline: {DEFAULT_BASELINE_PATH}")
+
+    if report_path:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"📝 Report: {report_path}")
+    return exit_code
+
+
+if __name__ == '__main__':
+    install_hooks()
+    sys.exit(main())
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Category bitmap indexes
+技カテゴリー → 技 / 技 → ポケモン / 技カテゴリー → ポケモン のビットマップ索引
+
+ビット i が ID i を表す整数をビットマップとして使う。
+「先制技を覚えるポケモン」「設置技と交代技の両方を覚えるポケモン」のような問い合わせが
+全ポケモン・全技の走査ではなくビット演算（AND / OR）で済む。
+
+書き出し時は連続するIDを [開始ID, 個数] の連長で圧縮する。
+
+使い方:
+  python category_bitmaps.py [json_path] [--query priority hazard+switch ...] [--export [output_path]]
+  （--query の + は AND。--export はアプリ用に category_bitmaps.json を書き出す）
+"""
+
+import json
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from move_categories import CATEGORY_BITS, detect_move_categories_batch
+from tool_runner import install_hooks
+
+PRELOADED_DATA_DIR = Path(__file__).parent.parent / 'Pokedex' / 'Pokedex' / 'Resources' / 'PreloadedData'
+DEFAULT_DATASET_PATH = PRELOADED_DATA_DIR / 'scarlet_violet.json'
+DEFAULT_EXPORT_PATH = PRELOADED_DATA_DIR / 'category_bitmaps.json'
+
+_NONZERO_BYTE = re.compile(rb'[^\x00]')
+
+
+def bitmap_of(ids) -> int:
+    """
+    ID の集まり → ビットマップ
+
+    1つずつ |= すると最大IDの幅の整数を毎回作り直す（O(件数 × 幅)）ので、
+    bytearray にビットを立ててから1回で整数にする。
+    """
+    ids = list(ids)
+    if not ids:
+        return 0
+    buffer = bytearray(max(ids) // 8 + 1)
+    for i in ids:
+        buffer[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buffer, 'little')
+
+
+def iter_ids(bitmap: int):
+    """ビットマップに含まれるIDを昇順に返す（0 でないバイトだけを見る）"""
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, 'little')
+    for match in _NONZERO_BYTE.finditer(data):
+        index = match.start()
+        byte = data[index]
+        while byte:
+            low = byte & -byte
+            yield index * 8 + low.bit_length() - 1
+            byte ^= low
+
+
+def encode_runs(bitmap: int) -> list[list[int]]:
+    """ビットマップ → [[開始ID, 個数], ...]"""
+    runs = []
+    for i in iter_ids(bitmap):
+        if runs and runs[-1][0] + runs[-1][1] == i:
+            runs[-1][1] += 1
+        else:
+            runs.append([i, 1])
+    return runs
+
+
+def decode_runs(runs: list[list[int]]) -> int:
+    return bitmap_of(i for start, length in runs for i in range(start, start + length))
+
+
+class CategoryBitmapIndex:
+    """データセット1つ分のカテゴリー索引"""
+
+    def __init__(self, category_moves: dict[str, int], move_pokemon: dict[int, int]):
+        self.category_moves = category_moves
+        self.move_pokemon = move_pokemon
+        self.category_pokemon = {
+            category: self.pokemon_learning(moves)
+            for category, moves in category_moves.items()
+        }
+
+    @classmethod
+    def build(cls, data: dict) -> 'CategoryBitmapIndex':
+        """技のカテゴリーは move_categories.detect_move_categories で判定し直す"""
+        moves = data.get('moves', [])
+        category_lists, _ = detect_move_categories_batch(moves)
+
+        # IDを集めてから、キーごとに1回だけビットマップを作る
+        category_move_ids = defaultdict(list)
+        for move, categories in zip(moves, category_lists):
+            for category in categories:
+                category_move_ids[category].append(move['id'])
+
+        move_pokemon_ids = defaultdict(list)
+        for pokemon in data['pokemon']:
+            for move in pokemon.get('moves', []):
+                move_pokemon_ids[move['moveId']].append(pokemon['id'])
+
+        return cls(
+            {category: bitmap_of(ids) for category, ids in category_move_ids.items()},
+            {move_id: bitmap_of(ids) for move_id, ids in move_pokemon_ids.items()},
+        )
+
+    def pokemon_learning(self, moves_bitmap: int) -> int:
+        """技のビットマップのいずれかを覚えるポケモン"""
+        pokemon = 0
+        for move_id in iter_ids(moves_bitmap):
+            pokemon |= self.move_pokemon.get(move_id, 0)
+        return pokemon
+
+    def moves_in(self, *categories: str) -> int:
+        """全てのカテゴリーに属する技"""
+        return self._intersect(self.category_moves, categories)
+
+    def pokemon_with(self, *categories: str) -> int:
+        """各カテゴリーの技をそれぞれ1つ以上覚えるポケモン"""
+        return self._intersect(self.category_pokemon, categories)
+
+    def pokemon_with_any(self, *categories: str) -> int:
+        result = 0
+        for category in categories:
+            result |= self.category_pokemon.get(category, 0)
+        return result
+
+    @staticmethod
+    def _intersect(bitmaps: dict, categories) -> int:
+        for category in categories:
+            if category not in CATEGORY_BITS:
+                raise KeyError(f"Unknown move category: {category}")
+        if not categories:
+            return 0
+        result = bitmaps.get(categories[0], 0)
+        for category in categories[1:]:
+            result &= bitmaps.get(category, 0)
+        return result
+
+    def export(self) -> dict:
+        return {
+            'encoding': 'runs',
+            'categoryMoves': {c: encode_runs(b) for c, b in sorted(self.category_moves.items(), key=lambda i: CATEGORY_BITS[i[0]])},
+            'movePokemon': {str(m): encode_runs(b) for m, b in sorted(self.move_pokemon.items())},
+            'categoryPokemon': {c: encode_runs(b) for c, b in sorted(self.category_pokemon.items(), key=lambda i: CATEGORY_BITS[i[0]])},
+        }
+
+    @classmethod
+    def load(cls, exported: dict) -> 'CategoryBitmapIndex':
+        return cls(
+            {c: decode_runs(runs) for c, runs in exported['categoryMoves'].items()},
+            {int(m): decode_runs(runs) for m, runs in exported['movePokemon'].items()},
+        )
+
+
+def main():
+    args = sys.argv[1:]
+    export_path = None
+    if '--export' in args:
+        i = args.index('--export')
+        has_value = i + 1 < len(args) and not args[i + 1].startswith('--')
+        export_path = Path(args[i + 1]) if has_value else DEFAULT_EXPORT_PATH
+        del args[i:i + (2 if has_value else 1)]
+
+    queries = []
+    if '--query' in args:
+        i = args.index('--query')
+        j = i + 1
+        while j < len(args) and not args[j].startswith('--'):
+            j += 1
+        queries = args[i + 1:j]
+        del args[i:j]
+    unknown = sorted({c for query in queries for c in query.split('+')} - CATEGORY_BITS.keys())
+    if unknown:
+        print(f"❌ 不明なカテゴリー: {', '.join(unknown)}")
+        print(f"   使えるカテゴリー: {', '.join(CATEGORY_BITS)}")
+        return 1
+
+    json_path = Path(args[0]) if args else DEFAULT_DATASET_PATH
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    index = CategoryBitmapIndex.build(data)
+    names = {p['id']: p.get('nameJa') or p['name'] for p in data['pokemon']}
+
+    print(f"📋 {len(index.category_moves)}カテゴリー / {len(index.move_pokemon)}技")
+    for query in queries:
+        categories = query.split('+')
+        pokemon_ids = list(iter_ids(index.pokemon_with(*categories)))
+        print(f"\n🔍 {' AND '.join(categories)}: {len(pokemon_ids)}匹")
+        print(f"  {', '.join(names.get(i, str(i)) for i in pokemon_ids[:20])}{' ...' if len(pokemon_ids) > 20 else ''}")
+
+    if export_path:
+        with open(export_path, 'w', encoding='utf-8') as f:
+            json.dump(index.export(), f, ensure_ascii=False, separators=(',', ':'))
+        print(f"📝 Exported: {export_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    install_hooks()
+    sys.exit(main())
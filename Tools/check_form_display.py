@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 import json
 
+from tool_runner import install_hooks
+
+install_hooks()
+
 with open('../Pokedex/Pokedex/Resources/PreloadedData/scarlet_violet.json', 'r') as f:
     data = json.load(f)
 
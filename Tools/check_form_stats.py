@@ -5,6 +5,10 @@
 import requests
 import time
 
+from tool_runner import install_hooks
+
+install_hooks()
+
 # チェック対象
 forms_to_check = [
     ('shellos', ['shellos', 'shellos-east', 'shellos-west']),
@@ -52,6 +52,10 @@ print("="*60)
 import requests
 import time
 
+from tool_runner import install_hooks
+
+install_hooks()
+
 # カバルドンで確認
 print("\n【カバルドン (hippowdon) の確認】")
 try:
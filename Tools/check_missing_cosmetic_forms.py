@@ -4,10 +4,17 @@
 """
 import json
 
+from form_index import FormFamilyIndex
+from tool_runner import install_hooks
+
+install_hooks()
+
 with open('Pokedex/Pokedex/Resources/PreloadedData/scarlet_violet.json', 'r') as f:
     data = json.load(f)
 
-all_names = [p['name'] for p in data['pokemon']]
+# 名前・プレフィックスの索引（存在確認は辞書引き）
+index = FormFamilyIndex(data['pokemon'])
+all_names = index.by_name
 
 print("📋 コスメティックフォームの確認\n")
 
@@ -18,7 +25,7 @@ floette_forms = ['floette', 'floette-red', 'floette-yellow', 'floette-orange', '
 florges_forms = ['florges', 'florges-red', 'florges-yellow', 'florges-orange', 'florges-blue', 'florges-white']
 
 for base_name, forms in [('flabebe', flabebe_forms), ('floette', floette_forms), ('florges', florges_forms)]:
-    base_exists = any(base_name in name for name in all_names)
+    base_exists = bool(index.names_with_prefix(base_name))
     if base_exists:
         print(f"  {base_name}: 登場")
         for form in forms:
@@ -31,7 +38,7 @@ pumpkaboo_forms = ['pumpkaboo', 'pumpkaboo-small', 'pumpkaboo-large', 'pumpkaboo
 gourgeist_forms = ['gourgeist', 'gourgeist-small', 'gourgeist-large', 'gourgeist-super']
 
 for base_name, forms in [('pumpkaboo', pumpkaboo_forms), ('gourgeist', gourgeist_forms)]:
-    base_exists = any(base_name in name for name in all_names)
+    base_exists = bool(index.names_with_prefix(base_name))
     if base_exists:
         print(f"  {base_name}: 登場")
         for form in forms:
@@ -40,7 +47,7 @@ for base_name, forms in [('pumpkaboo', pumpkaboo_forms), ('gourgeist', gourgeist
 
 # トリミアン（9カット）
 print("\n【トリミアン（9カット）】")
-furfrou_base = any('furfrou' in name for name in all_names)
+furfrou_base = bool(index.names_with_prefix('furfrou'))
 if furfrou_base:
     print("  furfrou: 登場")
     furfrou_forms = [
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Move category parity check
+索引化した detect_move_categories が従来の実装（リスト線形探索 + 部分文字列判定）と同じ結果を返すか確認
+
+データセットの全技に加えて、定義済みの全技名と効果文キーワードの組み合わせを検証する。
+
+使い方:
+  python check_move_categories_parity.py [json_path]
+"""
+
+import itertools
+import json
+import sys
+from pathlib import Path
+
+from move_categories import EFFECT_KEYWORDS, MOVE_CATEGORY_DEFINITIONS, detect_move_categories
+from tool_runner import install_hooks
+
+DEFAULT_DATASET_PATH = Path(__file__).parent.parent / 'Pokedex' / 'Pokedex' / 'Resources' / 'PreloadedData' / 'scarlet_violet.json'
+
+
+def legacy_detect_move_categories(move_data: dict) -> list[str]:
+    """索引化する前の実装（比較用にそのまま残す）"""
+    categories = []
+
+    move_name = move_data.get("name", "")
+    effect = move_data.get("effect", "")
+    effect_lower = effect.lower()
+
+    meta = move_data.get("meta") or {}
+    priority = move_data.get("priority", 0)
+    accuracy = move_data.get("accuracy")
+    power = move_data.get("power")
+    damage_class = move_data.get("damageClass", "")
+
+    for category, move_list in MOVE_CATEGORY_DEFINITIONS.items():
+        if move_name in move_list:
+            categories.append(category)
+
+    ailment = (meta.get("ailment") or {}).get("name") if isinstance(meta.get("ailment"), dict) else meta.get("ailment", "")
+    if ailment and ailment != "none":
+        if ailment == "poison":
+            categories.append("poison")
+        elif ailment == "paralysis":
+            categories.append("paralyze")
+        elif ailment == "burn":
+            categories.append("burn")
+        elif ailment == "freeze":
+            categories.append("freeze")
+        elif ailment == "sleep":
+            categories.append("sleep")
+        elif ailment == "confusion":
+            categories.append("confusion")
+
+    if meta.get("flinchChance", 0) > 0 or meta.get("flinch_chance", 0) > 0:
+        categories.append("flinch")
+
+    if priority > 0:
+        categories.append("priority")
+    elif priority < 0:
+        categories.append("delayed")
+
+    max_hits = meta.get("maxHits") or meta.get("max_hits")
+    min_hits = meta.get("minHits") or meta.get("min_hits")
+    if max_hits and max_hits > 1:
+        categories.append("multi-hit")
+    elif min_hits and min_hits > 1:
+        categories.append("multi-hit")
+
+    crit_rate = meta.get("critRate", 0) or meta.get("crit_rate", 0)
+    if crit_rate > 0:
+        categories.append("high-crit")
+
+    if accuracy is None and damage_class != "status":
+        categories.append("never-miss")
+
+    meta_category = (meta.get("category") or {}).get("name") if isinstance(meta.get("category"), dict) else meta.get("category", "")
+    if "trap" in meta_category.lower():
+        categories.append("bind")
+
+    if damage_class not in ["status", ""] and power is None:
+        if "level" in effect_lower or "fixed" in effect_lower or "equal to" in effect_lower:
+            categories.append("fixed-damage")
+
+    drain = meta.get("drain", 0)
+    if drain < 0:
+        categories.append("recoil")
+    if drain > 0:
+        categories.append("drain")
+
+    healing = meta.get("healing", 0)
+    if healing > 0:
+        categories.append("healing")
+
+    stat_changes = meta.get("statChanges") or meta.get("stat_changes") or []
+    if stat_changes:
+        categories.append("stat-change")
+        if any(s.get("change", 0) > 0 for s in stat_changes):
+            categories.append("setup")
+
+    if "contact" in effect_lower or "makes contact" in effect_lower:
+        categories.append("contact")
+
+    if "changes" in effect_lower and "type" in effect_lower:
+        categories.append("type-change")
+
+    if "ability" in effect_lower and ("changes" in effect_lower or "replaces" in effect_lower):
+        categories.append("ability-change")
+
+    if "power" in effect_lower and ("increases" in effect_lower or "doubles" in effect_lower):
+        categories.append("power-boost")
+
+    if "sound" in effect_lower and "sound" not in categories:
+        categories.append("sound")
+
+    if "powder" in effect_lower and "powder" not in categories:
+        categories.append("powder")
+
+    return categories
+
+
+def synthetic_moves():
+    """定義済みの全技名 × 効果文キーワードの組み合わせ × メタデータのパターン"""
+    names = sorted({name for move_list in MOVE_CATEGORY_DEFINITIONS.values() for name in move_list}) + ['tackle', '']
+    effects = [''] + [k.title() for k in EFFECT_KEYWORDS] + [
+        f"{a} the {b}." for a, b in itertools.combinations(EFFECT_KEYWORDS, 2)
+    ] + ["Power doubles; makes contact.", "Inflicts damage equal to the user's level.", "Soundproof powders"]
+    metas = [
+        {},
+        {"ailment": "burn", "flinchChance": 30, "critRate": 1, "category": "damage+ailment"},
+        {"ailment": {"name": "paralysis"}, "category": {"name": "ailment"}, "drain": -33},
+        {"ailment": "none", "maxHits": 5, "minHits": 2, "drain": 50, "healing": 25, "category": "whole-field-effect"},
+        {"ailment": "confusion", "min_hits": 2, "crit_rate": 1, "flinch_chance": 10, "category": "damage+trap"},
+        {"statChanges": [{"stat": "attack", "change": 2}], "category": "net-good-stats"},
+        {"stat_changes": [{"stat": "defense", "change": -1}], "category": "damage+lower"},
+    ]
+    shapes = [
+        {"priority": 0, "accuracy": 100, "power": 80, "damageClass": "physical"},
+        {"priority": 1, "accuracy": None, "power": None, "damageClass": "special"},
+        {"priority": -6, "accuracy": None, "power": None, "damageClass": "status"},
+        {"priority": 0, "accuracy": 90, "power": None, "damageClass": ""},
+    ]
+    for i, (name, effect) in enumerate(itertools.product(names, effects)):
+        yield {"name": name, "effect": effect, "meta": metas[i % len(metas)], **shapes[i % len(shapes)]}
+
+
+def main():
+    json_path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DATASET_PATH
+    cases = []
+    if json_path.exists():
+        with open(json_path, 'r', encoding='utf-8') as f:
+            cases.extend(json.load(f).get('moves', []))
+        print(f"📖 {json_path.name}: {len(cases)}技")
+    else:
+        print(f"⚠️  {json_path} が見つからないため、合成データのみで検証します")
+    cases.extend(synthetic_moves())
+
+    mismatches = []
+    for move_data in cases:
+        expected = legacy_detect_move_categories(move_data)
+        actual = detect_move_categories(move_data)
+        if actual != expected:
+            mismatches.append((move_data, expected, actual))
+
+    if mismatches:
+        print(f"❌ {len(mismatches)}/{len(cases)}件で結果が異なります")
+        for move_data, expected, actual in mismatches[:20]:
+            print(f"  {move_data.get('name')!r} {move_data.get('effect')!r}")
+            print(f"    従来: {expected}")
+            print(f"    現在: {actual}")
+        return 1
+
+    print(f"✅ 全{len(cases)}件で従来の実装と一致")
+    return 0
+
+
+if __name__ == '__main__':
+    install_hooks()
+    sys.exit(main())
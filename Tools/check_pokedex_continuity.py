@@ -6,51 +6,41 @@
 import json
 import sys
 
-def check_continuity(pokedex_name):
+from pokedex_analyzer import DEFAULT_DATASET_PATH, PokedexAnalyzer
+from tool_runner import install_hooks
+
+def check_continuity(pokedex_name, json_path=DEFAULT_DATASET_PATH):
     """指定された図鑑の連続性をチェック"""
-    with open('/Users/yusuke/Development/Pokedex-SwiftUI/Pokedex/Pokedex/Resources/PreloadedData/scarlet_violet.json', 'r', encoding='utf-8') as f:
+    with open(json_path, 'r', encoding='utf-8') as f:
         data = json.load(f)
 
-    # 図鑑のポケモンを図鑑番号順に取得
-    pokedex_pokemon = []
+    # 全図鑑の番号を1回の走査で集計
+    analyzer = PokedexAnalyzer(data.get('pokedexes'))
+    name_ja = {}
     for pokemon in data['pokemon']:
-        pokedex_numbers = pokemon.get('pokedexNumbers', {})
-        if pokedex_name in pokedex_numbers:
-            pokedex_pokemon.append({
-                'name': pokemon['name'],
-                'nameJa': pokemon.get('nameJa', ''),
-                'number': pokedex_numbers[pokedex_name]
-            })
-
-    # 図鑑番号でソート
-    pokedex_pokemon.sort(key=lambda x: x['number'])
-
-    # 連続性チェック
-    print(f'{pokedex_name}図鑑: {len(pokedex_pokemon)}匹')
-    print()
+        analyzer.add(pokemon)
+        name_ja[pokemon['name']] = pokemon.get('nameJa', '')
+    result = analyzer.analyze(pokedex_name)
 
-    # 途切れている箇所を検出
-    gaps = []
-    prev_num = 0
-    for entry in pokedex_pokemon:
-        num = entry['number']
-        if prev_num > 0 and num != prev_num + 1:
-            gaps.append((prev_num, num))
-        prev_num = num
+    print(f'{pokedex_name}図鑑: {result["entries"]}匹')
+    print()
 
-    if gaps:
+    if result['gapRuns']:
         print('⚠️  図鑑番号が途切れている箇所:')
-        for start, end in gaps:
-            missing_range = list(range(start + 1, end))
-            print(f'  #{start} → #{end}: 欠番 {missing_range}')
+        for start, length in result['gapRuns']:
+            print(f'  #{start - 1} → #{start + length}: 欠番 {list(range(start, start + length))}')
     else:
         print('✅ 図鑑番号は連続しています')
 
     print()
-    print(f'最小番号: #{pokedex_pokemon[0]["number"]} ({pokedex_pokemon[0]["name"]} / {pokedex_pokemon[0]["nameJa"]})')
-    print(f'最大番号: #{pokedex_pokemon[-1]["number"]} ({pokedex_pokemon[-1]["name"]} / {pokedex_pokemon[-1]["nameJa"]})')
+    if not result['entries']:
+        return
+    for label, number in (('最小番号', result['min']), ('最大番号', result['max'])):
+        name = analyzer.names_of(pokedex_name, number)[0]
+        print(f'{label}: #{number} ({name} / {name_ja[name]})')
 
 if __name__ == '__main__':
+    install_hooks()
     if len(sys.argv) > 1:
         check_continuity(sys.argv[1])
     else:
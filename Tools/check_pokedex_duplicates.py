@@ -5,46 +5,44 @@
 
 import json
 import sys
-from collections import defaultdict
+
+from pokedex_analyzer import DEFAULT_DATASET_PATH, PokedexAnalyzer
+from tool_runner import install_hooks
 
 def check_duplicates(pokedex_name):
     """指定された図鑑の重複をチェック"""
-    with open('/Users/yusuke/Development/Pokedex-SwiftUI/Pokedex/Pokedex/Resources/PreloadedData/scarlet_violet.json', 'r', encoding='utf-8') as f:
+    with open(DEFAULT_DATASET_PATH, 'r', encoding='utf-8') as f:
         data = json.load(f)
 
-    # 図鑑番号ごとにポケモンをグループ化
-    number_to_pokemon = defaultdict(list)
+    # 全図鑑の番号を1回の走査で集計（重複はビットセットで検出）
+    analyzer = PokedexAnalyzer(data.get('pokedexes'))
+    name_ja = {}
     for pokemon in data['pokemon']:
-        pokedex_numbers = pokemon.get('pokedexNumbers', {})
-        if pokedex_name in pokedex_numbers:
-            number = pokedex_numbers[pokedex_name]
-            number_to_pokemon[number].append({
-                'name': pokemon['name'],
-                'nameJa': pokemon.get('nameJa', '')
-            })
-
-    # 重複をチェック
+        analyzer.add(pokemon)
+        name_ja[pokemon['name']] = pokemon.get('nameJa', '')
+    result = analyzer.analyze(pokedex_name)
+
     print(f'{pokedex_name}図鑑の重複チェック:')
     print()
 
-    duplicates = {num: pokemons for num, pokemons in number_to_pokemon.items() if len(pokemons) > 1}
+    duplicates = result['duplicates']
 
     if duplicates:
         print(f'⚠️  重複している図鑑番号: {len(duplicates)}箇所')
         print()
-        for num in sorted(duplicates.keys()):
-            pokemons = duplicates[num]
-            print(f'#{num}: {len(pokemons)}匹')
-            for p in pokemons:
-                print(f'  - {p["name"]} ({p["nameJa"]})')
+        for num, names in duplicates.items():
+            print(f'#{num}: {len(names)}匹')
+            for name in names:
+                print(f'  - {name} ({name_ja[name]})')
             print()
     else:
         print('✅ 重複はありません')
 
-    print(f'総ポケモン数: {sum(len(v) for v in number_to_pokemon.values())}匹')
-    print(f'図鑑番号の範囲: #{min(number_to_pokemon.keys())} - #{max(number_to_pokemon.keys())}')
+    print(f'総ポケモン数: {result["entries"]}匹')
+    print(f'図鑑番号の範囲: #{result["min"]} - #{result["max"]}')
 
 if __name__ == '__main__':
+    install_hooks()
     if len(sys.argv) > 1:
         check_duplicates(sys.argv[1])
     else:
@@ -1,5 +1,9 @@
 import json
 
+from tool_runner import install_hooks
+
+install_hooks()
+
 with open('/Users/yusuke/Development/Pokedex-SwiftUI/Pokedex/Pokedex/Resources/PreloadedData/scarlet_violet.json', 'r') as f:
     data = json.load(f)
 
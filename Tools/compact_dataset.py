@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+Low-memory dataset loader
+省メモリのデータセット読み込み（キーと繰り返し出てくる値を intern し、レコードを __slots__ にする）
+
+json.load はポケモン・技・覚える技・種族値ごとに新しい dict と新しいキー文字列を作る（数十万個）。
+load_compact() は同じ JSON を次の形で読み込む:
+  - ポケモン・技・覚える技・種族値・進化情報・技のメタ情報・スプライト: __slots__ のレコード
+  - それ以外のオブジェクト: キーを intern した dict
+  - 短い文字列（タイプ名・覚え方・技マシン番号など）: intern
+  - スプライトURL: 共通部分（ホスト・ディレクトリ）を intern して、ファイル名との組で持つ
+
+レコードは dict と同じ読み方ができる（record['name'], record.get(...), in, keys/items, 代入・削除）。
+copy.deepcopy・pickle しても欠けているフィールドは欠けたまま（_MISSING はモジュールの1つのオブジェクトに戻る）。
+json.dump するときは default=to_plain を渡すか、dump_compact() を使う。
+
+使い方:
+  python compact_dataset.py [json_path]   # json.load と load_compact のピークRSSを比べる
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from tool_runner import install_hooks, phase
+
+DEFAULT_DATASET_PATH = Path(__file__).parent.parent / 'Pokedex' / 'Pokedex' / 'Resources' / 'PreloadedData' / 'scarlet_violet.json'
+
+# ファイルを読み進める単位（文字数）
+CHUNK_SIZE = 1 << 20
+
+# これより短い文字列は intern する（効果文などの長い文は重複が少ないのでそのまま）
+INTERN_MAX_LENGTH = 32
+
+class _Missing:
+    """レコードの欠けているフィールドの印（コピー・pickle しても同じオブジェクトになる）"""
+    __slots__ = ()
+
+    def __reduce__(self):
+        return '_MISSING'
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return '<missing>'
+
+
+_MISSING = _Missing()
+
+
+class Record:
+    """__slots__ のレコード（dict と同じ読み方ができる）。FIELDS に無いキーは _extra に入れる"""
+    __slots__ = ('_extra',)
+    FIELDS: tuple[str, ...] = ()
+
+    def __init__(self, pairs):
+        for field in self.FIELDS:
+            object.__setattr__(self, field, _MISSING)
+        self._extra = None
+        for key, value in pairs:
+            self[key] = value
+
+    def __getitem__(self, key):
+        if key in self.FIELDS:
+            value = getattr(self, key)
+            if value is not _MISSING:
+                return value
+        elif self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in self.FIELDS:
+            object.__setattr__(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[sys.intern(key)] = value
+
+    def __delitem__(self, key):
+        if key in self.FIELDS and getattr(self, key) is not _MISSING:
+            object.__setattr__(self, key, _MISSING)
+        elif self._extra and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            self[key] = default
+            return default
+
+    def keys(self) -> list[str]:
+        keys = [f for f in self.FIELDS if getattr(self, f) is not _MISSING]
+        return keys + list(self._extra or ())
+
+    def values(self) -> list:
+        return [self[k] for k in self.keys()]
+
+    def items(self) -> list[tuple]:
+        return [(k, self[k]) for k in self.keys()]
+
+    def __contains__(self, key) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def __eq__(self, other):
+        if isinstance(other, (Record, dict)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def copy(self) -> dict:
+        """dict.copy() と同じく浅いコピー（dict で返す）"""
+        return dict(self.items())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+
+class Pokemon(Record):
+    FIELDS = (
+        'id', 'nationalDexNumber', 'name', 'nameJa', 'genus', 'genusJa', 'sprites', 'types',
+        'abilities', 'baseStats', 'moves', 'eggGroups', 'genderRate', 'height', 'weight',
+        'evolutionChain', 'varieties', 'pokedexNumbers', 'category',
+    )
+    __slots__ = FIELDS
+
+
+class Move(Record):
+    FIELDS = (
+        'id', 'name', 'nameJa', 'type', 'damageClass', 'power', 'accuracy', 'pp', 'priority',
+        'effectChance', 'effect', 'effectJa', 'categories', 'meta',
+    )
+    __slots__ = FIELDS
+
+
+class MoveMeta(Record):
+    FIELDS = (
+        'ailment', 'ailmentChance', 'category', 'critRate', 'drain', 'flinchChance',
+        'healing', 'statChance', 'statChanges',
+    )
+    __slots__ = FIELDS
+
+
+class LearnedMove(Record):
+    FIELDS = ('moveId', 'learnMethod', 'level', 'machineNumber', 'isFromPreEvolution')
+    __slots__ = FIELDS
+
+
+class BaseStats(Record):
+    FIELDS = ('hp', 'attack', 'defense', 'spAttack', 'spDefense', 'speed', 'total')
+    __slots__ = FIELDS
+
+
+class EvolutionInfo(Record):
+    FIELDS = ('chainId', 'evolutionStage', 'evolvesFrom', 'evolvesTo', 'canUseEviolite')
+    __slots__ = FIELDS
+
+
+class Sprites(Record):
+    """スプライトURL（共通の先頭部分を intern して、残りだけを持つ）"""
+    FIELDS = ('normal', 'shiny')
+    __slots__ = ('_base', '_normal', '_shiny')
+
+    def __init__(self, pairs):
+        self._extra = None
+        urls = dict(pairs)
+        present = [u for u in (urls.get('normal'), urls.get('shiny')) if isinstance(u, str)]
+        base = os.path.commonprefix(present) if present else ''
+        self._base = sys.intern(base[:base.rfind('/') + 1])
+        self._normal = self._split(urls.pop('normal', _MISSING))
+        self._shiny = self._split(urls.pop('shiny', _MISSING))
+        for key, value in urls.items():
+            self[key] = value
+
+    def _split(self, url):
+        if isinstance(url, str) and url.startswith(self._base):
+            return url[len(self._base):]
+        return url if url is _MISSING else (url,)  # 先頭部分が違う値はタプルで包んでそのまま持つ
+
+    def _join(self, stored):
+        if stored is _MISSING or isinstance(stored, tuple):
+            return stored if stored is _MISSING else stored[0]
+        return self._base + stored
+
+    def __getattr__(self, name):
+        # Record の getattr(self, field) を _normal / _shiny に振り替える
+        if name in self.FIELDS:
+            return self._join(object.__getattribute__(self, f"_{name}"))
+        raise AttributeError(name)
+
+    def __setitem__(self, key, value):
+        if key in self.FIELDS:
+            object.__setattr__(self, f"_{key}", (value,))
+        else:
+            super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        if key in self.FIELDS and getattr(self, key) is not _MISSING:
+            object.__setattr__(self, f"_{key}", _MISSING)
+        else:
+            super().__delitem__(key)
+
+
+def _record_class(keys):
+    """キーの組み合わせからレコードの種類を決める（当てはまらなければ None = dict）"""
+    if 'moveId' in keys and 'learnMethod' in keys:
+        return LearnedMove
+    if 'evolutionChain' in keys and 'sprites' in keys:
+        return Pokemon
+    if 'damageClass' in keys and 'pp' in keys:
+        return Move
+    if 'ailment' in keys and 'critRate' in keys:
+        return MoveMeta
+    if 'chainId' in keys and 'evolutionStage' in keys:
+        return EvolutionInfo
+    if 'hp' in keys and 'speed' in keys:
+        return BaseStats
+    if keys and keys <= {'normal', 'shiny'}:
+        return Sprites
+    return None
+
+
+def _intern_value(value):
+    if isinstance(value, str) and len(value) <= INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    if isinstance(value, list) and value and isinstance(value[0], str):
+        return [sys.intern(v) if isinstance(v, str) and len(v) <= INTERN_MAX_LENGTH else v for v in value]
+    return value
+
+
+def _object_hook(pairs):
+    pairs = [(sys.intern(key), _intern_value(value)) for key, value in pairs]
+    record_class = _record_class({key for key, _ in pairs})
+    return record_class(pairs) if record_class else dict(pairs)
+
+
+NUMBER_CHARS = frozenset('0123456789.eE+-')
+
+
+class _StreamReader:
+    """ファイルを少しずつ読みながら JSON の値を1つずつ取り出す（ファイル全体の文字列を作らない）"""
+
+    def __init__(self, f, decoder: json.JSONDecoder):
+        self.f = f
+        self.decoder = decoder
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        chunk = self.f.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+
+    def next_char(self) -> str:
+        """空白を飛ばして次の1文字を読む（ファイルの終わりなら空文字）"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\n\r':
+                self.pos += 1
+            if self.pos < len(self.buffer) or self.eof:
+                break
+            self._fill()
+        char = self.buffer[self.pos:self.pos + 1]
+        self.pos += len(char)
+        return char
+
+    def expect(self, expected: str) -> None:
+        char = self.next_char()
+        if char != expected:
+            raise json.JSONDecodeError(f"Expecting '{expected}'", self.buffer, self.pos - len(char))
+
+    def value(self):
+        char = self.next_char()
+        self.pos -= len(char)  # 空白だけ飛ばす
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # バッファの途中で切れた数値（"-1.5e3" の "-1." など）は続きを読んでからやり直す
+                if self.eof or (end < len(self.buffer) and self.buffer[end] not in NUMBER_CHARS):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+    def array(self):
+        """配列の要素を1つずつ返す（要素ごとにデコードするので、途中の文字列はすぐ捨てられる）"""
+        self.expect('[')
+        if self.next_char() == ']':
+            return
+        self.pos -= 1
+        while True:
+            yield self.value()
+            char = self.next_char()
+            if char == ']':
+                return
+            if char != ',':
+                raise json.JSONDecodeError("Expecting ',' or ']'", self.buffer, self.pos - len(char))
+
+
+def load_compact(path) -> dict:
+    """json.load の代わりに使う省メモリの読み込み（トップレベルは dict のまま）
+
+    トップレベルの配列（pokemon / moves / abilities / pokedexes）は要素ごとに読み進めるので、
+    ファイル全体の文字列とデコード結果が同時にメモリに載ることはない。
+    """
+    decoder = json.JSONDecoder(object_pairs_hook=_object_hook)
+    data = {}
+    with phase('load'), open(path, 'r', encoding='utf-8') as f:
+        reader = _StreamReader(f, decoder)
+        reader.expect('{')
+        char = reader.next_char()
+        while char != '}':
+            reader.pos -= len(char)
+            key = sys.intern(reader.value())
+            reader.expect(':')
+            if reader.next_char() == '[':
+                reader.pos -= 1
+                data[key] = list(reader.array())
+            else:
+                reader.pos -= 1
+                data[key] = reader.value()
+            char = reader.next_char()
+            if char == ',':
+                char = reader.next_char()
+            elif char != '}':
+                raise json.JSONDecodeError("Expecting ',' or '}'", reader.buffer, reader.pos - len(char))
+    return data
+
+
+def loads_compact(text: str) -> dict:
+    return json.loads(text, object_pairs_hook=_object_hook)
+
+
+def to_plain(value):
+    """json.dump(..., default=to_plain) 用: レコードを dict にする"""
+    if isinstance(value, Record):
+        return dict(value.items())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dump_compact(data, path, sort_keys: bool = False):
+    """dataset_patch と同じ形式（ensure_ascii=False, indent=2）で書き出す"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=sort_keys, default=to_plain)
+
+
+def _peak_rss_mib(loader: str, json_path: Path) -> float:
+    """別プロセスで読み込んだときのピークRSS（MiB）"""
+    code = (
+        "import json, resource, sys\n"
+        "from compact_dataset import load_compact\n"
+        f"data = {loader}\n"
+        "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code, str(json_path)],
+        cwd=Path(__file__).parent, capture_output=True, text=True, check=True,
+    )
+    kib = int(result.stdout.strip())
+    # macOS の ru_maxrss はバイト、Linux は KiB
+    return kib / (1 << 20) if sys.platform == 'darwin' else kib / 1024
+
+
+def main():
+    json_path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DATASET_PATH
+    baseline = _peak_rss_mib("json.load(open(sys.argv[1], encoding='utf-8'))", json_path)
+    compact = _peak_rss_mib("load_compact(sys.argv[1])", json_path)
+    empty = _peak_rss_mib("None", json_path)
+
+    print(f"📦 {json_path.name}（インタープリタ起動分 {empty:.1f} MiB を含む）")
+    print(f"  json.load:    ピークRSS {baseline:8.1f} MiB（データ分 {baseline - empty:.1f} MiB）")
+    print(f"  load_compact: ピークRSS {compact:8.1f} MiB（データ分 {compact - empty:.1f} MiB）")
+    if baseline > empty:
+        print(f"  → データ分 {1 - (compact - empty) / (baseline - empty):.0%} 削減")
+
+
+if __name__ == '__main__':
+    install_hooks()
+    main()
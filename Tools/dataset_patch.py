@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Reversible patch log for dataset JSON files (scarlet_violet.json etc.)
+データセット変更の差分ログ（JSON Patch形式・逆操作付き）
+
+ファイル丸ごとのバックアップ（.backup / .backup2）の代わりに、
+保存のたびに変更差分だけを Tools/.dataset_history/<name>/patches.jsonl に追記する。
+各操作は変更前の値（old）を保持しているため、逆操作で即座に巻き戻せる。
+各エントリには変更前後の内容ハッシュ（before / after）を記録し、
+ファイルが履歴の想定と違う状態（手で編集された・生成し直された）なら undo / redo を拒否する。
+
+使い方:
+  python dataset_patch.py log  [json_path]   # 履歴を表示
+  python dataset_patch.py undo [json_path]   # 直前の変更を取り消す
+  python dataset_patch.py redo [json_path]   # 取り消した変更をやり直す
+"""
+
+import difflib
+import hashlib
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from tool_runner import install_hooks
+
+DEFAULT_DATASET_PATH = Path(__file__).parent.parent / 'Pokedex' / 'Pokedex' / 'Resources' / 'PreloadedData' / 'scarlet_violet.json'
+
+# Resources/ はXcodeの同期グループなので、履歴はアプリに同梱されないTools配下に置く
+HISTORY_ROOT = Path(__file__).parent / '.dataset_history'
+
+
+class PatchConflictError(Exception):
+    """ファイルの内容がパッチログの想定と一致しない"""
+
+
+# MARK: - JSON Pointer
+
+def _escape(token) -> str:
+    return str(token).replace('~', '~0').replace('/', '~1')
+
+
+def _unescape(token: str) -> str:
+    return token.replace('~1', '/').replace('~0', '~')
+
+
+def _split_pointer(path: str) -> list[str]:
+    if path == '':
+        return []
+    return [_unescape(t) for t in path.split('/')[1:]]
+
+
+def _resolve(doc, path: str):
+    target = doc
+    for token in _split_pointer(path):
+        target = target[int(token)] if isinstance(target, list) else target[token]
+    return target
+
+
+def _resolve_parent(doc, path: str):
+    """パスの親コンテナと最後のキーを返す"""
+    tokens = _split_pointer(path)
+    parent = doc
+    for token in tokens[:-1]:
+        parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+    key = tokens[-1]
+    return parent, (int(key) if isinstance(parent, list) else key)
+
+
+# MARK: - Diff
+
+def _same(a, b) -> bool:
+    # 値同士は 1 と True / 1.0 を区別する
+    # （リスト・辞書の中身は == の比較に任せるので、中での入れ替えは検出しない）
+    return type(a) is type(b) and a == b
+
+
+def _element_key(value) -> str:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True)
+
+
+def diff(old, new, path: str = '') -> list[dict]:
+    """
+    2つのJSON値の差分を操作リストとして返す
+
+    操作は先頭から順に適用する前提。add/remove/replace/reorder の4種類で、
+    remove/replace/reorder は変更前の値を "old" に持つ。
+    """
+    if _same(old, new):
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        return _diff_dict(old, new, path)
+
+    if isinstance(old, list) and isinstance(new, list):
+        return _diff_list(old, new, path)
+
+    return [{'op': 'replace', 'path': path, 'value': new, 'old': old}]
+
+
+def _diff_dict(old: dict, new: dict, path: str) -> list[dict]:
+    """
+    辞書の差分
+
+    キー順もファイル差分に影響するので、削除位置（index）と並び替え（reorder）も記録する。
+    """
+    ops = []
+    keys = list(old)
+    for key, old_value in old.items():
+        child = f"{path}/{_escape(key)}"
+        if key not in new:
+            index = keys.index(key)
+            ops.append({'op': 'remove', 'path': child, 'old': old_value, 'index': index})
+            del keys[index]
+        else:
+            ops.extend(diff(old_value, new[key], child))
+    for key, new_value in new.items():
+        if key not in old:
+            ops.append({'op': 'add', 'path': f"{path}/{_escape(key)}", 'value': new_value})
+            keys.append(key)
+    if keys != list(new):
+        ops.append({'op': 'reorder', 'path': path, 'value': list(new), 'old': keys})
+    return ops
+
+
+def _diff_list(old: list, new: list, path: str) -> list[dict]:
+    """
+    リストの差分（途中への挿入・削除を最小限の操作で表現する）
+
+    後ろのブロックから処理するので、各操作のインデックスは変更前のリスト基準で有効。
+    """
+    # 末尾への追加だけ（技の継承など）はよくあるケースなので高速に処理
+    if len(new) >= len(old) and all(_same(a, b) for a, b in zip(old, new)):
+        return [{'op': 'add', 'path': f"{path}/{i}", 'value': new[i]} for i in range(len(old), len(new))]
+
+    matcher = difflib.SequenceMatcher(
+        None, [_element_key(v) for v in old], [_element_key(v) for v in new], autojunk=False
+    )
+    ops = []
+    for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+        if tag == 'equal':
+            continue
+        if tag == 'replace' and i2 - i1 == j2 - j1:
+            for offset in range(i2 - i1):
+                ops.extend(diff(old[i1 + offset], new[j1 + offset], f"{path}/{i1 + offset}"))
+            continue
+        for i in range(i2 - 1, i1 - 1, -1):
+            ops.append({'op': 'remove', 'path': f"{path}/{i}", 'old': old[i]})
+        for offset, j in enumerate(range(j1, j2)):
+            ops.append({'op': 'add', 'path': f"{path}/{i1 + offset}", 'value': new[j]})
+    return ops
+
+
+# MARK: - Apply
+
+def invert(ops: list[dict]) -> list[dict]:
+    """操作リストの逆操作を返す"""
+    inverse = []
+    for op in reversed(ops):
+        if op['op'] == 'add':
+            inverse.append({'op': 'remove', 'path': op['path'], 'old': op['value']})
+        elif op['op'] == 'remove':
+            restored = {'op': 'add', 'path': op['path'], 'value': op['old']}
+            if 'index' in op:
+                restored['index'] = op['index']
+            inverse.append(restored)
+        else:
+            inverse.append({'op': op['op'], 'path': op['path'], 'value': op['old'], 'old': op['value']})
+    return inverse
+
+
+def apply_ops(doc, ops: list[dict]):
+    """操作リストを適用した結果を返す（docはその場で変更される）"""
+    for op in ops:
+        if op['op'] == 'reorder':
+            target = _resolve(doc, op['path'])
+            items = [(key, target[key]) for key in op['value']]
+            target.clear()
+            target.update(items)
+            continue
+
+        if op['path'] == '':
+            doc = op['value'] if op['op'] != 'remove' else None
+            continue
+
+        parent, key = _resolve_parent(doc, op['path'])
+        if op['op'] == 'add':
+            if isinstance(parent, list):
+                parent.insert(key, op['value'])
+            elif 'index' in op:
+                items = list(parent.items())
+                items.insert(op['index'], (key, op['value']))
+                parent.clear()
+                parent.update(items)
+            else:
+                parent[key] = op['value']
+        elif op['op'] == 'remove':
+            del parent[key]
+        elif op['op'] == 'replace':
+            parent[key] = op['value']
+        else:
+            raise ValueError(f"Unknown patch op: {op['op']}")
+    return doc
+
+
+# MARK: - Patch log
+
+def document_hash(doc, sort_keys: bool = False) -> str:
+    """
+    内容のハッシュ（インデントなどの書式は含まない）
+
+    sort_keys=True で保存するファイルはキー順が書き込みで変わるので、キー順を無視して比べる。
+    """
+    text = json.dumps(doc, ensure_ascii=False, separators=(',', ':'), sort_keys=sort_keys)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class PatchLog:
+    """データセット1ファイル分のパッチ履歴（patches.jsonl + head）"""
+
+    def __init__(self, json_path):
+        self.json_path = Path(json_path)
+        self.directory = HISTORY_ROOT / self.json_path.stem
+        self.log_path = self.directory / 'patches.jsonl'
+        self.head_path = self.directory / 'head'
+
+    def entries(self) -> list[dict]:
+        if not self.log_path.exists():
+            return []
+        with open(self.log_path, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def head(self, entries: list[dict]) -> int:
+        """適用済みパッチ数"""
+        if not self.head_path.exists():
+            return len(entries)
+        return min(int(self.head_path.read_text().strip() or 0), len(entries))
+
+    def _write(self, entries: list[dict], head: int):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, 'w', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self.head_path.write_text(str(head))
+
+    def append(self, ops: list[dict], message: str, sort_keys: bool, before: str, after: str) -> dict:
+        entries = self.entries()
+        head = self.head(entries)
+
+        entry = {
+            'id': (entries[head - 1]['id'] + 1) if head else 1,
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'tool': Path(sys.argv[0]).name,
+            'message': message,
+            'sortKeys': sort_keys,
+            'before': before,
+            'after': after,
+            'ops': ops,
+        }
+
+        if head < len(entries):
+            # undo後の新しい変更はredo履歴を破棄する
+            self._write(entries[:head] + [entry], head + 1)
+        else:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n')
+            self.head_path.write_text(str(head + 1))
+        return entry
+
+    def _apply(self, entry: dict, ops: list[dict], expected: str, result: str) -> None:
+        """
+        現在のファイルが expected の状態であることを確かめてから ops を適用し、result の状態になったら書き込む
+
+        ハッシュを記録していない古いエントリは確認せずに適用する。
+        """
+        sort_keys = entry.get('sortKeys', False)
+        data = _read_json(self.json_path)
+        current = document_hash(data, sort_keys)
+        if entry.get(expected) and current != entry[expected]:
+            raise PatchConflictError(
+                f"{self.json_path.name} はパッチ #{entry['id']} の{'適用後' if expected == 'after' else '適用前'}の状態と一致しません"
+                f"（履歴の外で編集された可能性があります）"
+            )
+        try:
+            data = apply_ops(data, ops)
+        except (KeyError, IndexError, TypeError) as e:
+            raise PatchConflictError(f"パッチ #{entry['id']} を適用できません: {e!r}") from e
+        if entry.get(result) and document_hash(data, sort_keys) != entry[result]:
+            raise PatchConflictError(f"パッチ #{entry['id']} を適用した結果が記録と一致しません")
+        _write_json(self.json_path, data, sort_keys)
+
+    def undo(self) -> dict | None:
+        """直前のパッチを取り消す（ファイルが適用後の状態でなければ PatchConflictError）"""
+        entries = self.entries()
+        head = self.head(entries)
+        if head == 0:
+            return None
+        entry = entries[head - 1]
+        self._apply(entry, invert(entry['ops']), expected='after', result='before')
+        self.head_path.write_text(str(head - 1))
+        return entry
+
+    def redo(self) -> dict | None:
+        """取り消したパッチをやり直す（ファイルが適用前の状態でなければ PatchConflictError）"""
+        entries = self.entries()
+        head = self.head(entries)
+        if head >= len(entries):
+            return None
+        entry = entries[head]
+        self._apply(entry, entry['ops'], expected='before', result='after')
+        self.head_path.write_text(str(head + 1))
+        return entry
+
+
+def _read_json(path: Path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data, sort_keys: bool = False):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=sort_keys)
+
+
+def save_dataset(json_path, data, message: str = '', sort_keys: bool = False) -> dict | None:
+    """
+    データセットを保存し、変更差分をパッチログに追記する
+
+    Args:
+        json_path: 保存先JSONファイル
+        data: 保存するデータ
+        message: 履歴に残す説明
+        sort_keys: json.dump の sort_keys
+
+    Returns:
+        追記したパッチエントリ（変更なし・新規ファイルの場合は None）
+    """
+    json_path = Path(json_path)
+    entry = None
+
+    if json_path.exists():
+        previous = _read_json(json_path)
+        ops = diff(previous, data)
+        if ops:
+            entry = PatchLog(json_path).append(
+                ops, message, sort_keys, document_hash(previous, sort_keys), document_hash(data, sort_keys)
+            )
+
+    _write_json(json_path, data, sort_keys)
+
+    if entry:
+        print(f"📝 Patch #{entry['id']} recorded ({len(entry['ops'])} ops) - undo: python Tools/dataset_patch.py undo")
+    return entry
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in ('log', 'undo', 'redo'):
+        print('使い方: python dataset_patch.py [log|undo|redo] [json_path]')
+        return 1
+
+    command = sys.argv[1]
+    json_path = Path(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_DATASET_PATH
+    patch_log = PatchLog(json_path)
+
+    if command == 'log':
+        entries = patch_log.entries()
+        head = patch_log.head(entries)
+        if not entries:
+            print(f"履歴なし: {json_path.name}")
+        for i, entry in enumerate(entries):
+            marker = '*' if i < head else ' '
+            print(f"{marker} #{entry['id']} {entry['timestamp']} {entry['tool']} ({len(entry['ops'])} ops) {entry['message']}")
+        return 0
+
+    try:
+        entry = patch_log.undo() if command == 'undo' else patch_log.redo()
+    except PatchConflictError as e:
+        print(f"❌ {command}を中止しました: {e}")
+        return 1
+    if entry is None:
+        print(f"⚠️  {command}できる変更がありません")
+        return 1
+
+    print(f"✅ {command}: #{entry['id']} {entry['tool']} {entry['message']} ({len(entry['ops'])} ops)")
+    return 0
+
+
+if __name__ == '__main__':
+    install_hooks()
+    sys.exit(main())
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Evolution graph consistency checker
+進化チェーンの整合性チェック
+
+技マップとチェーンの隣接関係（chainId → stage → ポケモン）を最初に1回だけ作り、
+全チェーンを1パスで検証する:
+  - move_inheritance: 直前のステージの技を全て覚えているか
+  - stage_continuity: ステージが 1 から欠番なく続いているか
+  - regional_pairing: リージョンフォームが同じ地方の進化前を指しているか
+  - dangling_reference: evolvesFrom / evolvesTo が存在しないIDを指していないか
+
+使い方:
+  python evolution_checker.py [json_path ...] [--json report.json]
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from evolution_inheritance import build_stage_index
+from tool_runner import install_hooks
+
+DEFAULT_DATASET_PATH = Path(__file__).parent.parent / 'Pokedex' / 'Pokedex' / 'Resources' / 'PreloadedData' / 'scarlet_violet.json'
+
+REGIONS = ('alola', 'galar', 'hisui', 'paldea')
+
+MISSING_SAMPLE_SIZE = 5
+
+
+def region_of(name: str) -> str | None:
+    """ポケモン名からリージョン名を返す（例: 'tauros-paldea-combat-breed' → 'paldea'）"""
+    for token in name.split('-')[1:]:
+        if token in REGIONS:
+            return token
+    return None
+
+
+def _ref(pokemon: dict) -> dict:
+    return {
+        'id': pokemon['id'],
+        'name': pokemon['name'],
+        'nameJa': pokemon.get('nameJa', ''),
+        'stage': pokemon['evolutionChain'].get('evolutionStage', 1),
+    }
+
+
+class EvolutionGraph:
+    """1データセット分の進化グラフ（技マップ・ID索引・ステージ索引を保持）"""
+
+    def __init__(self, data: dict, pokemon_list: list[dict] | None = None):
+        # pokemon_list を渡すとそのポケモンのチェーンだけを検証する（参照先はデータセット全体から探す）
+        self.pokemon = data['pokemon'] if pokemon_list is None else pokemon_list
+        self.moves_by_id = {m['id']: m for m in data.get('moves', [])}
+        self.pokemon_by_id = {p['id']: p for p in data['pokemon']}
+        self.chains = build_stage_index(self.pokemon)
+
+    def move_name(self, move_id: int) -> str:
+        move = self.moves_by_id.get(move_id)
+        if not move:
+            return f"#{move_id}"
+        return move.get('nameJa') or move.get('name') or f"#{move_id}"
+
+    def check(self) -> list[dict]:
+        """全チェーンを検証して問題のリストを返す"""
+        issues = []
+        for chain_id in sorted(self.chains):
+            stages = self.chains[chain_id]
+            issues.extend(self._check_stage_continuity(chain_id, stages))
+            for stage in sorted(stages):
+                pre_evolutions = stages.get(stage - 1, [])
+                for pokemon in stages[stage]:
+                    if stage > 1:
+                        issues.extend(self._check_move_inheritance(chain_id, pre_evolutions, pokemon))
+                        issues.extend(self._check_regional_pairing(chain_id, pre_evolutions, pokemon))
+                    issues.extend(self._check_references(chain_id, pokemon))
+        return issues
+
+    def _check_stage_continuity(self, chain_id: int, stages: dict) -> list[dict]:
+        present = sorted(stages)
+        missing = [s for s in range(1, present[-1] + 1) if s not in stages]
+        if not missing:
+            return []
+        return [{
+            'kind': 'stage_continuity',
+            'severity': 'warning',
+            'chainId': chain_id,
+            'presentStages': present,
+            'missingStages': missing,
+            'members': [_ref(p) for s in present for p in stages[s]],
+        }]
+
+    def _check_move_inheritance(self, chain_id: int, pre_evolutions: list[dict], pokemon: dict) -> list[dict]:
+        issues = []
+        current_moves = {m['moveId'] for m in pokemon.get('moves', [])}
+        for pre_evo in pre_evolutions:
+            missing_moves = {m['moveId'] for m in pre_evo.get('moves', [])} - current_moves
+            if missing_moves:
+                issues.append({
+                    'kind': 'move_inheritance',
+                    'severity': 'error',
+                    'chainId': chain_id,
+                    'preEvolution': _ref(pre_evo),
+                    'pokemon': _ref(pokemon),
+                    'missingCount': len(missing_moves),
+                    'missingMoveIds': sorted(missing_moves),
+                    'missingSamples': [self.move_name(mid) for mid in sorted(missing_moves)[:MISSING_SAMPLE_SIZE]],
+                })
+        return issues
+
+    def _check_regional_pairing(self, chain_id: int, pre_evolutions: list[dict], pokemon: dict) -> list[dict]:
+        region = region_of(pokemon['name'])
+        if not region:
+            return []
+
+        same_region = [p for p in pre_evolutions if region_of(p['name']) == region]
+        evolves_from = pokemon['evolutionChain'].get('evolvesFrom')
+        if not same_region or any(p['id'] == evolves_from for p in same_region):
+            return []
+
+        # 同じ地方の進化前がいるのに、通常フォームを指している
+        return [{
+            'kind': 'regional_pairing',
+            'severity': 'warning',
+            'chainId': chain_id,
+            'pokemon': _ref(pokemon),
+            'evolvesFrom': evolves_from,
+            'expected': [_ref(p) for p in same_region],
+        }]
+
+    def _check_references(self, chain_id: int, pokemon: dict) -> list[dict]:
+        evolution_chain = pokemon['evolutionChain']
+        referenced = list(evolution_chain.get('evolvesTo') or [])
+        if evolution_chain.get('evolvesFrom') is not None:
+            referenced.append(evolution_chain['evolvesFrom'])
+
+        dangling = [pid for pid in referenced if pid not in self.pokemon_by_id]
+        if not dangling:
+            return []
+        return [{
+            'kind': 'dangling_reference',
+            'severity': 'warning',
+            'chainId': chain_id,
+            'pokemon': _ref(pokemon),
+            'missingIds': dangling,
+        }]
+
+
+def check_dataset(data: dict) -> dict:
+    """
+    データセットを検証して機械可読なレポートを返す
+
+    Returns:
+        {"summary": {...}, "issues": [...]}
+    """
+    graph = EvolutionGraph(data)
+    issues = graph.check()
+
+    by_kind = {}
+    for issue in issues:
+        by_kind[issue['kind']] = by_kind.get(issue['kind'], 0) + 1
+
+    return {
+        'summary': {
+            'versionGroup': data.get('versionGroup'),
+            'pokemon': len(graph.pokemon),
+            'chains': len(graph.chains),
+            'issues': len(issues),
+            'byKind': by_kind,
+        },
+        'issues': issues,
+    }
+
+
+def main():
+    args = sys.argv[1:]
+    report_path = None
+    if '--json' in args:
+        i = args.index('--json')
+        report_path = Path(args[i + 1])
+        del args[i:i + 2]
+
+    paths = [Path(a) for a in args] or [DEFAULT_DATASET_PATH]
+    reports = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            report = check_dataset(json.load(f))
+        report['summary']['dataset'] = str(path)
+        reports.append(report)
+
+        summary = report['summary']
+        print(f"{path.name}: {summary['chains']} chains / {summary['pokemon']} pokemon / {summary['issues']} issues")
+        for kind, count in sorted(summary['byKind'].items()):
+            print(f"  - {kind}: {count}")
+
+    if report_path:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(reports if len(reports) > 1 else reports[0], f, ensure_ascii=False, indent=2)
+        print(f"📝 Report: {report_path}")
+
+    has_errors = any(i['severity'] == 'error' for r in reports for i in r['issues'])
+    return 1 if has_errors else 0
+
+
+if __name__ == '__main__':
+    install_hooks()
+    sys.exit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Evolution move inheritance engine
+進化前の技を進化後のポケモンに継承する
+
+(chainId, evolutionStage) でインデックスを作り、チェーンごとにステージの若い順に処理する。
+そのため stage 3 は、継承済みの stage 2 から技を受け継ぐ（推移的に継承される）。
+ファイル内の並び順には依存せず、データセット全体を線形時間で処理する。
+
+Note: evolvesTo は信頼できない（リージョンフォームで通常フォームを指している）ため、
+同じ chainId で直前のステージのポケモンを全て進化前として扱う。
+"""
+
+from collections import defaultdict
+
+
+def build_stage_index(pokemon_list: list[dict]) -> dict[int, dict[int, list[dict]]]:
+    """
+    chainId → evolutionStage → ポケモンリスト のインデックスを作成
+
+    各ステージ内はID順に並べる（継承順を決定的にするため）
+    """
+    index = defaultdict(lambda: defaultdict(list))
+    for pokemon in pokemon_list:
+        evolution_chain = pokemon.get('evolutionChain')
+        if not evolution_chain or evolution_chain.get('chainId') is None:
+            continue
+        stage = evolution_chain.get('evolutionStage', 1)
+        index[evolution_chain['chainId']][stage].append(pokemon)
+
+    for stages in index.values():
+        for members in stages.values():
+            members.sort(key=lambda p: p['id'])
+    return index
+
+
+def inherit_evolution_moves(pokemon_list: list[dict]) -> int:
+    """
+    進化前の技を進化後のポケモンに追加する
+
+    追加した技には isFromPreEvolution: True を付ける。
+    既に同じ moveId を覚えている場合は追加しない（何度実行しても結果は同じ）。
+
+    Args:
+        pokemon_list: data['pokemon']（その場で更新される）
+
+    Returns:
+        追加した技の数
+    """
+    moves_added_count = 0
+
+    for stages in build_stage_index(pokemon_list).values():
+        for stage in sorted(stages):
+            pre_evolutions = stages.get(stage - 1)
+            if stage <= 1 or not pre_evolutions:
+                continue
+
+            for pokemon in stages[stage]:
+                moves = pokemon.setdefault('moves', [])
+                current_move_ids = {m['moveId'] for m in moves}
+
+                for pre_evo in pre_evolutions:
+                    pre_moves = pre_evo.get('moves', [])
+                    missing_ids = {m['moveId'] for m in pre_moves} - current_move_ids
+                    if not missing_ids:
+                        continue
+
+                    # 進化前の並び順を保ったまま、不足している技だけを追加
+                    for move in pre_moves:
+                        if move['moveId'] in missing_ids:
+                            inherited_move = move.copy()
+                            inherited_move['isFromPreEvolution'] = True
+                            moves.append(inherited_move)
+                            missing_ids.discard(move['moveId'])
+                            moves_added_count += 1
+                    current_move_ids |= {m['moveId'] for m in pre_moves}
+
+    return moves_added_count
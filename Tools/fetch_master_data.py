@@ -1,14 +1,28 @@
 #!/usr/bin/env python3
 """
 Fetch ability and move master data from PokeAPI and update scarlet_violet.json
+
+Names and effects for every language in string_tables.LANGUAGES are also
+written to PreloadedData/strings/<lang>.json. With --ids-only the records
+keep only their identifiers and the inline nameJa/effect/effectJa fields are
+dropped (the app must then read the string tables).
 """
 import json
+import sys
 import time
 import urllib.request
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from move_categories import detect_move_categories
+from pathlib import Path
+from dataset_patch import save_dataset
+from translation_cache import TranslationCache
+from TranslateEffects import translation_sources, translator_version
+from translation_memory import SentenceMemory, TranslationMemory
+from move_categories import detect_move_categories_batch
+from string_tables import StringTableBuilder, localized
+from tool_runner import install_hooks
 
 JSON_PATH = "../Pokedex/Pokedex/Resources/PreloadedData/scarlet_violet.json"
+DICT_PATH = Path(__file__).parent / "translation_dictionary.json"
 
 def fetch_json(url):
     """Fetch JSON from URL"""
@@ -20,7 +34,10 @@ def fetch_json(url):
         return None
 
 def fetch_ability(ability_id):
-    """Fetch ability data from PokeAPI"""
+    """Fetch ability data from PokeAPI
+
+    Returns (ability record, localized names/effects for the string tables).
+    """
     data = fetch_json(f"https://pokeapi.co/api/v2/ability/{ability_id}")
     if not data:
         return None
@@ -34,16 +51,25 @@ def fetch_ability(ability_id):
     effect = next((e["effect"] for e in effect_entries if e["language"]["name"] == "en"), "")
     effect_ja = next((e["effect"] for e in effect_entries if e["language"]["name"] == "ja"), "")
 
+    strings = {
+        "names": localized(data.get("names", []), "name"),
+        "effects": localized(effect_entries, "effect"),
+    }
+
     return {
         "id": ability_id,
         "name": name,
         "nameJa": name_ja or f"特性{ability_id}",
         "effect": effect or "",
         "effectJa": effect_ja or ""
-    }
+    }, strings
 
 def fetch_move(move_id):
-    """Fetch move data from PokeAPI"""
+    """Fetch move data from PokeAPI
+
+    Returns (move record, category detection input, localized names/effects);
+    categories are filled in by main() with one detect_move_categories_batch() call.
+    """
     data = fetch_json(f"https://pokeapi.co/api/v2/move/{move_id}")
     if not data:
         return None
@@ -105,8 +131,6 @@ def fetch_move(move_id):
         "power": power,
         "damageClass": damage_class or "status"
     }
-    categories = detect_move_categories(move_data_for_detection)
-
     return {
         "id": move_id,
         "name": name,
@@ -120,7 +144,7 @@ def fetch_move(move_id):
         "effectChance": effect_chance,
         "effect": effect or "",
         "effectJa": effect_ja or "",
-        "categories": categories,
+        "categories": [],
         "meta": {
             "ailment": (meta.get("ailment") or {}).get("name") or "none",
             "ailmentChance": meta.get("ailment_chance") or 0,
@@ -132,6 +156,9 @@ def fetch_move(move_id):
             "statChance": meta.get("stat_chance") or 0,
             "statChanges": stat_changes
         }
+    }, move_data_for_detection, {
+        "names": localized(data.get("names", []), "name"),
+        "effects": localized(effect_entries, "effect"),
     }
 
 def main():
@@ -164,12 +191,15 @@ def main():
     # Fetch abilities
     print("\n📊 Fetching abilities...")
     abilities = []
+    strings_by_kind = {"abilities": {}, "moves": {}}
     with ThreadPoolExecutor(max_workers=10) as executor:
         futures = {executor.submit(fetch_ability, aid): aid for aid in ability_ids}
         for i, future in enumerate(as_completed(futures), 1):
             result = future.result()
             if result:
-                abilities.append(result)
+                ability, strings = result
+                abilities.append(ability)
+                strings_by_kind["abilities"][ability["id"]] = strings
             if i % 10 == 0 or i == len(ability_ids):
                 print(f"  [{i}/{len(ability_ids)}] abilities fetched")
             time.sleep(0.05)  # Rate limiting
@@ -177,24 +207,60 @@ def main():
     # Fetch moves
     print("\n📊 Fetching moves...")
     moves = []
+    detection_inputs = []
     with ThreadPoolExecutor(max_workers=10) as executor:
         futures = {executor.submit(fetch_move, mid): mid for mid in move_ids}
         for i, future in enumerate(as_completed(futures), 1):
             result = future.result()
             if result:
-                moves.append(result)
+                move, detection_input, strings = result
+                moves.append(move)
+                detection_inputs.append(detection_input)
+                strings_by_kind["moves"][move["id"]] = strings
             if i % 50 == 0 or i == len(move_ids):
                 print(f"  [{i}/{len(move_ids)}] moves fetched")
             time.sleep(0.05)  # Rate limiting
 
+    # Categorize all moves at once
+    category_lists, _ = detect_move_categories_batch(detection_inputs)
+    for move, categories in zip(moves, category_lists):
+        move["categories"] = categories
+
+    # Keep previous Japanese translations when upstream has none
+    cache = TranslationCache(translator_version())
+    sentence_memory = SentenceMemory.load(DICT_PATH) if DICT_PATH.exists() else SentenceMemory()
+    move_memory = TranslationMemory.load(DICT_PATH) if DICT_PATH.exists() else None
+    for kind, records in (("ability", abilities), ("move", moves)):
+        memory = move_memory if kind == "move" else None
+        for record in records:
+            if not record["effectJa"] and record["effect"]:
+                sources = translation_sources(record["effect"], sentence_memory, memory)
+                record["effectJa"] = cache.get(kind, record["effect"], sources) or ""
+    print(f"\n📦 Translation cache: {cache.hits} reused, {cache.misses} still untranslated")
+
+    # Per-language string tables
+    builder = StringTableBuilder()
+    for kind, records in (("abilities", abilities), ("moves", moves)):
+        for record in records:
+            strings = strings_by_kind[kind][record["id"]]
+            # Japanese effects may come from the translation cache rather than PokeAPI
+            effects = {"ja": record["effectJa"], **strings["effects"]}
+            builder.add(kind, record["id"], strings["names"], effects)
+    table_paths = builder.write()
+    print(f"🌐 String tables: {', '.join(p.stem for p in table_paths)}")
+
+    if "--ids-only" in sys.argv:
+        for record in abilities + moves:
+            for field in ("nameJa", "effect", "effectJa"):
+                record.pop(field, None)
+
     # Update JSON
     print("\n💾 Updating JSON...")
     game_data["abilities"] = sorted(abilities, key=lambda x: x["id"])
     game_data["moves"] = sorted(moves, key=lambda x: x["id"])
 
     # Write back
-    with open(JSON_PATH, "w", encoding="utf-8") as f:
-        json.dump(game_data, f, ensure_ascii=False, indent=2, sort_keys=True)
+    save_dataset(JSON_PATH, game_data, message="Refresh ability/move master data", sort_keys=True)
 
     file_size = len(json.dumps(game_data, ensure_ascii=False)) / 1024 / 1024
 
@@ -206,4 +272,5 @@ def main():
     print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
 
 if __name__ == "__main__":
+    install_hooks()
     main()
@@ -4,6 +4,8 @@
 """
 
 import json
+from dataset_patch import save_dataset
+from tool_runner import install_hooks
 
 INPUT_FILE = '/Users/yusuke/Development/Pokedex-SwiftUI/Pokedex/Pokedex/Resources/PreloadedData/scarlet_violet.json'
 OUTPUT_FILE = INPUT_FILE
@@ -74,12 +76,12 @@ def main():
 
     # 保存
     data['pokemon'] = pokemon_list
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_dataset(OUTPUT_FILE, data)
 
     print(f"\n{'='*70}")
     print(f"✅ 完了: {updated_count}件のスプライトURLを修正")
     print(f"📝 保存先: {OUTPUT_FILE}")
 
 if __name__ == '__main__':
+    install_hooks()
     main()
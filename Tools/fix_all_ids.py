@@ -3,9 +3,13 @@
 全てのID重複を解消
 
 10000番台は既に使われているため、20000番台から採番します。
+割り当てたIDは form_id_registry.json に記録され、再実行しても変わりません。
 """
 
 import json
+from dataset_patch import save_dataset
+from form_id_registry import FormIdRegistry
+from tool_runner import install_hooks
 
 INPUT_FILE = '/Users/yusuke/Development/Pokedex-SwiftUI/Pokedex/Pokedex/Resources/PreloadedData/scarlet_violet.json'
 OUTPUT_FILE = INPUT_FILE
@@ -35,33 +39,24 @@ def main():
 
     print(f"\n【ID重複検出: {len(duplicates)}件】")
 
-    # 20000から採番開始
-    next_id = 20000
-    updated_count = 0
+    # IDはレジストリから取得（登録済みのフォームは常に同じID、未登録の重複は20000〜の空きIDを採番）
+    # 最初に登場したフォームが元のIDを維持する
+    registry = FormIdRegistry()
+    changes = registry.apply(pokemon_list, 'extra')
 
     print(f"\n【ID修正】")
-    for dup_id in sorted(duplicates.keys()):
-        pokemons = duplicates[dup_id]
-        # 最初の1つは元のIDのまま、残りに新しいIDを割り当て
-        print(f"\nID {dup_id}: {len(pokemons)}件")
-        for i, pokemon in enumerate(pokemons):
-            if i == 0:
-                print(f"  {pokemon['name']}: ID {dup_id} (維持)")
-            else:
-                old_id = pokemon['id']
-                pokemon['id'] = next_id
-                print(f"  {pokemon['name']}: ID {old_id} → {next_id}")
-                next_id += 1
-                updated_count += 1
+    for name, old_id, new_id in changes:
+        print(f"  {name}: ID {old_id} → {new_id}")
+    updated_count = len(changes)
 
     # 保存
     data['pokemon'] = pokemon_list
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_dataset(OUTPUT_FILE, data)
+    registry.save()
 
     print(f"\n{'='*70}")
     print(f"✅ 完了: {updated_count}件のIDを更新")
-    print(f"📝 割り当てたID範囲: 20000-{next_id-1}")
+    print(f"📝 IDレジストリ: {registry.path}")
     print(f"📝 保存先: {OUTPUT_FILE}")
 
     # 検証
@@ -81,4 +76,5 @@ def main():
         print(f"✅ ID重複なし - 全{len(verify_data['pokemon'])}件のポケモン")
 
 if __name__ == '__main__':
+    install_hooks()
     main()
@@ -4,9 +4,13 @@
 
 ID重複を解消するため、コスメティックフォームに10000番台のIDを割り当てます。
 アルセウスは既に10118-10134を使用しているため、それ以降から採番します。
+割り当てたIDは form_id_registry.json に記録され、再実行しても変わりません。
 """
 
 import json
+from dataset_patch import save_dataset
+from form_id_registry import FormIdRegistry
+from tool_runner import install_hooks
 
 INPUT_FILE = '/Users/yusuke/Development/Pokedex-SwiftUI/Pokedex/Pokedex/Resources/PreloadedData/scarlet_violet.json'
 OUTPUT_FILE = INPUT_FILE
@@ -60,8 +64,10 @@ def main():
     for base, variants in groups.items():
         cosmetic_variants.extend(variants)
 
-    # 10135から採番開始（アルセウスが10134まで使用）
-    next_id = 10135
+    # IDはレジストリから取得（未登録なら10135〜の空きIDを採番、アルセウスが10134まで使用）
+    # 一度割り当てたIDは実行順やファイル内の並びに関係なく同じになる
+    registry = FormIdRegistry()
+    registry.bootstrap([p for p in pokemon_list if p['name'] not in cosmetic_variants])
     updated_count = 0
 
     print(f"\n【ユニークID割り当て】")
@@ -70,20 +76,21 @@ def main():
 
         if name in cosmetic_variants:
             old_id = pokemon['id']
-            pokemon['id'] = next_id
-            print(f"  {name}: ID {old_id} → {next_id}")
-            next_id += 1
-            updated_count += 1
+            new_id = registry.allocate(name, 'cosmetic')
+            if old_id != new_id:
+                pokemon['id'] = new_id
+                print(f"  {name}: ID {old_id} → {new_id}")
+                updated_count += 1
 
     # 保存
     data['pokemon'] = pokemon_list
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_dataset(OUTPUT_FILE, data)
+    registry.save()
 
     print(f"\n{'='*70}")
     print(f"✅ 完了: {updated_count}件のIDを更新")
-    print(f"📝 割り当てたID範囲: 10135-{next_id-1}")
     print(f"📝 保存先: {OUTPUT_FILE}")
+    print(f"📝 IDレジストリ: {registry.path}")
 
     # 検証
     print(f"\n【検証】")
@@ -99,4 +106,5 @@ def main():
         print(f"✅ ID重複なし")
 
 if __name__ == '__main__':
+    install_hooks()
     main()
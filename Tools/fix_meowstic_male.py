@@ -6,6 +6,8 @@
 import json
 import sys
 import urllib.request
+from dataset_patch import save_dataset
+from tool_runner import install_hooks
 
 def fetch_pokemon_data(pokemon_name):
     """PokeAPIからポケモンデータを取得"""
@@ -119,12 +121,12 @@ def fix_meowstic_male(input_file, output_file):
     print(f"      hidden: {new_female['abilities']['hidden']}")
 
     # 保存
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_dataset(output_file, data)
 
     print(f"\n修正完了: 1件")
 
 if __name__ == '__main__':
+    install_hooks()
     input_file = '/Users/yusuke/Development/Pokedex-SwiftUI/Pokedex/Pokedex/Resources/PreloadedData/scarlet_violet.json'
     output_file = input_file  # 上書き
 
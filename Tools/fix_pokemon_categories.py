@@ -11,6 +11,8 @@
 
 import json
 import sys
+from dataset_patch import save_dataset
+from tool_runner import install_hooks
 
 # 600族（擬似伝説）を一般に分類
 PSEUDO_LEGENDARY = {
@@ -85,12 +87,12 @@ def fix_categories(input_file, output_file):
                 fixed_count += 1
 
     # 保存
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_dataset(output_file, data)
 
     print(f"\n修正完了: {fixed_count}件")
 
 if __name__ == '__main__':
+    install_hooks()
     input_file = '/Users/yusuke/Development/Pokedex-SwiftUI/Pokedex/Pokedex/Resources/PreloadedData/scarlet_violet.json'
     output_file = input_file  # 上書き
 
@@ -7,6 +7,8 @@
 
 import json
 import sys
+from dataset_patch import save_dataset
+from tool_runner import install_hooks
 
 def fix_ursaluna_pokedex(input_file, output_file):
     """通常のガチグマからキタカミ図鑑番号を削除"""
@@ -30,12 +32,12 @@ def fix_ursaluna_pokedex(input_file, output_file):
                 pokemon['pokedexNumbers'] = pokedex_numbers
 
     # 保存
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_dataset(output_file, data)
 
     print(f"\n修正完了: {fixed_count}件")
 
 if __name__ == '__main__':
+    install_hooks()
     input_file = 'Pokedex/Pokedex/Resources/PreloadedData/scarlet_violet.json'
     output_file = input_file  # 上書き
 
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Persistent form ID registry
+フォーム名 → ID の永続レジストリ
+
+フォームに割り当てたIDを form_id_registry.json に記録し、再生成しても同じIDを使う。
+ファイル内の並び順や過去の実行履歴に左右されないので、IDがずれてアプリの再インポートが必要になることがない。
+
+採番範囲:
+  arceus:   10118〜10134（アルセウスの17タイプフォーム）
+  cosmetic: 10135〜
+  extra:    20000〜（その他のID重複解消用）
+
+使い方:
+  python form_id_registry.py bootstrap [json_path]  # 現在のデータセットのIDを登録
+  python form_id_registry.py check [json_path]      # データセットとレジストリの食い違いを確認
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from tool_runner import install_hooks
+
+DEFAULT_DATASET_PATH = Path(__file__).parent.parent / 'Pokedex' / 'Pokedex' / 'Resources' / 'PreloadedData' / 'scarlet_violet.json'
+DEFAULT_REGISTRY_PATH = Path(__file__).parent / 'form_id_registry.json'
+
+DEFAULT_RANGES = {
+    'arceus': 10118,
+    'cosmetic': 10135,
+    'extra': 20000,
+}
+
+
+class FormIdCollisionError(ValueError):
+    """同じIDが別のフォーム名に割り当てられようとした"""
+
+
+class FormIdRegistry:
+    def __init__(self, path=DEFAULT_REGISTRY_PATH):
+        self.path = Path(path)
+        self.ids = {}
+        self.next_ids = dict(DEFAULT_RANGES)
+        self._owners = {}
+        self._dirty = False
+
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            self.next_ids.update(stored.get('nextIds', {}))
+            for name, form_id in stored.get('ids', {}).items():
+                self.assign(name, form_id)
+            self._dirty = False
+
+    def get(self, name: str) -> int | None:
+        return self.ids.get(name)
+
+    def owner_of(self, form_id: int) -> str | None:
+        return self._owners.get(form_id)
+
+    def assign(self, name: str, form_id: int) -> int:
+        """名前にIDを登録（既に別の名前が使っているIDなら FormIdCollisionError）"""
+        current = self.ids.get(name)
+        if current == form_id:
+            return form_id
+        if current is not None:
+            raise FormIdCollisionError(f"{name} is already registered as {current} (requested {form_id})")
+        owner = self._owners.get(form_id)
+        if owner is not None:
+            raise FormIdCollisionError(f"ID {form_id} is already used by {owner} (requested by {name})")
+
+        self.ids[name] = form_id
+        self._owners[form_id] = name
+        self._dirty = True
+        return form_id
+
+    def allocate(self, name: str, range_name: str = 'extra') -> int:
+        """登録済みならそのIDを、未登録なら採番範囲の次の空きIDを返す"""
+        if name in self.ids:
+            return self.ids[name]
+
+        form_id = self.next_ids[range_name]
+        while form_id in self._owners:
+            form_id += 1
+        self.next_ids[range_name] = form_id + 1
+        return self.assign(name, form_id)
+
+    def bootstrap(self, pokemon_list: list[dict]) -> list[dict]:
+        """
+        データセットの現在のIDを登録する
+
+        同じIDを複数のフォームが使っている場合は最初の1つだけを登録し、残りを返す。
+        """
+        unregistered = []
+        for pokemon in pokemon_list:
+            name = pokemon['name']
+            if name in self.ids:
+                continue
+            if pokemon['id'] in self._owners:
+                unregistered.append(pokemon)
+            else:
+                self.assign(name, pokemon['id'])
+        return unregistered
+
+    def apply(self, pokemon_list: list[dict], range_name: str = 'extra') -> list[tuple[str, int, int]]:
+        """
+        データセットのIDをレジストリに合わせる（未登録のフォームは range_name から採番）
+
+        Returns:
+            変更したフォーム: [(name, old_id, new_id)]
+        """
+        self.bootstrap(pokemon_list)
+        changes = []
+        for pokemon in pokemon_list:
+            form_id = self.allocate(pokemon['name'], range_name)
+            if form_id != pokemon['id']:
+                changes.append((pokemon['name'], pokemon['id'], form_id))
+                pokemon['id'] = form_id
+        return changes
+
+    def find_conflicts(self, pokemon_list: list[dict]) -> list[tuple[str, int, int]]:
+        """レジストリと異なるIDを持つフォーム: [(name, dataset_id, registry_id)]"""
+        return [
+            (p['name'], p['id'], self.ids[p['name']])
+            for p in pokemon_list
+            if p['name'] in self.ids and self.ids[p['name']] != p['id']
+        ]
+
+    def save(self):
+        if not self._dirty and self.path.exists():
+            return
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'nextIds': self.next_ids,
+                'ids': dict(sorted(self.ids.items(), key=lambda item: item[1])),
+            }, f, ensure_ascii=False, indent=2)
+        self._dirty = False
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in ('bootstrap', 'check'):
+        print('使い方: python form_id_registry.py [bootstrap|check] [json_path]')
+        return 1
+
+    json_path = Path(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_DATASET_PATH
+    with open(json_path, 'r', encoding='utf-8') as f:
+        pokemon_list = json.load(f)['pokemon']
+
+    registry = FormIdRegistry()
+
+    if sys.argv[1] == 'bootstrap':
+        unregistered = registry.bootstrap(pokemon_list)
+        registry.save()
+        print(f"✅ {len(registry.ids)}件のIDを登録: {registry.path}")
+        for pokemon in unregistered:
+            print(f"  ⚠️  ID重複のため未登録: {pokemon['name']} (ID {pokemon['id']} は {registry.owner_of(pokemon['id'])})")
+        return 0
+
+    conflicts = registry.find_conflicts(pokemon_list)
+    missing = [p['name'] for p in pokemon_list if p['name'] not in registry.ids]
+    for name, dataset_id, registry_id in conflicts:
+        print(f"  ❌ {name}: データセット {dataset_id} / レジストリ {registry_id}")
+    for name in missing:
+        print(f"  ⚠️  未登録: {name}")
+    if not conflicts and not missing:
+        print(f"✅ 全{len(pokemon_list)}件がレジストリと一致")
+    return 1 if conflicts else 0
+
+
+if __name__ == '__main__':
+    install_hooks()
+    sys.exit(main())
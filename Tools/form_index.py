@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Form family index
+フォーム違いの索引（基本形・バトルフォーム・コスメティック・リージョンフォーム・図鑑ごとの表示）
+
+ポケモンリストを1回走査して、名前・ID・全国図鑑番号・名前プレフィックス・図鑑ごとの索引を作る。
+チェックスクリプトの next(p for p in data['pokemon'] ...) や部分文字列検索を辞書引きに置き換える。
+
+使い方:
+  python form_index.py [json_path] [--export [output_path]]
+  （--export はアプリのフォーム切り替え用に form_families.json を書き出す）
+"""
+
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from evolution_checker import region_of
+from tool_runner import install_hooks
+
+PRELOADED_DATA_DIR = Path(__file__).parent.parent / 'Pokedex' / 'Pokedex' / 'Resources' / 'PreloadedData'
+DEFAULT_DATASET_PATH = PRELOADED_DATA_DIR / 'scarlet_violet.json'
+DEFAULT_EXPORT_PATH = PRELOADED_DATA_DIR / 'form_families.json'
+
+# バトル中のみ・一時的な姿
+BATTLE_FORM_MARKERS = (
+    '-busted',    # ミミッキュ（化けの皮が剥がれた）
+    '-ash',       # サトシゲッコウガ
+    '-totem',     # ぬしポケモン
+    '-starter',   # 相棒
+    '-build',     # コライドン
+    '-mode',      # ミライドン
+    '-eternamax', # ムゲンダイマックス
+)
+
+# 見た目だけが違う姿
+COSMETIC_FORM_NAMES = frozenset([
+    'pikachu-original-cap', 'pikachu-hoenn-cap', 'pikachu-sinnoh-cap',
+    'pikachu-unova-cap', 'pikachu-kalos-cap', 'pikachu-alola-cap',
+    'pikachu-partner-cap', 'pikachu-world-cap',
+    'flabebe-red', 'flabebe-yellow', 'flabebe-orange', 'flabebe-blue', 'flabebe-white',
+    'floette-red', 'floette-yellow', 'floette-orange', 'floette-blue', 'floette-white',
+    'florges-red', 'florges-yellow', 'florges-orange', 'florges-blue', 'florges-white',
+    'vivillon-meadow', 'vivillon-icy-snow', 'vivillon-polar', 'vivillon-tundra',
+    'vivillon-continental', 'vivillon-garden', 'vivillon-elegant', 'vivillon-modern',
+    'vivillon-marine', 'vivillon-archipelago', 'vivillon-high-plains', 'vivillon-sandstorm',
+    'vivillon-river', 'vivillon-monsoon', 'vivillon-savanna', 'vivillon-sun',
+    'vivillon-ocean', 'vivillon-jungle', 'vivillon-fancy', 'vivillon-poke-ball',
+    'deerling-spring', 'deerling-summer', 'deerling-autumn', 'deerling-winter',
+    'sawsbuck-spring', 'sawsbuck-summer', 'sawsbuck-autumn', 'sawsbuck-winter',
+    'shellos-east', 'shellos-west', 'gastrodon-east', 'gastrodon-west',
+    'minior-orange-meteor', 'minior-yellow-meteor', 'minior-green-meteor',
+    'minior-blue-meteor', 'minior-indigo-meteor', 'minior-violet-meteor',
+    'minior-orange', 'minior-yellow', 'minior-green',
+    'minior-blue', 'minior-indigo', 'minior-violet',
+    'zarude-dada', 'magearna-original',
+    'maushold-family-of-four', 'maushold-family-of-three',
+    'tatsugiri-droopy', 'tatsugiri-stretchy',
+    'dudunsparce-two-segment', 'dudunsparce-three-segment',
+    'basculin-blue-striped',
+])
+
+
+def classify_form(pokemon: dict, is_base: bool) -> str:
+    """
+    フォームの種類を返す: base / regional / battle / cosmetic / variant
+
+    明示したコスメティック名・バトルフォームの印を地方名より先に見る
+    （pikachu-alola-cap は名前に alola を含むがリージョンフォームではない）。
+
+    >>> classify_form({'name': 'pikachu-alola-cap'}, False)
+    'cosmetic'
+    >>> classify_form({'name': 'raichu-alola'}, False)
+    'regional'
+    >>> classify_form({'name': 'greninja-ash'}, False)
+    'battle'
+    """
+    name = pokemon['name']
+    if is_base:
+        return 'base'
+    if name in COSMETIC_FORM_NAMES:
+        return 'cosmetic'
+    if any(marker in name for marker in BATTLE_FORM_MARKERS):
+        return 'battle'
+    if region_of(name):
+        return 'regional'
+    if pokemon.get('pokedexNumbers') == {}:
+        return 'cosmetic'
+    return 'variant'
+
+
+class FormFamilyIndex:
+    """データセット1つ分のフォーム索引"""
+
+    def __init__(self, pokemon_list: list[dict]):
+        self.pokemon = pokemon_list
+        self.by_name = {}
+        self.by_id = {}
+        # 全国図鑑番号 → 名前リスト（ファイル順、nationalDexNumber を持つものだけ）
+        self.by_national = defaultdict(list)
+        # 図鑑名 → 全国図鑑番号 → 名前リスト
+        self.by_national_in_dex = defaultdict(lambda: defaultdict(list))
+        # 'flabebe' → ['flabebe', 'flabebe-red', ...]（ハイフン区切りのプレフィックス）
+        self._by_prefix = defaultdict(list)
+
+        for pokemon in pokemon_list:
+            name = pokemon['name']
+            self.by_name[name] = pokemon
+            self.by_id.setdefault(pokemon['id'], pokemon)
+
+            tokens = name.split('-')
+            for i in range(1, len(tokens) + 1):
+                self._by_prefix['-'.join(tokens[:i])].append(name)
+
+            national = pokemon.get('nationalDexNumber')
+            if national:
+                self.by_national[national].append(name)
+                for pokedex_name in pokemon.get('pokedexNumbers') or {}:
+                    self.by_national_in_dex[pokedex_name][national].append(name)
+
+        self.families = self._build_families()
+
+    def names_with_prefix(self, prefix: str) -> list[str]:
+        """prefix そのもの、または prefix- で始まる名前"""
+        return self._by_prefix.get(prefix, [])
+
+    def species_of(self, pokemon: dict) -> int | None:
+        """フォームが属する種族（全国図鑑番号）"""
+        national = pokemon.get('nationalDexNumber')
+        if national:
+            return national
+
+        # コスメティックフォームは nationalDexNumber が削除されているので名前から基本形を探す
+        tokens = pokemon['name'].split('-')
+        for i in range(len(tokens) - 1, 0, -1):
+            base = self.by_name.get('-'.join(tokens[:i]))
+            if base and base.get('nationalDexNumber'):
+                return base['nationalDexNumber']
+            for name in self._by_prefix.get('-'.join(tokens[:i]), []):
+                candidate = self.by_name[name].get('nationalDexNumber')
+                if candidate:
+                    return candidate
+
+        varieties = pokemon.get('varieties') or []
+        return varieties[0] if varieties else None
+
+    def _build_families(self) -> dict[int, dict]:
+        members_by_species = defaultdict(list)
+        for pokemon in self.pokemon:
+            species = self.species_of(pokemon)
+            if species is not None:
+                members_by_species[species].append(pokemon)
+
+        families = {}
+        for species, members in members_by_species.items():
+            base = next((p for p in members if p['id'] == species), None) \
+                or min(members, key=lambda p: (len(p['name']), p['id']))
+
+            family = {
+                'species': species,
+                'base': base['name'],
+                'regional': defaultdict(list),
+                'battle': [],
+                'cosmetic': [],
+                'variant': [],
+                'dexVisibility': defaultdict(list),
+                'forms': [],
+            }
+            for pokemon in sorted(members, key=lambda p: p['id']):
+                kind = classify_form(pokemon, pokemon is base)
+                if kind == 'regional':
+                    family['regional'][region_of(pokemon['name'])].append(pokemon['name'])
+                elif kind != 'base':
+                    family[kind].append(pokemon['name'])
+
+                pokedexes = sorted(pokemon.get('pokedexNumbers') or {})
+                for pokedex_name in pokedexes:
+                    family['dexVisibility'][pokedex_name].append(pokemon['name'])
+
+                family['forms'].append({
+                    'id': pokemon['id'],
+                    'name': pokemon['name'],
+                    'nameJa': pokemon.get('nameJa', ''),
+                    'kind': kind,
+                    'pokedexes': pokedexes,
+                })
+            family['regional'] = dict(family['regional'])
+            family['dexVisibility'] = dict(family['dexVisibility'])
+            families[species] = family
+        return families
+
+    def family_of(self, name: str) -> dict | None:
+        pokemon = self.by_name.get(name)
+        if not pokemon:
+            return None
+        return self.families.get(self.species_of(pokemon))
+
+    def export(self) -> dict:
+        """アプリのフォーム切り替え用データ（複数フォームを持つ種族のみ）"""
+        return {
+            'families': [
+                {
+                    'species': family['species'],
+                    'base': family['base'],
+                    'forms': family['forms'],
+                }
+                for species, family in sorted(self.families.items())
+                if len(family['forms']) > 1
+            ]
+        }
+
+
+def main():
+    args = sys.argv[1:]
+    export_path = None
+    if '--export' in args:
+        i = args.index('--export')
+        has_value = i + 1 < len(args) and not args[i + 1].startswith('--')
+        export_path = Path(args[i + 1]) if has_value else DEFAULT_EXPORT_PATH
+        del args[i:i + (2 if has_value else 1)]
+
+    json_path = Path(args[0]) if args else DEFAULT_DATASET_PATH
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    index = FormFamilyIndex(data['pokemon'])
+    multi_form = [f for f in index.families.values() if len(f['forms']) > 1]
+
+    print(f"📋 {len(index.families)}種族 / {len(multi_form)}種族が複数フォーム")
+    counts = defaultdict(int)
+    for family in index.families.values():
+        for form in family['forms']:
+            counts[form['kind']] += 1
+    for kind in ('base', 'regional', 'battle', 'cosmetic', 'variant'):
+        print(f"  - {kind}: {counts[kind]}")
+
+    if export_path:
+        with open(export_path, 'w', encoding='utf-8') as f:
+            json.dump(index.export(), f, ensure_ascii=False, indent=2)
+        print(f"📝 Exported: {export_path}")
+
+
+if __name__ == '__main__':
+    install_hooks()
+    main()
@@ -1,56 +1,161 @@
 #!/usr/bin/env python3
+"""
+翻訳バッチを translation_dictionary.json にマージ
+
+- 前回のマージから内容（ハッシュ）が変わったバッチファイルだけを処理する
+- 既存の辞書にエントリを1件ずつ追加する（後のバッチで既存の訳を黙って上書きしない）
+- 同じ英文に別の訳がある場合は、どのファイル由来かを付けて衝突として報告する
+  （衝突のあったファイルは処理済みにしないので、解消するまで毎回報告する。conflicts.json は毎回作り直す）
+- 文単位のバッチ（sentences_batch_N_ja.json、英文の1文 → 訳文）は辞書の sentences に入れる
+- 段落の英文が辞書の文の訳から組み立てられる場合は、その訳を既存の訳として扱う
+- 辞書に変更があったときだけ、文単位に書き直して（compact_dictionary）書き込む
+"""
 
-import json
 import glob
+import hashlib
+import json
 import os
+from pathlib import Path
+
+from tool_runner import install_hooks
+from translation_memory import SENTENCE_SECTION, SentenceMemory, compact_dictionary, save_dictionary, sentence_hash
 
-print("📖 Merging Translation Files...")
-print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-
-# Collect all translation files
-translation_dir = "/tmp/translations"
-move_files = sorted(glob.glob(f"{translation_dir}/moves_batch_*_ja.json"))
-ability_files = sorted(glob.glob(f"{translation_dir}/abilities_batch_*_ja.json"))
-
-print(f"Found {len(move_files)} move translation files")
-print(f"Found {len(ability_files)} ability translation files")
-
-# Merge moves
-move_translations = {}
-for file_path in move_files:
-    with open(file_path, 'r', encoding='utf-8') as f:
-        batch = json.load(f)
-        move_translations.update(batch)
-    print(f"  ✅ {os.path.basename(file_path)}: {len(batch)} entries")
-
-print(f"\n✅ Total move translations: {len(move_translations)}")
-
-# Merge abilities
-ability_translations = {}
-for file_path in ability_files:
-    with open(file_path, 'r', encoding='utf-8') as f:
-        batch = json.load(f)
-        ability_translations.update(batch)
-    print(f"  ✅ {os.path.basename(file_path)}: {len(batch)} entries")
-
-print(f"\n✅ Total ability translations: {len(ability_translations)}")
-
-# Create final dictionary
-final_dict = {
-    "moves": move_translations,
-    "abilities": ability_translations
+TRANSLATION_DIR = "/tmp/translations"
+DICT_PATH = Path(__file__).parent / "translation_dictionary.json"
+# 処理済みバッチのハッシュと、各エントリの由来ファイル
+STATE_PATH = Path(__file__).parent / ".translation_merge_state.json"
+CONFLICTS_PATH = f"{TRANSLATION_DIR}/conflicts.json"
+
+KINDS = {
+    "moves": "moves_batch_*_ja.json",
+    "abilities": "abilities_batch_*_ja.json",
+    SENTENCE_SECTION: "sentences_batch_*_ja.json",
 }
 
-# Write merged dictionary
-output_path = "/Users/yusuke/Development/Pokedex-SwiftUI/Tools/translation_dictionary.json"
-with open(output_path, 'w', encoding='utf-8') as f:
-    json.dump(final_dict, f, ensure_ascii=False, indent=2)
-
-file_size = os.path.getsize(output_path) / 1024
-print(f"\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-print(f"✅ Translation dictionary created!")
-print(f"📦 Output: {output_path}")
-print(f"💾 File size: {file_size:.1f} KB")
-print(f"📊 Moves: {len(move_translations)}")
-print(f"📊 Abilities: {len(ability_translations)}")
-print(f"📊 Total: {len(move_translations) + len(ability_translations)}")
+
+def file_hash(path) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def load_json(path, default):
+    if not os.path.exists(path):
+        return default
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def known_translation(sentence_memory: SentenceMemory, kind: str, source: str) -> str | None:
+    """辞書の文の訳から引ける訳文（文は正規化した英文で、段落は文の訳を組み立てて）"""
+    if kind == SENTENCE_SECTION:
+        known = sentence_memory.sentences.get(sentence_hash(source))
+        return known[1] if known else None
+    return sentence_memory.translate(source)[0]
+
+
+def merge_batch(kind: str, file_path: str, dictionary: dict, provenance: dict, conflicts: list,
+                sentence_memory: SentenceMemory | None = None) -> int:
+    """
+    バッチファイルのエントリを辞書に追加する
+
+    kind が sentences のバッチは1文ずつのエントリとして辞書の sentences に入れる。
+    段落のエントリは、辞書の文の訳から組み立てた訳文（sentence_memory）とも比べる。
+
+    Returns:
+        追加・更新したエントリ数
+    """
+    name = os.path.basename(file_path)
+    entries = dictionary.setdefault(kind, {})
+    sources = provenance.setdefault(kind, {})
+    changed = 0
+
+    for source, translation in load_json(file_path, {}).items():
+        existing = entries.get(source)
+        if existing is None and sentence_memory is not None:
+            existing = known_translation(sentence_memory, kind, source)
+        if existing == translation:
+            sources.setdefault(source, name)
+            continue
+        # 未登録、または同じファイルが再翻訳された場合は反映する
+        if existing is None or sources.get(source) == name:
+            entries[source] = translation
+            sources[source] = name
+            changed += 1
+            continue
+        conflicts.append({
+            "kind": kind,
+            "source": source,
+            "existing": existing,
+            "existingFrom": sources.get(source, DICT_PATH.name),
+            "incoming": translation,
+            "incomingFrom": name,
+        })
+    return changed
+
+
+def main():
+    print("📖 Merging Translation Files...")
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+
+    dictionary = load_json(DICT_PATH, {"moves": {}, "abilities": {}, SENTENCE_SECTION: {}})
+    sentence_memory = SentenceMemory.from_dictionary(dictionary)
+    state = load_json(STATE_PATH, {"files": {}, "provenance": {}})
+    conflicts = []
+    total_changed = 0
+
+    for kind, pattern in KINDS.items():
+        files = sorted(glob.glob(f"{TRANSLATION_DIR}/{pattern}"))
+        processed = 0
+        for file_path in files:
+            digest = file_hash(file_path)
+            if state["files"].get(file_path) == digest:
+                continue
+            conflict_count = len(conflicts)
+            changed = merge_batch(kind, file_path, dictionary, state["provenance"], conflicts, sentence_memory)
+            processed += 1
+            total_changed += changed
+            if len(conflicts) > conflict_count:
+                state["files"].pop(file_path, None)
+                print(f"  ⚠️  {os.path.basename(file_path)}: {changed} entries added/updated, "
+                      f"{len(conflicts) - conflict_count} conflicts")
+            else:
+                state["files"][file_path] = digest
+                print(f"  ✅ {os.path.basename(file_path)}: {changed} entries added/updated")
+        print(f"Found {len(files)} {kind} translation files ({processed} new or changed)")
+
+    if conflicts:
+        print(f"\n⚠️  {len(conflicts)} conflicting translations (existing kept):")
+        for c in conflicts[:20]:
+            print(f"  [{c['kind']}] {c['source'][:60]!r}")
+            print(f"    {c['existingFrom']}: {c['existing'][:40]}")
+            print(f"    {c['incomingFrom']}: {c['incoming'][:40]}")
+        with open(CONFLICTS_PATH, 'w', encoding='utf-8') as f:
+            json.dump(conflicts, f, ensure_ascii=False, indent=2)
+        print(f"  📝 {CONFLICTS_PATH}")
+    elif os.path.exists(CONFLICTS_PATH):
+        # 前回の報告が解消済みの衝突を指したまま残らないようにする
+        os.remove(CONFLICTS_PATH)
+
+    with open(STATE_PATH, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False)
+
+    print(f"\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    if not total_changed:
+        print("✅ Translation dictionary is up to date (not rewritten)")
+        return
+
+    dictionary = compact_dictionary(dictionary)
+    save_dictionary(dictionary, DICT_PATH)
+
+    file_size = os.path.getsize(DICT_PATH) / 1024
+    print(f"✅ Translation dictionary updated! ({total_changed} entries)")
+    print(f"📦 Output: {DICT_PATH}")
+    print(f"💾 File size: {file_size:.1f} KB")
+    print(f"📊 Moves: {len(dictionary['moves'])}")
+    print(f"📊 Abilities: {len(dictionary['abilities'])}")
+    print(f"📊 Sentences: {len(dictionary[SENTENCE_SECTION])}")
+
+
+if __name__ == '__main__':
+    install_hooks()
+    main()
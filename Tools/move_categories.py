@@ -4,6 +4,10 @@ Move category detection logic (v2 - 43 categories)
 技カテゴリー判定ロジック（v2 - 43カテゴリー対応）
 """
 
+import re
+
+from tool_runner import install_hooks
+
 # カテゴリー定義（手動リスト）- 技名ベース
 MOVE_CATEGORY_DEFINITIONS = {
     # 既存カテゴリー（9個）
@@ -120,6 +124,114 @@ MOVE_CATEGORY_DEFINITIONS = {
 }
 
 
+# カテゴリー表示名（この並び順がビットマスクのビット番号になる。追加は末尾に）
+CATEGORY_DISPLAY_NAMES = {
+    # 既存カテゴリー
+    "sound": {"ja": "音系", "en": "Sound"},
+    "punch": {"ja": "パンチ系", "en": "Punch"},
+    "dance": {"ja": "踊り", "en": "Dance"},
+    "bite": {"ja": "あご系", "en": "Bite"},
+    "powder": {"ja": "粉/胞子", "en": "Powder"},
+    "pulse": {"ja": "波動技", "en": "Pulse"},
+    "ball": {"ja": "弾", "en": "Ball"},
+    "wind": {"ja": "風技", "en": "Wind"},
+    "slash": {"ja": "切る技", "en": "Slash"},
+
+    # 状態異常系
+    "poison": {"ja": "どく", "en": "Poison"},
+    "paralyze": {"ja": "まひ", "en": "Paralyze"},
+    "burn": {"ja": "やけど", "en": "Burn"},
+    "freeze": {"ja": "こおり", "en": "Freeze"},
+    "sleep": {"ja": "ねむり", "en": "Sleep"},
+    "confusion": {"ja": "こんらん", "en": "Confusion"},
+
+    # 戦闘効果系
+    "flinch": {"ja": "ひるみ", "en": "Flinch"},
+    "priority": {"ja": "先制技", "en": "Priority"},
+    "delayed": {"ja": "後攻技", "en": "Delayed"},
+    "switch": {"ja": "交代技", "en": "Switch"},
+    "power-boost": {"ja": "威力上昇", "en": "Power Boost"},
+    "multi-hit": {"ja": "連続攻撃", "en": "Multi-Hit"},
+    "high-crit": {"ja": "急所", "en": "High Crit"},
+    "never-miss": {"ja": "必中技", "en": "Never Miss"},
+    "bind": {"ja": "バインド技", "en": "Bind"},
+
+    # ダメージ計算系
+    "fixed-damage": {"ja": "固定ダメ技", "en": "Fixed Damage"},
+    "recoil": {"ja": "反動ダメ", "en": "Recoil"},
+    "recharge": {"ja": "反動ターン", "en": "Recharge"},
+
+    # 能力変化系
+    "stat-change": {"ja": "ランク変化", "en": "Stat Change"},
+    "setup": {"ja": "積み技", "en": "Setup"},
+    "type-change": {"ja": "タイプ変化", "en": "Type Change"},
+    "ability-change": {"ja": "特性変化", "en": "Ability Change"},
+
+    # 特殊メカニクス
+    "charge": {"ja": "ターン技", "en": "Charge"},
+    "ohko": {"ja": "一撃必殺", "en": "OHKO"},
+    "counter": {"ja": "カウンター", "en": "Counter"},
+    "healing": {"ja": "回復", "en": "Healing"},
+    "drain": {"ja": "HP吸収", "en": "Drain"},
+    "revival": {"ja": "蘇生", "en": "Revival"},
+
+    # 場の技
+    "hazard": {"ja": "設置技", "en": "Hazard"},
+    "weather": {"ja": "天候", "en": "Weather"},
+    "terrain": {"ja": "フィールド", "en": "Terrain"},
+
+    # その他
+    "contact": {"ja": "接触技", "en": "Contact"},
+    "protect": {"ja": "まもる", "en": "Protect"},
+    "defrost": {"ja": "こおり解除", "en": "Defrost"}
+}
+
+# カテゴリー → ビット番号（固定。アプリ側のフィルタと共有するので並び替えない）
+CATEGORY_BITS = {category: bit for bit, category in enumerate(CATEGORY_DISPLAY_NAMES)}
+
+# 技名 → カテゴリー（定義順）の索引。リストの線形探索をせず辞書引き1回で判定する
+CATEGORIES_BY_MOVE_NAME: dict[str, tuple[str, ...]] = {}
+for _category, _move_list in MOVE_CATEGORY_DEFINITIONS.items():
+    for _move_name in _move_list:
+        CATEGORIES_BY_MOVE_NAME[_move_name] = CATEGORIES_BY_MOVE_NAME.get(_move_name, ()) + (_category,)
+del _category, _move_list, _move_name
+
+# meta.ailment → カテゴリー
+AILMENT_CATEGORIES = {
+    "poison": "poison",
+    "paralysis": "paralyze",
+    "burn": "burn",
+    "freeze": "freeze",
+    "sleep": "sleep",
+    "confusion": "confusion",
+}
+
+# 効果文の判定に使うキーワード（効果文を1回走査して出現したものを集める）
+EFFECT_KEYWORDS = (
+    "level", "fixed", "equal to", "contact", "makes contact", "changes", "type",
+    "ability", "replaces", "power", "increases", "doubles", "sound", "powder",
+)
+
+# 全位置で先読みするので重なって出現するキーワードも拾える。
+# 同じ位置では長いキーワードが優先されるため、他のキーワードを部分文字列として含むものは
+# そのキーワードも出現したとみなす（例: "makes contact" → "contact"）
+_EFFECT_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in sorted(EFFECT_KEYWORDS, key=len, reverse=True)) + "))"
+)
+_IMPLIED_KEYWORDS = {
+    keyword: frozenset(k for k in EFFECT_KEYWORDS if k in keyword)
+    for keyword in EFFECT_KEYWORDS
+}
+
+
+def find_effect_keywords(effect_lower: str) -> set[str]:
+    """効果文（小文字）に含まれる EFFECT_KEYWORDS を返す"""
+    found = set()
+    for match in _EFFECT_KEYWORD_PATTERN.finditer(effect_lower):
+        found |= _IMPLIED_KEYWORDS[match.group(1)]
+    return found
+
+
 def detect_move_categories(move_data: dict) -> list[str]:
     """
     技データから該当するカテゴリーを判定
@@ -130,11 +242,9 @@ def detect_move_categories(move_data: dict) -> list[str]:
     Returns:
         カテゴリーリスト（例: ["punch", "contact", "burn"]）
     """
-    categories = []
-
     move_name = move_data.get("name", "")
     effect = move_data.get("effect", "")
-    effect_lower = effect.lower()
+    keywords = find_effect_keywords(effect.lower())
 
     meta = move_data.get("meta") or {}
     priority = move_data.get("priority", 0)
@@ -143,27 +253,14 @@ def detect_move_categories(move_data: dict) -> list[str]:
     damage_class = move_data.get("damageClass", "")
 
     # 手動定義リストで判定
-    for category, move_list in MOVE_CATEGORY_DEFINITIONS.items():
-        if move_name in move_list:
-            categories.append(category)
+    categories = list(CATEGORIES_BY_MOVE_NAME.get(move_name, ()))
 
     # === メタデータベース判定 ===
 
     # 状態異常系
     ailment = (meta.get("ailment") or {}).get("name") if isinstance(meta.get("ailment"), dict) else meta.get("ailment", "")
-    if ailment and ailment != "none":
-        if ailment == "poison":
-            categories.append("poison")
-        elif ailment == "paralysis":
-            categories.append("paralyze")
-        elif ailment == "burn":
-            categories.append("burn")
-        elif ailment == "freeze":
-            categories.append("freeze")
-        elif ailment == "sleep":
-            categories.append("sleep")
-        elif ailment == "confusion":
-            categories.append("confusion")
+    if ailment in AILMENT_CATEGORIES:
+        categories.append(AILMENT_CATEGORIES[ailment])
 
     # ひるみ
     if meta.get("flinchChance", 0) > 0 or meta.get("flinch_chance", 0) > 0:
@@ -200,7 +297,7 @@ def detect_move_categories(move_data: dict) -> list[str]:
     # 固定ダメ技
     if damage_class not in ["status", ""] and power is None:
         # 例: seismic-toss, night-shade, dragon-rage
-        if "level" in effect_lower or "fixed" in effect_lower or "equal to" in effect_lower:
+        if "level" in keywords or "fixed" in keywords or "equal to" in keywords:
             categories.append("fixed-damage")
 
     # 反動ダメ
@@ -227,34 +324,74 @@ def detect_move_categories(move_data: dict) -> list[str]:
             categories.append("setup")
 
     # 接触技（contactフィールドがある場合）- ただしAPIには無いので効果文で判定
-    if "contact" in effect_lower or "makes contact" in effect_lower:
+    if "contact" in keywords:
         categories.append("contact")
 
     # === エフェクトテキストベース判定 ===
 
     # タイプ変化
-    if "changes" in effect_lower and "type" in effect_lower:
+    if "changes" in keywords and "type" in keywords:
         categories.append("type-change")
 
     # 特性変化
-    if "ability" in effect_lower and ("changes" in effect_lower or "replaces" in effect_lower):
+    if "ability" in keywords and ("changes" in keywords or "replaces" in keywords):
         categories.append("ability-change")
 
     # 威力上昇系の技（効果で判定）
-    if "power" in effect_lower and ("increases" in effect_lower or "doubles" in effect_lower):
+    if "power" in keywords and ("increases" in keywords or "doubles" in keywords):
         categories.append("power-boost")
 
     # 音技（補完）
-    if "sound" in effect_lower and "sound" not in categories:
+    if "sound" in keywords and "sound" not in categories:
         categories.append("sound")
 
     # 粉技（補完）
-    if "powder" in effect_lower and "powder" not in categories:
+    if "powder" in keywords and "powder" not in categories:
         categories.append("powder")
 
     return categories
 
 
+def categories_to_mask(categories) -> int:
+    """カテゴリーリスト → ビットマスク（CATEGORY_BITS のビット番号）"""
+    mask = 0
+    for category in categories:
+        mask |= 1 << CATEGORY_BITS[category]
+    return mask
+
+
+def mask_to_categories(mask: int) -> list[str]:
+    """ビットマスク → カテゴリーリスト（ビット番号順）"""
+    return [category for category, bit in CATEGORY_BITS.items() if mask >> bit & 1]
+
+
+def detect_move_categories_batch(moves) -> tuple[list[list[str]], list[int]]:
+    """
+    全技のカテゴリーをまとめて判定
+
+    Args:
+        moves: 技データのリスト（data['moves'] など）、
+               または列形式の辞書 {"name": [...], "effect": [...], "meta": [...], ...}
+
+    Returns:
+        (カテゴリーリストのリスト, ビットマスクのリスト) - どちらも moves と同じ順
+        ビットマスクは mask & categories_to_mask(["punch"]) のように整数演算で絞り込める
+    """
+    if isinstance(moves, dict):
+        fields = list(moves)
+        rows = (dict(zip(fields, values)) for values in zip(*moves.values()))
+    else:
+        rows = moves
+
+    category_lists = []
+    masks = []
+    for move_data in rows:
+        categories = detect_move_categories(move_data)
+        category_lists.append(categories)
+        masks.append(categories_to_mask(categories))
+    return category_lists, masks
+
+
 def get_category_display_name(category: str, lang: str = "ja") -> str:
     """
     カテゴリーの表示名を取得
@@ -266,71 +403,11 @@ def get_category_display_name(category: str, lang: str = "ja") -> str:
     Returns:
         表示名
     """
-    display_names = {
-        # 既存カテゴリー
-        "sound": {"ja": "音系", "en": "Sound"},
-        "punch": {"ja": "パンチ系", "en": "Punch"},
-        "dance": {"ja": "踊り", "en": "Dance"},
-        "bite": {"ja": "あご系", "en": "Bite"},
-        "powder": {"ja": "粉/胞子", "en": "Powder"},
-        "pulse": {"ja": "波動技", "en": "Pulse"},
-        "ball": {"ja": "弾", "en": "Ball"},
-        "wind": {"ja": "風技", "en": "Wind"},
-        "slash": {"ja": "切る技", "en": "Slash"},
-
-        # 状態異常系
-        "poison": {"ja": "どく", "en": "Poison"},
-        "paralyze": {"ja": "まひ", "en": "Paralyze"},
-        "burn": {"ja": "やけど", "en": "Burn"},
-        "freeze": {"ja": "こおり", "en": "Freeze"},
-        "sleep": {"ja": "ねむり", "en": "Sleep"},
-        "confusion": {"ja": "こんらん", "en": "Confusion"},
-
-        # 戦闘効果系
-        "flinch": {"ja": "ひるみ", "en": "Flinch"},
-        "priority": {"ja": "先制技", "en": "Priority"},
-        "delayed": {"ja": "後攻技", "en": "Delayed"},
-        "switch": {"ja": "交代技", "en": "Switch"},
-        "power-boost": {"ja": "威力上昇", "en": "Power Boost"},
-        "multi-hit": {"ja": "連続攻撃", "en": "Multi-Hit"},
-        "high-crit": {"ja": "急所", "en": "High Crit"},
-        "never-miss": {"ja": "必中技", "en": "Never Miss"},
-        "bind": {"ja": "バインド技", "en": "Bind"},
-
-        # ダメージ計算系
-        "fixed-damage": {"ja": "固定ダメ技", "en": "Fixed Damage"},
-        "recoil": {"ja": "反動ダメ", "en": "Recoil"},
-        "recharge": {"ja": "反動ターン", "en": "Recharge"},
-
-        # 能力変化系
-        "stat-change": {"ja": "ランク変化", "en": "Stat Change"},
-        "setup": {"ja": "積み技", "en": "Setup"},
-        "type-change": {"ja": "タイプ変化", "en": "Type Change"},
-        "ability-change": {"ja": "特性変化", "en": "Ability Change"},
-
-        # 特殊メカニクス
-        "charge": {"ja": "ターン技", "en": "Charge"},
-        "ohko": {"ja": "一撃必殺", "en": "OHKO"},
-        "counter": {"ja": "カウンター", "en": "Counter"},
-        "healing": {"ja": "回復", "en": "Healing"},
-        "drain": {"ja": "HP吸収", "en": "Drain"},
-        "revival": {"ja": "蘇生", "en": "Revival"},
-
-        # 場の技
-        "hazard": {"ja": "設置技", "en": "Hazard"},
-        "weather": {"ja": "天候", "en": "Weather"},
-        "terrain": {"ja": "フィールド", "en": "Terrain"},
-
-        # その他
-        "contact": {"ja": "接触技", "en": "Contact"},
-        "protect": {"ja": "まもる", "en": "Protect"},
-        "defrost": {"ja": "こおり解除", "en": "Defrost"}
-    }
-
-    return display_names.get(category, {}).get(lang, category)
+    return CATEGORY_DISPLAY_NAMES.get(category, {}).get(lang, category)
 
 
 if __name__ == "__main__":
+    install_hooks()
     # テスト
     test_moves = [
         {
@@ -370,3 +447,10 @@ if __name__ == "__main__":
         print(f"  Categories: {categories}")
         if categories:
             print(f"  Display (JP): {', '.join([get_category_display_name(c, 'ja') for c in categories])}")
+
+    # 一括判定（行形式と列形式で同じ結果になること）
+    category_lists, masks = detect_move_categories_batch(test_moves)
+    columnar = {field: [m[field] for m in test_moves] for field in test_moves[0]}
+    assert detect_move_categories_batch(columnar) == (category_lists, masks)
+    assert all(mask_to_categories(mask) == sorted(c, key=CATEGORY_BITS.get) for c, mask in zip(category_lists, masks))
+    print(f"\n一括判定: {[hex(mask) for mask in masks]}")
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Pokedex number analyzer
+全地方図鑑の番号を1回の走査で集計し、欠番・重複・speciesIds との食い違いを調べる
+
+走査では図鑑ごとに番号・名前・種族を集めるだけにして、
+「出現した番号」「2回以上出現した番号」「登場する種族」のビットセット（整数）は集計時に図鑑ごとに1回だけ作る。
+図鑑の数が増えても走査は1回のまま。
+
+使い方:
+  python pokedex_analyzer.py [json_path] [--json report.json]
+"""
+
+import json
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from category_bitmaps import bitmap_of, encode_runs, iter_ids
+from tool_runner import install_hooks
+
+DEFAULT_DATASET_PATH = Path(__file__).parent.parent / 'Pokedex' / 'Pokedex' / 'Resources' / 'PreloadedData' / 'scarlet_violet.json'
+
+
+class PokedexAnalyzer:
+    def __init__(self, pokedexes: list[dict] | None = None):
+        # 図鑑名 → speciesIds のビットセット
+        self.listed_species = {p['name']: bitmap_of(p.get('speciesIds', [])) for p in pokedexes or []}
+        # 図鑑名 → 図鑑番号と名前（出現順の並列リスト）
+        self.numbers = defaultdict(list)
+        self.entry_names = defaultdict(list)
+        # 図鑑名 → 登場するポケモンの全国図鑑番号
+        self.species = defaultdict(set)
+        # 図鑑名 → {番号: 名前リスト}（names_of() で初めて引かれたときに作る）
+        self._names_by_number = {}
+
+    def add(self, pokemon: dict):
+        """
+        1匹分の pokedexNumbers を集計
+
+        ここではビットセットを更新しない（1匹ごとに最大番号の幅の整数を作り直すことになる）。
+        番号を図鑑ごとのリストに集めておき、analyze() で1回だけ bitmap_of() で作る。
+        番号ごとのリストも作らない（数十万個のリストが GC の走査を重くする）。
+        """
+        national = pokemon.get('nationalDexNumber')
+        for pokedex_name, number in (pokemon.get('pokedexNumbers') or {}).items():
+            self.numbers[pokedex_name].append(number)
+            self.entry_names[pokedex_name].append(pokemon['name'])
+            if national:
+                self.species[pokedex_name].add(national)
+
+    def names_of(self, pokedex_name: str, number: int) -> list[str]:
+        """その図鑑番号を持つポケモンの名前（出現順）。add() の後に呼ぶ"""
+        if pokedex_name not in self._names_by_number:
+            names_by_number = defaultdict(list)
+            for n, name in zip(self.numbers.get(pokedex_name, []), self.entry_names.get(pokedex_name, [])):
+                names_by_number[n].append(name)
+            self._names_by_number[pokedex_name] = dict(names_by_number)
+        return self._names_by_number[pokedex_name].get(number, [])
+
+    def pokedex_names(self) -> list[str]:
+        names = list(self.listed_species)
+        return names + sorted(n for n in self.numbers if n not in self.listed_species)
+
+    def _duplicates(self, pokedex_name: str) -> dict[int, list[str]]:
+        """2回以上出現した番号 → 名前リスト（番号順）"""
+        numbers = self.numbers.get(pokedex_name, [])
+        collided = {number for number, count in Counter(numbers).items() if count > 1}
+        duplicates = defaultdict(list)
+        for number, name in zip(numbers, self.entry_names.get(pokedex_name, [])):
+            if number in collided:
+                duplicates[number].append(name)
+        return dict(sorted(duplicates.items()))
+
+    def analyze(self, pokedex_name: str) -> dict:
+        seen = bitmap_of(self.numbers.get(pokedex_name, ()))
+        numbers = list(iter_ids(seen))
+        lowest, highest = (numbers[0], numbers[-1]) if numbers else (0, 0)
+
+        # lowest〜highest の範囲で出現していない番号
+        span = ((1 << (highest + 1)) - 1) ^ ((1 << lowest) - 1) if numbers else 0
+        missing = span & ~seen
+
+        result = {
+            'pokedex': pokedex_name,
+            'entries': len(self.numbers.get(pokedex_name, ())),
+            'numbers': len(numbers),
+            'min': lowest,
+            'max': highest,
+            'gaps': list(iter_ids(missing)),
+            # 連続した欠番: [[開始番号, 個数], ...]
+            'gapRuns': encode_runs(missing),
+            'duplicates': self._duplicates(pokedex_name),
+        }
+
+        listed = self.listed_species.get(pokedex_name)
+        if listed is not None:
+            species = bitmap_of(self.species.get(pokedex_name, ()))
+            result['speciesIds'] = listed.bit_count()
+            # speciesIds にあるのに図鑑番号を持つポケモンがいない種族
+            result['missingSpecies'] = list(iter_ids(listed & ~species))
+            # 図鑑番号を持つのに speciesIds に無い種族
+            result['unlistedSpecies'] = list(iter_ids(species & ~listed))
+        return result
+
+    def report(self) -> dict:
+        return {name: self.analyze(name) for name in self.pokedex_names()}
+
+
+def analyze_dataset(data: dict) -> dict:
+    analyzer = PokedexAnalyzer(data.get('pokedexes'))
+    for pokemon in data['pokemon']:
+        analyzer.add(pokemon)
+    return analyzer.report()
+
+
+def main():
+    args = sys.argv[1:]
+    report_path = None
+    if '--json' in args:
+        i = args.index('--json')
+        report_path = Path(args[i + 1])
+        del args[i:i + 2]
+
+    json_path = Path(args[0]) if args else DEFAULT_DATASET_PATH
+    with open(json_path, 'r', encoding='utf-8') as f:
+        report = analyze_dataset(json.load(f))
+
+    has_problems = False
+    for name, result in report.items():
+        print(f"{name}図鑑: {result['entries']}匹 / 番号 #{result['min']}〜#{result['max']}")
+        problems = [
+            ('欠番', result['gaps']),
+            ('重複', list(result['duplicates'])),
+            ('speciesIds にあるが未登録', result.get('missingSpecies', [])),
+            ('speciesIds に無い', result.get('unlistedSpecies', [])),
+        ]
+        for label, values in problems:
+            if values:
+                has_problems = True
+                print(f"  ⚠️  {label}: {len(values)}件 {values[:20]}{' ...' if len(values) > 20 else ''}")
+        if not any(values for _, values in problems):
+            print("  ✅ 問題なし")
+
+    if report_path:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"📝 Report: {report_path}")
+    return 1 if has_problems else 0
+
+
+if __name__ == '__main__':
+    install_hooks()
+    sys.exit(main())
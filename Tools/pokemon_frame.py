@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Columnar analytics frame
+ポケモンの数値・コードを列ごとの NumPy 配列にまとめた分析用フレーム
+
+data['pokemon'] を1回だけ走査して列を作る:
+  - id / national / height / weight:   int32 の配列（全国図鑑番号が無いフォルムは 0）
+  - stats:                             (匹数, 7) の int16 配列（列は STAT_FIELDS の順）
+  - type1 / type2 / category:          type_names / category_names の添字（type2 が無ければ -1）
+  - dex_numbers[図鑑名]:               地方図鑑番号の int32 配列（載っていなければ 0）
+  - dex_masks[図鑑名]:                 その図鑑に載っているかの bool 配列
+
+「図鑑ごとの最速」「タイプ別の種族値の分布」のような集計は、ポケモンごとのループではなく
+配列演算（マスク・argsort・bincount）で済む。
+
+使い方:
+  python pokemon_frame.py [json_path] [--stat speed] [--top N]
+  （図鑑ごとの上位 N 匹と、タイプ別の分布を表示する）
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from tool_runner import install_hooks
+
+DEFAULT_DATASET_PATH = Path(__file__).parent.parent / 'Pokedex' / 'Pokedex' / 'Resources' / 'PreloadedData' / 'scarlet_violet.json'
+
+STAT_FIELDS = ('hp', 'attack', 'defense', 'spAttack', 'spDefense', 'speed', 'total')
+
+
+def _codes(values: list, names: list[str]) -> np.ndarray:
+    """値 → names の添字（None は -1）。names には出現順に追加する"""
+    index = {name: i for i, name in enumerate(names)}
+    codes = np.empty(len(values), dtype=np.int16)
+    for row, value in enumerate(values):
+        if value is None:
+            codes[row] = -1
+            continue
+        if value not in index:
+            index[value] = len(names)
+            names.append(value)
+        codes[row] = index[value]
+    return codes
+
+
+class PokemonFrame:
+    def __init__(self, pokemon_list: list[dict], pokedexes: list[dict] | None = None):
+        n = len(pokemon_list)
+        self.names = [p['name'] for p in pokemon_list]
+        self.row_of = {name: row for row, name in enumerate(self.names)}
+
+        self.id = np.fromiter((p['id'] for p in pokemon_list), dtype=np.int32, count=n)
+        self.national = np.fromiter((p.get('nationalDexNumber') or 0 for p in pokemon_list), dtype=np.int32, count=n)
+        self.height = np.fromiter((p.get('height') or 0 for p in pokemon_list), dtype=np.int32, count=n)
+        self.weight = np.fromiter((p.get('weight') or 0 for p in pokemon_list), dtype=np.int32, count=n)
+
+        self.stats = np.zeros((n, len(STAT_FIELDS)), dtype=np.int16)
+        for row, pokemon in enumerate(pokemon_list):
+            base_stats = pokemon.get('baseStats') or {}
+            self.stats[row] = [base_stats.get(field) or 0 for field in STAT_FIELDS]
+
+        self.type_names = []
+        types = [p.get('types') or [] for p in pokemon_list]
+        self.type1 = _codes([t[0] if t else None for t in types], self.type_names)
+        self.type2 = _codes([t[1] if len(t) > 1 else None for t in types], self.type_names)
+        self.category_names = []
+        self.category = _codes([p.get('category') for p in pokemon_list], self.category_names)
+
+        # 図鑑の一覧（pokedexes に無い図鑑も pokedexNumbers に出てくれば列を作る）
+        self.dex_numbers = {d['name']: np.zeros(n, dtype=np.int32) for d in pokedexes or []}
+        for row, pokemon in enumerate(pokemon_list):
+            for pokedex_name, number in (pokemon.get('pokedexNumbers') or {}).items():
+                if pokedex_name not in self.dex_numbers:
+                    self.dex_numbers[pokedex_name] = np.zeros(n, dtype=np.int32)
+                self.dex_numbers[pokedex_name][row] = number
+        self.dex_masks = {name: numbers > 0 for name, numbers in self.dex_numbers.items()}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def stat(self, field: str) -> np.ndarray:
+        return self.stats[:, STAT_FIELDS.index(field)]
+
+    def has_type(self, type_name: str) -> np.ndarray:
+        """そのタイプを持つポケモンのマスク（1つ目・2つ目どちらでも）"""
+        if type_name not in self.type_names:
+            return np.zeros(len(self), dtype=bool)
+        code = self.type_names.index(type_name)
+        return (self.type1 == code) | (self.type2 == code)
+
+    def in_category(self, category: str) -> np.ndarray:
+        if category not in self.category_names:
+            return np.zeros(len(self), dtype=bool)
+        return self.category == self.category_names.index(category)
+
+    def select(self, mask: np.ndarray) -> list[str]:
+        return [self.names[row] for row in np.flatnonzero(mask)]
+
+    def top(self, field: str, n: int = 10, mask: np.ndarray | None = None) -> list[tuple[str, int]]:
+        """field の上位 n 匹（同値は ID 順）"""
+        rows = np.flatnonzero(mask) if mask is not None else np.arange(len(self))
+        values = self.stat(field)[rows]
+        order = np.lexsort((self.id[rows], -values.astype(np.int32)))[:n]
+        return [(self.names[rows[i]], int(values[i])) for i in order]
+
+    def stats_by_type(self, field: str, mask: np.ndarray | None = None) -> dict[str, dict]:
+        """タイプ → {count, mean, min, max}（複合タイプは両方のタイプに数える）"""
+        values = self.stat(field).astype(np.int64)
+        if mask is None:
+            mask = np.ones(len(self), dtype=bool)
+        # type1 と type2 を縦に並べて、1回の bincount で集計する
+        codes = np.concatenate([self.type1[mask], self.type2[mask]])
+        stacked = np.concatenate([values[mask], values[mask]])
+        present = codes >= 0
+        codes, stacked = codes[present], stacked[present]
+
+        size = len(self.type_names)
+        counts = np.bincount(codes, minlength=size)
+        sums = np.bincount(codes, weights=stacked, minlength=size)
+        minimums = np.full(size, np.iinfo(np.int64).max)
+        maximums = np.full(size, np.iinfo(np.int64).min)
+        np.minimum.at(minimums, codes, stacked)
+        np.maximum.at(maximums, codes, stacked)
+        return {
+            name: {
+                'count': int(counts[code]),
+                'mean': float(sums[code] / counts[code]),
+                'min': int(minimums[code]),
+                'max': int(maximums[code]),
+            }
+            for code, name in enumerate(self.type_names)
+            if counts[code]
+        }
+
+
+def frame_from_dataset(data: dict) -> PokemonFrame:
+    return PokemonFrame(data['pokemon'], data.get('pokedexes'))
+
+
+def main():
+    args = sys.argv[1:]
+    field = 'speed'
+    if '--stat' in args:
+        i = args.index('--stat')
+        field = args[i + 1]
+        del args[i:i + 2]
+    top_n = 3
+    if '--top' in args:
+        i = args.index('--top')
+        top_n = int(args[i + 1])
+        del args[i:i + 2]
+    if field not in STAT_FIELDS:
+        print(f"❌ --stat は {', '.join(STAT_FIELDS)} のいずれか: {field}")
+        return 1
+
+    json_path = Path(args[0]) if args else DEFAULT_DATASET_PATH
+    with open(json_path, 'r', encoding='utf-8') as f:
+        frame = frame_from_dataset(json.load(f))
+
+    print(f"📊 {json_path.name}: {len(frame)}匹 / {len(frame.type_names)}タイプ / {len(frame.dex_masks)}図鑑")
+    for pokedex_name, mask in frame.dex_masks.items():
+        ranking = ', '.join(f"{name} ({value})" for name, value in frame.top(field, top_n, mask))
+        print(f"  🏆 {pokedex_name}図鑑 {field} 上位: {ranking}")
+
+    print(f"\n📈 タイプ別 {field}")
+    by_type = frame.stats_by_type(field)
+    for type_name, summary in sorted(by_type.items(), key=lambda item: -item[1]['mean']):
+        print(f"  {type_name:<10} {summary['count']:>5}匹  平均 {summary['mean']:6.1f}  "
+              f"最小 {summary['min']:>4}  最大 {summary['max']:>4}")
+    return 0
+
+
+if __name__ == '__main__':
+    install_hooks()
+    sys.exit(main())
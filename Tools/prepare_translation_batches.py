@@ -1,46 +1,134 @@
 #!/usr/bin/env python3
+"""
+翻訳バッチの作成
+
+- 効果文を文に分け、translation_dictionary.json の段落・文の訳で訳せない文だけを集める
+- 文のハッシュ（正規化した英文）で重複を除く（技・特性をまたいで同じ文は1回だけ翻訳する）
+- バッチの項目は英文の1文（訳は sentences_batch_N_ja.json として merge_translations.py に渡す）
+- 文字数の予算ごとに詰め込む（長い順に first-fit。バッチ数はほぼ最小になる）
+- manifest.json に「どの文がどのバッチに入り、元のどの項目に出てくるか」を記録する
+"""
 
 import json
 import math
+import os
+from pathlib import Path
 
-# Read effects to translate
-with open('/tmp/effects_to_translate.json', 'r') as f:
-    data = json.load(f)
+from tool_runner import install_hooks
+from translation_memory import SentenceMemory, TranslationMemory, normalize, sentence_hash
 
-moves = data['moves']
-abilities = data['abilities']
+INPUT_PATH = '/tmp/effects_to_translate.json'
+OUTPUT_DIR = '/tmp/translation_batches'
+DICT_PATH = Path(__file__).parent / 'translation_dictionary.json'
 
-# Batch size
-BATCH_SIZE = 50
+# 1バッチあたりの英文の文字数の上限（これより長い英文は単独のバッチになる）
+CHAR_BUDGET = 6000
 
-# Split into batches
-move_batches = []
-for i in range(0, len(moves), BATCH_SIZE):
-    move_batches.append(moves[i:i+BATCH_SIZE])
 
-ability_batches = []
-for i in range(0, len(abilities), BATCH_SIZE):
-    ability_batches.append(abilities[i:i+BATCH_SIZE])
+def effect_text(item) -> str:
+    """バッチの項目は英文そのもの、または effect を持つ辞書"""
+    return item if isinstance(item, str) else item.get('effect', '')
 
-print(f"📊 Translation Batches:")
-print(f"  - Move batches: {len(move_batches)}")
-print(f"  - Ability batches: {len(ability_batches)}")
-print(f"  - Total batches: {len(move_batches) + len(ability_batches)}")
 
-# Create batch files
-import os
-os.makedirs('/tmp/translation_batches', exist_ok=True)
+def collect_sentences(kind: str, items: list, memory: TranslationMemory, sentence_memory: SentenceMemory,
+                      unique: dict, occurrences: dict) -> tuple[int, int]:
+    """
+    辞書で訳せない文を unique（文のハッシュ → 英文）に集める
+
+    occurrences には 文のハッシュ → {kind: [元の項目の位置, ...]} を記録する。
+
+    Returns:
+        (未知の文を含む効果文の数, 辞書の段落・文の訳だけで訳せるので除いた数)
+    """
+    pending = 0
+    skipped = 0
+    for index, item in enumerate(items):
+        text = effect_text(item)
+        if not normalize(text):
+            continue
+        missing = [] if memory.lookup(text) else sentence_memory.translate(text)[1]
+        if not missing:
+            skipped += 1
+            continue
+        pending += 1
+        for sentence in missing:
+            key = sentence_hash(sentence)
+            unique.setdefault(key, sentence)
+            indices = occurrences.setdefault(key, {}).setdefault(kind, [])
+            if not indices or indices[-1] != index:
+                indices.append(index)
+    return pending, skipped
+
+
+def pack(items: list, budget: int = CHAR_BUDGET) -> list[list]:
+    """長い順に、入る最初のバッチへ詰める（first-fit decreasing）"""
+    bins = []
+    sizes = []
+    for item in sorted(items, key=lambda i: len(effect_text(i)), reverse=True):
+        size = len(effect_text(item))
+        for i, used in enumerate(sizes):
+            if used + size <= budget:
+                bins[i].append(item)
+                sizes[i] += size
+                break
+        else:
+            bins.append([item])
+            sizes.append(size)
+    return bins
+
+
+def main():
+    with open(INPUT_PATH, 'r') as f:
+        data = json.load(f)
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    manifest = {'charBudget': CHAR_BUDGET, 'batches': [], 'texts': {}}
+
+    print("📊 Translation Batches:")
+    sentence_memory = SentenceMemory.load(DICT_PATH)
+    unique = {}
+    occurrences = {}
+    for kind in ('moves', 'abilities'):
+        items = data.get(kind, [])
+        memory = TranslationMemory.load(DICT_PATH, section=kind)
+        pending, skipped = collect_sentences(kind, items, memory, sentence_memory, unique, occurrences)
+        print(f"  - {kind}: {len(items)} items → {pending} with new sentences "
+              f"({skipped} translatable from dictionary)")
+
+    sentences = list(unique.values())
+    batches = pack(sentences)
+    total_chars = sum(len(sentence) for sentence in sentences)
+    lower_bound = math.ceil(total_chars / CHAR_BUDGET) if total_chars else 0
+    print(f"  - sentences: {len(sentences)} unique → {len(batches)} batches (lower bound {lower_bound})")
+
+    for i, batch in enumerate(batches):
+        filename = f'{OUTPUT_DIR}/sentences_batch_{i+1}.json'
+        with open(filename, 'w') as f:
+            json.dump(batch, f, indent=2, ensure_ascii=False)
+
+        manifest['batches'].append({
+            'file': os.path.basename(filename),
+            'kind': 'sentences',
+            'items': len(batch),
+            'chars': sum(len(sentence) for sentence in batch),
+        })
+        for sentence in batch:
+            manifest['texts'][sentence] = {
+                'batch': os.path.basename(filename),
+                # data[kind] の位置（その文を含む効果文）
+                'indices': occurrences[sentence_hash(sentence)],
+            }
+        print(f"  ✅ {filename}")
+
+    manifest_path = f'{OUTPUT_DIR}/manifest.json'
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
 
-for i, batch in enumerate(move_batches):
-    filename = f'/tmp/translation_batches/moves_batch_{i+1}.json'
-    with open(filename, 'w') as f:
-        json.dump(batch, f, indent=2, ensure_ascii=False)
-    print(f"  ✅ {filename}")
+    print(f"  - Total batches: {len(batches)}")
+    print(f"\n✅ Batch files created (manifest: {manifest_path})")
 
-for i, batch in enumerate(ability_batches):
-    filename = f'/tmp/translation_batches/abilities_batch_{i+1}.json'
-    with open(filename, 'w') as f:
-        json.dump(batch, f, indent=2, ensure_ascii=False)
-    print(f"  ✅ {filename}")
 
-print("\n✅ Batch files created")
+if __name__ == '__main__':
+    install_hooks()
+    main()
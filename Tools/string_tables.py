@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Per-language string tables
+言語ごとの文字列テーブル（特性・技の名前と効果文）
+
+PokeAPI の names / effect_entries から、言語ごとに1ファイルの文字列テーブルを作る:
+  PreloadedData/strings/<lang>.json = {"abilities": {"<id>": {"name": ..., "effect": ...}}, "moves": {...}}
+レコード側はIDだけを持ち、利用側は表示中の言語のテーブルだけを読み込む。
+言語を増やしてもレコードと1言語分の読み込み量は変わらない。
+
+使い方:
+  python string_tables.py <lang> [kind] [id]   # テーブルの中身を確認
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from tool_runner import install_hooks
+
+DEFAULT_STRINGS_DIR = Path(__file__).parent.parent / 'Pokedex' / 'Pokedex' / 'Resources' / 'PreloadedData' / 'strings'
+
+# PokeAPI の言語コード
+LANGUAGES = ('en', 'ja', 'ja-Hrkt', 'ko', 'zh-Hant', 'zh-Hans', 'fr', 'de', 'es', 'it')
+
+FALLBACK_LANGUAGE = 'en'
+
+
+def localized(entries: list[dict], field: str, languages=LANGUAGES) -> dict[str, str]:
+    """PokeAPI の names / effect_entries → {言語コード: 文字列}（最初に出てきたものを使う）"""
+    result = {}
+    for entry in entries or []:
+        lang = (entry.get('language') or {}).get('name')
+        text = entry.get(field)
+        if lang in languages and text and lang not in result:
+            result[lang] = text
+    return result
+
+
+class StringTableBuilder:
+    def __init__(self, languages=LANGUAGES):
+        self.languages = tuple(languages)
+        self.tables = {lang: {} for lang in self.languages}
+
+    def add(self, kind: str, record_id: int, names: dict[str, str], effects: dict[str, str] | None = None):
+        for lang in self.languages:
+            strings = {}
+            if names.get(lang):
+                strings['name'] = names[lang]
+            if effects and effects.get(lang):
+                strings['effect'] = effects[lang]
+            if strings:
+                self.tables[lang].setdefault(kind, {})[str(record_id)] = strings
+
+    def write(self, directory: Path = DEFAULT_STRINGS_DIR) -> list[Path]:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for lang, table in self.tables.items():
+            if not table:
+                continue
+            path = directory / f'{lang}.json'
+            sorted_table = {
+                kind: dict(sorted(entries.items(), key=lambda item: int(item[0])))
+                for kind, entries in sorted(table.items())
+            }
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(sorted_table, f, ensure_ascii=False, separators=(',', ':'))
+            paths.append(path)
+        return paths
+
+
+class StringTable:
+    """
+    1言語分の文字列テーブル
+
+    表示中の言語に無い文字列だけ、フォールバック言語のテーブルを初めて必要になったときに読み込む。
+    """
+
+    def __init__(self, lang: str, directory: Path = DEFAULT_STRINGS_DIR, fallback: str | None = FALLBACK_LANGUAGE):
+        self.lang = lang
+        self.directory = Path(directory)
+        self.table = self._load(lang)
+        self._fallback_lang = fallback if fallback != lang else None
+        self._fallback = None
+
+    def _load(self, lang: str) -> dict:
+        path = self.directory / f'{lang}.json'
+        if not path.exists():
+            return {}
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _lookup(self, kind: str, record_id: int, field: str) -> str | None:
+        value = self.table.get(kind, {}).get(str(record_id), {}).get(field)
+        if value is None and self._fallback_lang:
+            if self._fallback is None:
+                self._fallback = self._load(self._fallback_lang)
+            value = self._fallback.get(kind, {}).get(str(record_id), {}).get(field)
+        return value
+
+    def name(self, kind: str, record_id: int) -> str | None:
+        return self._lookup(kind, record_id, 'name')
+
+    def effect(self, kind: str, record_id: int) -> str | None:
+        return self._lookup(kind, record_id, 'effect')
+
+
+def main():
+    if len(sys.argv) < 2:
+        print('使い方: python string_tables.py <lang> [kind] [id]')
+        return 1
+
+    table = StringTable(sys.argv[1])
+    if len(sys.argv) >= 4:
+        kind, record_id = sys.argv[2], int(sys.argv[3])
+        print(f"{table.name(kind, record_id)}: {table.effect(kind, record_id)}")
+        return 0
+
+    for kind, entries in table.table.items():
+        print(f"  - {kind}: {len(entries)}件")
+    return 0
+
+
+if __name__ == '__main__':
+    install_hooks()
+    sys.exit(main())
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Synthetic dataset generator
+scarlet_violet.json と同じ形の合成データセットを作る（スケーリングの検証用）
+
+scale=1 で実データと同程度（約1,000種族・約1,300フォーム・約900技・約300特性・地方図鑑3つ）、
+scale=10 / 100 でその10倍・100倍になる。次の整合性を保つ:
+  - evolutionChain: 同じチェーンの evolvesFrom / evolvesTo が存在するIDを指し、ステージが 1 から続く
+  - moves / abilities: ポケモンが参照する技・特性が全て存在する
+  - 進化後は進化前の技を全て覚えている（--raw-learnsets で継承前の状態にできる）
+  - pokedexNumbers: 図鑑ごとに 1 から欠番・重複なし、pokedexes[].speciesIds と一致
+  - フォーム: リージョンフォーム（チェーンごと）・コスメティックフォーム・バトルフォーム
+
+出力は Tools/.synthetic/ に書く（PreloadedData に置くとアプリに同梱されるため）。
+
+使い方:
+  python synthetic_dataset.py [--scale N] [--seed N] [--raw-learnsets] [--validate] [-o output.json]
+"""
+
+import copy
+import json
+import random
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from evolution_checker import REGIONS
+from tool_runner import install_hooks
+
+DEFAULT_OUTPUT_DIR = Path(__file__).parent / '.synthetic'
+
+# scale=1 あたりの件数（実データに合わせた目安）
+SPECIES_PER_SCALE = 1025
+MOVES_PER_SCALE = 920
+ABILITIES_PER_SCALE = 310
+POKEDEX_NAMES = ['paldea', 'kitakami', 'blueberry']
+
+# 割合
+REGIONAL_CHAIN_RATE = 0.05
+COSMETIC_SPECIES_RATE = 0.04
+BATTLE_FORM_RATE = 0.03
+SECOND_DEX_RATE = 0.2
+MISSING_HIDDEN_ABILITY_RATE = 0.2
+
+TYPES = [
+    'normal', 'fire', 'water', 'electric', 'grass', 'ice', 'fighting', 'poison', 'ground',
+    'flying', 'psychic', 'bug', 'rock', 'ghost', 'dragon', 'dark', 'steel', 'fairy',
+]
+EGG_GROUPS = ['monster', 'water1', 'bug', 'flying', 'ground', 'fairy', 'plant', 'humanshape', 'mineral', 'dragon']
+POKEMON_CATEGORIES = ['normal'] * 92 + ['subLegendary'] * 4 + ['legendary'] * 2 + ['mythical'] * 2
+COSMETIC_SUFFIXES = ['red', 'yellow', 'orange', 'blue', 'white', 'spring', 'summer', 'autumn', 'winter', 'east', 'west']
+BATTLE_SUFFIXES = ['totem', 'busted', 'eternamax']
+SPRITE_BASE = 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/home'
+STATS = ('hp', 'attack', 'defense', 'spAttack', 'spDefense', 'speed')
+
+# 技カテゴリー判定・翻訳の処理が実データと同じように通る効果文
+MOVE_EFFECTS = [
+    ('damage', 'none', 'Inflicts regular damage.', 'ダメージを与えます。'),
+    ('damage+ailment', 'burn', 'Inflicts regular damage. Has a $effect_chance% chance to burn the target.',
+     'ダメージを与えます。$effect_chance%の確率で相手をやけど状態にします。'),
+    ('damage+ailment', 'paralysis', 'Inflicts regular damage. Has a $effect_chance% chance to paralyze the target.',
+     'ダメージを与えます。$effect_chance%の確率で相手をまひ状態にします。'),
+    ('ailment', 'sleep', 'Puts the target to sleep.', '相手をねむり状態にします。'),
+    ('net-good-stats', 'none', "Raises the user's Attack by two stages.", '自分のこうげきを2段階上げます。'),
+    ('damage+lower', 'none', "Inflicts regular damage. Has a $effect_chance% chance to lower the target's Defense by one stage.",
+     "ダメージを与えます。$effect_chance%の確率で相手のぼうぎょを1段階下げます。"),
+    ('damage+heal', 'none', 'Inflicts regular damage. Drains half the damage inflicted to heal the user.',
+     'ダメージを与えます。与えたダメージの半分だけ自分のHPを回復します。'),
+    ('heal', 'none', 'Heals the user by half its max HP.', '自分のHPを最大HPの半分回復します。'),
+    ('damage', 'none', "Inflicts regular damage. Power doubles if the target has a major status ailment.",
+     'ダメージを与えます。相手が状態異常のとき威力が2倍になります。'),
+    ('damage', 'none', 'Inflicts damage equal to the user\'s level.', '自分のレベルと同じダメージを与えます。'),
+]
+ABILITY_EFFECTS = [
+    ('Powers up moves of a certain type when the Pokémon\'s HP is low.', 'HPが減ったとき、特定のタイプの技の威力が上がります。'),
+    ('Prevents the Pokémon from being paralyzed.', 'まひ状態になりません。'),
+    ('Boosts the Pokémon\'s Speed stat in rain.', '雨のとき、すばやさが上がります。'),
+    ('Contact with the Pokémon may burn the attacker.', '接触した相手をやけど状態にすることがあります。'),
+    ('Lowers the opposing Pokémon\'s Attack stat when entering battle.', '登場したとき、相手のこうげきを下げます。'),
+]
+
+
+class SyntheticDatasetGenerator:
+    def __init__(self, scale: int = 1, seed: int = 0, inherit_moves: bool = True):
+        self.scale = scale
+        self.rng = random.Random(seed)
+        self.inherit_moves = inherit_moves
+        self.species_count = SPECIES_PER_SCALE * scale
+        # フォームのIDは実データと同じく 10001 から（種族数が多いときはその上の桁から）
+        self.next_form_id = max(10001, (self.species_count // 10000 + 1) * 10000 + 1)
+        self.pokedex_names = [
+            name if i == 0 else f"{name}-{i}"
+            for i in range(scale) for name in POKEDEX_NAMES
+        ]
+
+    # ---- 技・特性 ----
+
+    def _moves(self) -> list[dict]:
+        moves = []
+        for move_id in range(1, MOVES_PER_SCALE * self.scale + 1):
+            meta_category, ailment, effect, effect_ja = self.rng.choice(MOVE_EFFECTS)
+            damage_class = 'status' if not meta_category.startswith('damage') else self.rng.choice(['physical', 'special'])
+            chance = self.rng.choice([10, 20, 30]) if '$effect_chance' in effect else None
+            moves.append({
+                'id': move_id,
+                'name': f"move{move_id}",
+                'nameJa': f"わざ{move_id}",
+                'type': self.rng.choice(TYPES),
+                'damageClass': damage_class,
+                'power': self.rng.randrange(40, 130, 5) if damage_class != 'status' else None,
+                'accuracy': self.rng.choice([None, 70, 80, 90, 95, 100, 100, 100]),
+                'pp': self.rng.choice([5, 10, 15, 20, 25, 30, 35, 40]),
+                'priority': self.rng.choice([0] * 18 + [1, -1]),
+                'effectChance': chance,
+                'effect': effect,
+                'effectJa': effect_ja if self.rng.random() < 0.8 else '',
+                'categories': [],
+                'meta': {
+                    'ailment': ailment,
+                    'ailmentChance': chance if ailment != 'none' and chance else 0,
+                    'category': meta_category,
+                    'critRate': self.rng.choice([0] * 9 + [1]),
+                    'drain': 50 if meta_category == 'damage+heal' else 0,
+                    'flinchChance': 0,
+                    'healing': 50 if meta_category == 'heal' else 0,
+                    'statChance': chance if meta_category == 'damage+lower' else 0,
+                    'statChanges': [],
+                },
+            })
+        return moves
+
+    def _abilities(self) -> list[dict]:
+        abilities = []
+        for ability_id in range(1, ABILITIES_PER_SCALE * self.scale + 1):
+            effect, effect_ja = self.rng.choice(ABILITY_EFFECTS)
+            abilities.append({
+                'id': ability_id,
+                'name': f"ability{ability_id}",
+                'nameJa': f"とくせい{ability_id}",
+                'effect': effect,
+                'effectJa': effect_ja if self.rng.random() < 0.8 else '',
+            })
+        return abilities
+
+    # ---- ポケモン ----
+
+    def _learnset(self, move_count: int) -> list[dict]:
+        learnset = []
+        move_ids = self.rng.sample(range(1, move_count + 1), self.rng.randint(20, 60))
+        for move_id in move_ids:
+            method = self.rng.choice(['level-up', 'level-up', 'machine', 'machine', 'egg', 'tutor'])
+            learnset.append({
+                'moveId': move_id,
+                'learnMethod': method,
+                'level': self.rng.randint(1, 70) if method == 'level-up' else None,
+                'machineNumber': f"TM{(move_id % 229) + 1:03d}" if method == 'machine' else None,
+            })
+        return learnset
+
+    def _pokemon(self, pokemon_id: int, national: int, name: str, ability_count: int) -> dict:
+        stats = {stat: self.rng.randint(20, 150) for stat in STATS}
+        stats['total'] = sum(stats.values())
+        hidden = self.rng.randint(1, ability_count) if self.rng.random() > MISSING_HIDDEN_ABILITY_RATE else None
+        return {
+            'id': pokemon_id,
+            'nationalDexNumber': national,
+            'name': name,
+            'nameJa': f"ポケモン{national}",
+            'genus': 'Synthetic Pokémon',
+            'genusJa': 'ごうせいポケモン',
+            'sprites': {
+                'normal': f"{SPRITE_BASE}/{pokemon_id}.png",
+                'shiny': f"{SPRITE_BASE}/shiny/{pokemon_id}.png",
+            },
+            'types': self.rng.sample(TYPES, self.rng.choice([1, 2])),
+            'abilities': {
+                'primary': self.rng.sample(range(1, ability_count + 1), self.rng.choice([1, 2])),
+                'hidden': hidden,
+            },
+            'baseStats': stats,
+            'moves': [],
+            'eggGroups': self.rng.sample(EGG_GROUPS, self.rng.choice([1, 2])),
+            'genderRate': self.rng.choice([-1, 0, 1, 2, 4, 4, 4, 8]),
+            'height': self.rng.randint(2, 80),
+            'weight': self.rng.randint(10, 3000),
+            'evolutionChain': {},
+            'varieties': [],
+            'pokedexNumbers': {},
+            'category': self.rng.choice(POKEMON_CATEGORIES),
+        }
+
+    def _chain_shapes(self) -> list[list[int]]:
+        """チェーンごとの各ステージの種族数（例: [1, 2] は分岐進化）"""
+        shapes = []
+        remaining = self.species_count
+        while remaining > 0:
+            length = self.rng.choices([1, 2, 3], weights=[35, 35, 30])[0]
+            shape = [1] * length
+            if length > 1 and self.rng.random() < 0.05:
+                shape[-1] = 2
+            # 端数は最後のチェーンを短くして合わせる
+            while sum(shape) > remaining:
+                shape.pop()
+            shapes.append(shape)
+            remaining -= sum(shape)
+        return shapes
+
+    def _inherit(self, pokemon: dict, pre_evolution: dict):
+        """進化前の技を全て覚えさせる（evolution_inheritance と同じ形）"""
+        known = {m['moveId'] for m in pokemon['moves']}
+        for move in pre_evolution['moves']:
+            if move['moveId'] not in known:
+                pokemon['moves'].append({**move, 'isFromPreEvolution': True})
+                known.add(move['moveId'])
+
+    def _form_id(self) -> int:
+        form_id = self.next_form_id
+        self.next_form_id += 1
+        return form_id
+
+    def _variant(self, base: dict, suffix: str) -> dict:
+        form = copy.deepcopy(base)
+        form['id'] = self._form_id()
+        form['name'] = f"{base['name']}-{suffix}"
+        form['sprites'] = {
+            'normal': f"{SPRITE_BASE}/{form['id']}.png",
+            'shiny': f"{SPRITE_BASE}/shiny/{form['id']}.png",
+        }
+        form['pokedexNumbers'] = {}
+        return form
+
+    def generate(self) -> dict:
+        moves = self._moves()
+        abilities = self._abilities()
+        species = []      # 基本形（全国図鑑番号順）
+        forms = []        # フォーム違い
+        forms_by_base = defaultdict(list)
+        chains = []       # チェーン → ステージごとの基本形リスト
+
+        national = 0
+        for chain_id, shape in enumerate(self._chain_shapes(), 1):
+            stages = []
+            for stage, width in enumerate(shape, 1):
+                members = []
+                for _ in range(width):
+                    national += 1
+                    pokemon = self._pokemon(national, national, f"synth{national}", len(abilities))
+                    pokemon['moves'] = self._learnset(len(moves))
+                    pre = stages[-1][0] if stages else None
+                    pokemon['evolutionChain'] = {
+                        'chainId': chain_id,
+                        'evolutionStage': stage,
+                        'evolvesFrom': pre['id'] if pre else None,
+                        'evolvesTo': [],
+                        'canUseEviolite': stage < len(shape),
+                    }
+                    if pre:
+                        pre['evolutionChain']['evolvesTo'].append(pokemon['id'])
+                        if self.inherit_moves:
+                            self._inherit(pokemon, pre)
+                    members.append(pokemon)
+                    species.append(pokemon)
+                stages.append(members)
+            chains.append(stages)
+
+        # リージョンフォーム: チェーン全体を同じ地方の姿にする（進化前も同じ地方の姿を指す）
+        for stages in chains:
+            if self.rng.random() >= REGIONAL_CHAIN_RATE:
+                continue
+            region = self.rng.choice(REGIONS)
+            previous = None
+            for members in stages:
+                regional_members = []
+                for base in members:
+                    form = self._variant(base, region)
+                    form['types'] = self.rng.sample(TYPES, self.rng.choice([1, 2]))
+                    evolution_chain = form['evolutionChain']
+                    evolution_chain['evolvesTo'] = []
+                    if previous:
+                        evolution_chain['evolvesFrom'] = previous['id']
+                        previous['evolutionChain']['evolvesTo'].append(form['id'])
+                    regional_members.append(form)
+                    forms.append(form)
+                    forms_by_base[base['name']].append(form)
+                previous = regional_members[0]
+
+        # コスメティックフォーム（nationalDexNumber を持たない）・バトルフォーム
+        for base in species:
+            if self.rng.random() < COSMETIC_SPECIES_RATE:
+                for suffix in self.rng.sample(COSMETIC_SUFFIXES, self.rng.randint(2, 5)):
+                    form = self._variant(base, suffix)
+                    del form['nationalDexNumber']
+                    forms.append(form)
+                    forms_by_base[base['name']].append(form)
+            if self.rng.random() < BATTLE_FORM_RATE:
+                form = self._variant(base, self.rng.choice(BATTLE_SUFFIXES))
+                forms.append(form)
+                forms_by_base[base['name']].append(form)
+
+        for base in species:
+            members = [base] + forms_by_base.get(base['name'], [])
+            varieties = [p['id'] for p in members]
+            for pokemon in members:
+                pokemon['varieties'] = varieties
+
+        pokedexes = self._assign_pokedex_numbers(chains)
+
+        return {
+            'dataVersion': '1.0.0',
+            'lastUpdated': '2025-01-01',
+            'versionGroup': f"synthetic-x{self.scale}",
+            'versionGroupId': 0,
+            'generation': 9,
+            'pokemon': species + forms,
+            'moves': moves,
+            'abilities': abilities,
+            'pokedexes': pokedexes,
+        }
+
+    def _assign_pokedex_numbers(self, chains: list[list[list[dict]]]) -> list[dict]:
+        """チェーン単位で図鑑に割り当て、図鑑ごとにチェーン順で 1 から番号を振る"""
+        members_by_dex = {name: [] for name in self.pokedex_names}
+        for stages in chains:
+            dexes = [self.rng.choice(self.pokedex_names)]
+            if self.rng.random() < SECOND_DEX_RATE:
+                second = self.rng.choice(self.pokedex_names)
+                if second not in dexes:
+                    dexes.append(second)
+            for dex in dexes:
+                members_by_dex[dex].extend(p for members in stages for p in members)
+
+        pokedexes = []
+        for dex, members in members_by_dex.items():
+            for number, pokemon in enumerate(members, 1):
+                pokemon['pokedexNumbers'][dex] = number
+            pokedexes.append({'name': dex, 'speciesIds': sorted(p['nationalDexNumber'] for p in members)})
+        return pokedexes
+
+
+def generate(scale: int = 1, seed: int = 0, inherit_moves: bool = True) -> dict:
+    return SyntheticDatasetGenerator(scale, seed, inherit_moves).generate()
+
+
+def main():
+    args = sys.argv[1:]
+
+    def pop_option(name):
+        if name not in args:
+            return None
+        i = args.index(name)
+        value = args[i + 1]
+        del args[i:i + 2]
+        return value
+
+    def pop_flag(name):
+        if name not in args:
+            return False
+        args.remove(name)
+        return True
+
+    scale = int(pop_option('--scale') or 1)
+    seed = int(pop_option('--seed') or 0)
+    output = pop_option('-o')
+    raw_learnsets = pop_flag('--raw-learnsets')
+    run_validation = pop_flag('--validate')
+
+    data = generate(scale, seed, inherit_moves=not raw_learnsets)
+    output_path = Path(output) if output else DEFAULT_OUTPUT_DIR / f"scarlet_violet_x{scale}.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+    print(f"🧪 x{scale}: {len(data['pokemon'])}匹 / {len(data['moves'])}技 / "
+          f"{len(data['abilities'])}特性 / {len(data['pokedexes'])}図鑑")
+    print(f"📝 {output_path}")
+
+    if run_validation:
+        from validation_engine import validate
+        report = validate(data)
+        for r in report['rules']:
+            mark = '✅' if not r['issues'] else '⚠️ '
+            print(f"  {mark} {r['id']}: {r['issues']}件")
+        return 1 if report['summary']['bySeverity']['error'] else 0
+    return 0
+
+
+if __name__ == '__main__':
+    install_hooks()
+    sys.exit(main())
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Tools/ のスクリプトはフラットに import し合うので、Tools/ をパスに入れる
+sys.path.insert(0, str(Path(__file__).parent.parent))
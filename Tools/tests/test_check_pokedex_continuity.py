@@ -0,0 +1,50 @@
+import json
+
+from check_pokedex_continuity import check_continuity
+from pokedex_analyzer import PokedexAnalyzer
+
+
+def _pokemon(name, name_ja, numbers):
+    return {'name': name, 'nameJa': name_ja, 'pokedexNumbers': numbers}
+
+
+DATASET = {
+    'pokedexes': [{'name': 'paldea', 'speciesIds': []}],
+    'pokemon': [
+        _pokemon('sprigatito', 'ニャオハ', {'paldea': 1}),
+        _pokemon('floragato', 'ニャローテ', {'paldea': 2}),
+        _pokemon('quaxly', 'クワッス', {'paldea': 5, 'kitakami': 1}),
+        _pokemon('quaxly-alt', 'クワッス', {'paldea': 5}),
+    ],
+}
+
+
+def test_names_of_returns_every_entry_for_the_number():
+    analyzer = PokedexAnalyzer(DATASET['pokedexes'])
+    for pokemon in DATASET['pokemon']:
+        analyzer.add(pokemon)
+    assert analyzer.names_of('paldea', 5) == ['quaxly', 'quaxly-alt']
+    assert analyzer.names_of('kitakami', 1) == ['quaxly']
+    assert analyzer.names_of('paldea', 3) == []
+
+
+def test_check_continuity_reports_gaps_and_range(tmp_path, capsys):
+    json_path = tmp_path / 'dataset.json'
+    json_path.write_text(json.dumps(DATASET, ensure_ascii=False), encoding='utf-8')
+
+    check_continuity('paldea', json_path)
+
+    out = capsys.readouterr().out
+    assert 'paldea図鑑: 4匹' in out
+    assert '#2 → #5: 欠番 [3, 4]' in out
+    assert '最小番号: #1 (sprigatito / ニャオハ)' in out
+    assert '最大番号: #5 (quaxly / クワッス)' in out
+
+
+def test_check_continuity_handles_an_empty_pokedex(tmp_path, capsys):
+    json_path = tmp_path / 'dataset.json'
+    json_path.write_text(json.dumps(DATASET, ensure_ascii=False), encoding='utf-8')
+
+    check_continuity('blueberry', json_path)
+
+    assert 'blueberry図鑑: 0匹' in capsys.readouterr().out
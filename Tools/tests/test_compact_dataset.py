@@ -0,0 +1,44 @@
+import copy
+import json
+import pickle
+
+import pytest
+
+from compact_dataset import LearnedMove, loads_compact, to_plain
+
+DATASET = {
+    'pokemon': [{
+        'id': 1,
+        'name': 'bulbasaur',
+        'sprites': {
+            'normal': 'https://example.com/sprites/1.png',
+            'shiny': 'https://example.com/sprites/shiny/1.png',
+        },
+        'baseStats': {'hp': 45, 'attack': 49, 'defense': 49, 'spAttack': 65, 'spDefense': 65,
+                      'speed': 45, 'total': 318},
+        'moves': [
+            {'moveId': 33, 'learnMethod': 'level-up', 'level': 1, 'machineNumber': None},
+            {'moveId': 22, 'learnMethod': 'level-up', 'level': 3, 'machineNumber': None,
+             'isFromPreEvolution': True},
+        ],
+    }],
+}
+
+
+@pytest.mark.parametrize('clone', [
+    copy.deepcopy,
+    copy.copy,
+    lambda value: pickle.loads(pickle.dumps(value)),
+], ids=['deepcopy', 'copy', 'pickle'])
+def test_records_round_trip_without_gaining_absent_fields(clone):
+    data = loads_compact(json.dumps(DATASET))
+    learned = data['pokemon'][0]['moves'][0]
+    assert isinstance(learned, LearnedMove)
+
+    copied = clone(learned)
+    assert 'isFromPreEvolution' not in copied
+    assert copied.keys() == learned.keys()
+    assert copied == learned
+
+    cloned = clone(data)
+    assert json.loads(json.dumps(cloned, default=to_plain)) == DATASET
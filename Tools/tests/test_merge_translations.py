@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+import merge_translations
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    translations = tmp_path / 'translations'
+    translations.mkdir()
+    dictionary = tmp_path / 'translation_dictionary.json'
+    dictionary.write_text(json.dumps({
+        'moves': {},
+        'abilities': {},
+        'sentences': {'Inflicts regular damage.': 'ダメージを与える。'},
+    }, ensure_ascii=False), encoding='utf-8')
+    monkeypatch.setattr(merge_translations, 'TRANSLATION_DIR', str(translations))
+    monkeypatch.setattr(merge_translations, 'DICT_PATH', dictionary)
+    monkeypatch.setattr(merge_translations, 'STATE_PATH', tmp_path / 'state.json')
+    monkeypatch.setattr(merge_translations, 'CONFLICTS_PATH', str(translations / 'conflicts.json'))
+    return translations
+
+
+def _write_batch(translations, entries):
+    path = translations / 'sentences_batch_1_ja.json'
+    path.write_text(json.dumps(entries, ensure_ascii=False), encoding='utf-8')
+
+
+def test_conflicts_are_reported_until_resolved(workspace):
+    conflicts_path = workspace / 'conflicts.json'
+    _write_batch(workspace, {
+        'Inflicts regular damage.': 'ダメージを与えます。',
+        'Traps the target.': '相手を逃げられなくする。',
+    })
+
+    merge_translations.main()
+    first = json.loads(conflicts_path.read_text(encoding='utf-8'))
+    assert [c['source'] for c in first] == ['Inflicts regular damage.']
+
+    # 同じファイルのまま再実行しても、衝突は報告し続ける
+    merge_translations.main()
+    assert json.loads(conflicts_path.read_text(encoding='utf-8')) == first
+
+    # 衝突を解消すると、古い報告は消える
+    _write_batch(workspace, {
+        'Inflicts regular damage.': 'ダメージを与える。',
+        'Traps the target.': '相手を逃げられなくする。',
+    })
+    merge_translations.main()
+    assert not conflicts_path.exists()
+    state = json.loads(merge_translations.STATE_PATH.read_text(encoding='utf-8'))
+    assert str(workspace / 'sentences_batch_1_ja.json') in state['files']
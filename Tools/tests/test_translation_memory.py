@@ -0,0 +1,74 @@
+import json
+
+from merge_translations import merge_batch
+from prepare_translation_batches import collect_sentences
+from translation_memory import SENTENCE_SECTION, SentenceMemory, TranslationMemory, compact_dictionary
+
+DICTIONARY = {
+    'moves': {
+        'Inflicts regular damage.': 'ダメージを与える。',
+        'Inflicts regular damage. Has a 10% chance to burn the target.':
+            'ダメージを与える。10%の確率で相手をやけど状態にする。',
+        # 同じ文に別の訳（多い方の訳が sentences に入り、この段落は残る）
+        'Inflicts regular damage. Never misses.': 'ダメージを与えます。必ず命中する。',
+        # 文数が合わない段落は残る
+        'Lowers Attack. Lowers Defense.': 'こうげきとぼうぎょを下げる。',
+    },
+    'abilities': {
+        'Prevents sleep.\n\nOverworld: Wakes faster.': 'ねむりにならない。\n\nフィールド: 早く起きる。',
+    },
+}
+
+
+def test_compact_dictionary_keeps_every_translation():
+    compacted = compact_dictionary(DICTIONARY)
+
+    assert compacted['moves'] == {
+        'Inflicts regular damage. Never misses.': 'ダメージを与えます。必ず命中する。',
+        'Lowers Attack. Lowers Defense.': 'こうげきとぼうぎょを下げる。',
+    }
+    assert compacted['abilities'] == {}
+    assert compacted[SENTENCE_SECTION]['Inflicts regular damage.'] == 'ダメージを与える。'
+
+    memory = SentenceMemory.from_dictionary(compacted)
+    for section in ('moves', 'abilities'):
+        for source, translation in DICTIONARY[section].items():
+            paragraph = compacted[section].get(source)
+            assert (paragraph or memory.translate(source)[0]) == translation
+    assert compact_dictionary(compacted) == compacted
+
+
+def test_collect_sentences_sends_only_unknown_sentences():
+    compacted = compact_dictionary(DICTIONARY)
+    memory = TranslationMemory(compacted['moves'])
+    sentence_memory = SentenceMemory.from_dictionary(compacted)
+    items = [
+        {'effect': 'Inflicts regular damage. Has a 10% chance to burn the target.'},
+        {'effect': 'Inflicts regular damage. Traps the target.'},
+        {'effect': 'Traps the target.'},
+    ]
+    unique, occurrences = {}, {}
+
+    pending, skipped = collect_sentences('moves', items, memory, sentence_memory, unique, occurrences)
+
+    assert (pending, skipped) == (2, 1)
+    assert list(unique.values()) == ['Traps the target.']
+    assert list(occurrences.values()) == [{'moves': [1, 2]}]
+
+
+def test_merge_batch_adds_sentence_entries(tmp_path):
+    dictionary = compact_dictionary(DICTIONARY)
+    sentence_memory = SentenceMemory.from_dictionary(dictionary)
+    batch = tmp_path / 'sentences_batch_1_ja.json'
+    batch.write_text(json.dumps({
+        'Traps the target.': '相手を逃げられなくする。',
+        'inflicts regular damage.': 'ダメージを与えます。',
+    }, ensure_ascii=False), encoding='utf-8')
+    conflicts = []
+
+    changed = merge_batch(SENTENCE_SECTION, str(batch), dictionary, {}, conflicts, sentence_memory)
+
+    assert changed == 1
+    assert dictionary[SENTENCE_SECTION]['Traps the target.'] == '相手を逃げられなくする。'
+    # 正規化すると既存の文と同じ英文は、訳が違えば衝突として報告する
+    assert [c['source'] for c in conflicts] == ['inflicts regular damage.']
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Shared entry-point hooks for Tools/ scripts
+全スクリプト共通のプロファイル・メモリ計測・フェーズ計測
+
+各スクリプトの実行開始時に install_hooks() を呼ぶと、次のオプションが使えるようになる
+（スクリプト自身の引数からは取り除かれる）:
+  --profile        cProfile の pstats と、フレームグラフ用の collapsed stack を Tools/.profiles/ に書き出す
+  --trace-memory   tracemalloc のピークと、メモリ使用量が最大だった時点の上位の確保箇所を表示する
+
+オプションが無くても、終了時にフェーズごとの所要時間（load / transform / write）を表示する。
+json.load / json.dump の時間を load / write として自動で数え、残りを transform とする。
+それ以外の区切りは with phase('fetch'): のように明示できる。
+
+使い方:
+  from tool_runner import install_hooks, phase
+  install_hooks()
+"""
+
+import atexit
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+PROFILE_DIR = Path(__file__).parent / '.profiles'
+
+SAMPLE_INTERVAL = 0.005
+TOP_FUNCTIONS = 15
+TOP_ALLOCATIONS = 10
+
+
+class PhaseTimer:
+    """フェーズごとの所要時間（入れ子のフェーズは内側だけに数える）"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.totals = defaultdict(float)
+        self._stack = []  # [(フェーズ名, 開始時刻)]
+        self.on_boundary = None
+        self.overhead = 0.0
+
+    def enter(self, name: str):
+        now = time.perf_counter()
+        if self._stack:
+            outer, since = self._stack[-1]
+            self.totals[outer] += now - since
+        self._stack.append((name, now))
+
+    def exit(self):
+        now = time.perf_counter()
+        name, since = self._stack.pop()
+        self.totals[name] += now - since
+        if self.on_boundary:
+            # 計測側の処理時間はどのフェーズにも含めない
+            self.on_boundary()
+            self.overhead += time.perf_counter() - now
+            now = time.perf_counter()
+        if self._stack:
+            self._stack[-1] = (self._stack[-1][0], now)
+
+    def summary(self) -> dict[str, float]:
+        total = time.perf_counter() - self.started - self.overhead
+        phases = dict(self.totals)
+        phases['transform'] = phases.get('transform', 0.0) + max(0.0, total - sum(self.totals.values()))
+        return {'total': total, **phases}
+
+
+_timer: PhaseTimer | None = None
+
+
+@contextmanager
+def phase(name: str):
+    """区間をフェーズとして計測する（install_hooks() の前と、メインスレッド以外では何もしない）"""
+    if _timer is None or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    _timer.enter(name)
+    try:
+        yield
+    finally:
+        _timer.exit()
+
+
+def _timed(fn, name: str):
+    def wrapper(*args, **kwargs):
+        with phase(name):
+            return fn(*args, **kwargs)
+    wrapper.__wrapped__ = fn
+    wrapper.__name__ = fn.__name__
+    wrapper.__doc__ = fn.__doc__
+    return wrapper
+
+
+class StackSampler(threading.Thread):
+    """メインスレッドのスタックを一定間隔で記録する（collapsed stack 形式で書き出す）"""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.target = threading.main_thread().ident
+        self.stacks = Counter()
+        self._done = threading.Event()
+
+    def run(self):
+        while not self._done.wait(self.interval):
+            frame = sys._current_frames().get(self.target)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if names:
+                self.stacks[';'.join(reversed(names))] += 1
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+    def write(self, path: Path):
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class MemoryTracer:
+    """tracemalloc のピークと、フェーズの区切りで一番メモリを使っていた時点のスナップショット"""
+
+    def __init__(self):
+        tracemalloc.start()
+        self.largest = None
+        self.largest_size = -1
+
+    def checkpoint(self):
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.largest_size:
+            self.largest_size = current
+            self.largest = tracemalloc.take_snapshot()
+
+    def report(self) -> list[str]:
+        self.checkpoint()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        lines = [f"🧠 メモリ: ピーク {peak / (1 << 20):.1f} MiB（確保箇所は {self.largest_size / (1 << 20):.1f} MiB 使用時点）"]
+        snapshot = self.largest.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+        for stat in snapshot.statistics('lineno')[:TOP_ALLOCATIONS]:
+            frame = stat.traceback[0]
+            lines.append(f"   {stat.size / (1 << 20):8.2f} MiB  {stat.count:>9,}個  {Path(frame.filename).name}:{frame.lineno}")
+        return lines
+
+
+def _pop_flag(name: str) -> bool:
+    if name not in sys.argv[1:]:
+        return False
+    sys.argv.remove(name)
+    return True
+
+
+def _script_name() -> str:
+    main = sys.modules.get('__main__')
+    return Path(getattr(main, '__file__', None) or sys.argv[0] or 'tool').stem
+
+
+def install_hooks():
+    """フェーズ計測を始め、--profile / --trace-memory があれば計測を始める（終了時に結果を表示する）"""
+    global _timer
+    if _timer is not None:
+        return
+    _timer = PhaseTimer()
+    json.load = _timed(json.load, 'load')
+    json.dump = _timed(json.dump, 'write')
+
+    profiler = sampler = tracer = None
+    if _pop_flag('--trace-memory'):
+        tracer = MemoryTracer()
+        _timer.on_boundary = tracer.checkpoint
+    if _pop_flag('--profile'):
+        profiler = cProfile.Profile()
+        sampler = StackSampler()
+        sampler.start()
+        profiler.enable()
+
+    def report():
+        # プロファイルの書き出し・スナップショットの集計に掛かる時間を transform に数えないよう、先に締める
+        summary = _timer.summary()
+        total = summary.pop('total')
+        order = sorted(summary, key=lambda name: (name == 'write', name != 'load'))
+        parts = [f"{name} {summary[name] * 1000:.0f} ms" for name in order if summary[name] >= 0.0005]
+
+        lines = []
+        if profiler:
+            profiler.disable()
+            sampler.stop()
+            PROFILE_DIR.mkdir(exist_ok=True)
+            stem = f"{_script_name()}-{time.strftime('%Y%m%d-%H%M%S')}"
+            pstats_path = PROFILE_DIR / f"{stem}.pstats"
+            collapsed_path = PROFILE_DIR / f"{stem}.collapsed"
+            profiler.dump_stats(pstats_path)
+            sampler.write(collapsed_path)
+
+            out = io.StringIO()
+            pstats.Stats(profiler, stream=out).sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+            lines.append(out.getvalue().rstrip())
+            lines.append(f"📝 Profile: {os.path.relpath(pstats_path)} / {os.path.relpath(collapsed_path)}")
+        if tracer:
+            lines.extend(tracer.report())
+        # フェーズが無い（どれも 0.5 ms 未満の）スクリプトでは表示しない
+        if parts:
+            lines.append(f"⏱️  {' / '.join(parts)}（計 {total * 1000:.0f} ms）")
+        if lines:
+            print('\n'.join(lines), file=sys.stderr)
+
+    atexit.register(report)
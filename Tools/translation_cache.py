@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Content-hash translation cache
+効果文の翻訳キャッシュ（英文のハッシュ → 日本語訳と、その訳が依存する辞書エントリのハッシュ）
+
+TranslateEffects.py と fetch_master_data.py の両方が参照する。
+英文も翻訳ロジックも変わっていない効果文は再翻訳せず、再実行時は変わった分だけ処理する。
+
+version（翻訳ロジック・置換テーブル）が変わると全エントリが無効になる。
+辞書（translation_dictionary.json）の更新は、その効果文が使う辞書エントリ（source）が変わったものだけを無効にする。
+
+使い方:
+  python translation_cache.py stats   # 件数を表示
+  python translation_cache.py clear   # キャッシュを削除
+"""
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from tool_runner import install_hooks
+
+DEFAULT_CACHE_PATH = Path(__file__).parent / '.translation_cache.json'
+
+
+def content_hash(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+class TranslationCache:
+    """
+    kind（'ability' / 'move'）と英文ごとに、日本語訳とその訳が依存する辞書エントリのハッシュ（source）を保持する
+
+    get() は source が一致するときだけ訳を返す。
+    別の version で保存されたファイルは読み込まず、save() で現在の version のエントリだけを書き直す。
+    """
+
+    def __init__(self, version: str, path=DEFAULT_CACHE_PATH):
+        self.version = version
+        self.path = Path(path)
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            if stored.get('version') == version:
+                self.entries = stored.get('entries', {})
+            else:
+                # 古い version のエントリは次の save() で消える
+                self._dirty = bool(stored.get('entries'))
+
+    def key(self, kind: str, text: str) -> str:
+        return content_hash(kind, text)
+
+    def get(self, kind: str, text: str, source: str = '') -> str | None:
+        entry = self.entries.get(self.key(kind, text))
+        if entry is None or entry['source'] != source:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry['text']
+
+    def put(self, kind: str, text: str, translated: str, source: str = ''):
+        """source が変わったエントリは上書きするので、英文1つにつき1件だけ残る"""
+        key = self.key(kind, text)
+        entry = {'source': source, 'text': translated}
+        if self.entries.get(key) != entry:
+            self.entries[key] = entry
+            self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.version, 'entries': self.entries},
+                      f, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+        self._dirty = False
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in ('stats', 'clear'):
+        print('使い方: python translation_cache.py [stats|clear]')
+        return 1
+
+    if sys.argv[1] == 'clear':
+        if DEFAULT_CACHE_PATH.exists():
+            DEFAULT_CACHE_PATH.unlink()
+        print(f"🗑️  削除: {DEFAULT_CACHE_PATH}")
+        return 0
+
+    stored = {}
+    if DEFAULT_CACHE_PATH.exists():
+        with open(DEFAULT_CACHE_PATH, 'r', encoding='utf-8') as f:
+            stored = json.load(f)
+    size_kb = DEFAULT_CACHE_PATH.stat().st_size / 1024 if DEFAULT_CACHE_PATH.exists() else 0
+    print(f"📦 {len(stored.get('entries', {}))}件 ({size_kb:.1f} KB, version {stored.get('version', '-')}): {DEFAULT_CACHE_PATH}")
+    return 0
+
+
+if __name__ == '__main__':
+    install_hooks()
+    sys.exit(main())
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Translation memory over translation_dictionary.json
+translation_dictionary.json の翻訳メモリ（正規化キー + n-gram 類似検索）
+
+完全一致しなかった英文でも、空白・改行・Pokémon/Pokemon などの表記ゆれを正規化して引き当てる。
+それでも無い場合は文字トライグラムの転置インデックスで近い英文を探し、信頼度（0〜1）付きで返す。
+数値（10%、2倍など）が異なる候補は訳文が変わってしまうので候補にしない。
+
+近似一致は自動では採用しない（user ↔ target の1語違いでも信頼度は 0.9 を超え、意味が逆になる）。
+自動で使うのは正規化後の完全一致（lookup）だけで、近似一致（near_match）は確認リスト用の候補として返す。
+
+SentenceMemory は段落を文に分けて英文と訳文を対応付け、文のハッシュで索引する。
+段落として辞書に無い効果文も、既知の文の訳を組み合わせて組み立て、未知の文だけを翻訳に回す。
+
+translation_dictionary.json は文単位で持つ:
+  - sentences:          英文の1文 → 訳文
+  - moves / abilities:  文の訳から組み立てられない段落だけ（文数が合わない、同じ文に別の訳がある など）
+compact_dictionary() が段落を文に分け、組み立てると元の訳文に戻る段落を sentences に移す。
+
+使い方:
+  python translation_memory.py "English effect text" [--top N]
+  python translation_memory.py --compact   （辞書ファイルを文単位に書き直す）
+"""
+
+import hashlib
+import json
+import re
+import sys
+import time
+import unicodedata
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+from tool_runner import install_hooks
+
+DEFAULT_DICTIONARY_PATH = Path(__file__).parent / 'translation_dictionary.json'
+PARAGRAPH_SECTIONS = ('moves', 'abilities')
+SENTENCE_SECTION = 'sentences'
+
+# 訳文を自動で採用する信頼度（1.0 = 正規化後の完全一致のみ）
+DEFAULT_MIN_CONFIDENCE = 1.0
+
+# これ以上の信頼度の近似一致は確認リストに載せる
+REVIEW_MIN_CONFIDENCE = 0.9
+
+NGRAM_SIZE = 3
+
+_WHITESPACE = re.compile(r'\s+')
+_NUMBER = re.compile(r'\d+(?:\.\d+)?')
+_EN_SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+')
+_JA_SENTENCE = re.compile(r'[^。]*。|[^。]+')
+_LINE_BREAK = re.compile(r'(\s*\n\s*)')
+
+
+def normalize(text: str) -> str:
+    """照合用に正規化（アクセント除去・小文字化・空白の連続を1つに）"""
+    decomposed = unicodedata.normalize('NFKD', text)
+    stripped = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return _WHITESPACE.sub(' ', stripped).strip().casefold()
+
+
+def ngrams(normalized: str) -> set[str]:
+    padded = f" {normalized} "
+    return {padded[i:i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1)}
+
+
+def split_lines(text: str) -> list[str]:
+    """空行・改行で区切られた段（"Overworld:" の行など）"""
+    return [line.strip() for line in text.strip().split('\n') if line.strip()]
+
+
+def split_sentences(text: str) -> list[str]:
+    """英文を文に分割"""
+    return [s for s in _EN_SENTENCE_BREAK.split(text.strip()) if s]
+
+
+def split_sentences_ja(text: str) -> list[str]:
+    """訳文を「。」で文に分割"""
+    return [s.strip() for s in _JA_SENTENCE.findall(text.strip()) if s.strip()]
+
+
+def sentence_hash(sentence: str) -> str:
+    return hashlib.sha1(normalize(sentence).encode('utf-8')).hexdigest()[:16]
+
+
+def align_sentences(source: str, translation: str) -> list[tuple[str, str]] | None:
+    """段落の英文と訳文を文ごとに対応付ける（行数・文数が合わなければ None）"""
+    if not source.strip() or not translation:
+        return None
+    en_lines = split_lines(source)
+    ja_lines = split_lines(translation)
+    if len(en_lines) != len(ja_lines):
+        return None
+    pairs = []
+    for en_line, ja_line in zip(en_lines, ja_lines):
+        en_sentences = split_sentences(en_line)
+        ja_sentences = split_sentences_ja(ja_line)
+        if len(en_sentences) != len(ja_sentences):
+            return None
+        pairs.extend(zip(en_sentences, ja_sentences))
+    return pairs or None
+
+
+@dataclass
+class Match:
+    source: str         # 辞書側の英文
+    translation: str
+    confidence: float   # 1.0 = 正規化後に完全一致
+
+
+class TranslationMemory:
+    def __init__(self, entries: dict[str, str]):
+        self.sources = []
+        self.translations = []
+        self._by_normalized = {}
+        self._grams = []
+        self._numbers = []
+        self._postings = defaultdict(list)
+
+        for source, translation in entries.items():
+            key = normalize(source)
+            if not key or not translation or key in self._by_normalized:
+                continue
+            entry_id = len(self.sources)
+            self.sources.append(source)
+            self.translations.append(translation)
+            self._by_normalized[key] = entry_id
+            grams = ngrams(key)
+            self._grams.append(len(grams))
+            self._numbers.append(_NUMBER.findall(key))
+            for gram in grams:
+                self._postings[gram].append(entry_id)
+
+    @classmethod
+    def load(cls, dict_path: Path = DEFAULT_DICTIONARY_PATH, section: str = 'moves') -> 'TranslationMemory':
+        with open(dict_path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f).get(section, {}))
+
+    def __len__(self):
+        return len(self.sources)
+
+    def _match(self, entry_id: int, confidence: float) -> Match:
+        return Match(self.sources[entry_id], self.translations[entry_id], confidence)
+
+    def search(self, text: str, top: int = 5) -> list[Match]:
+        """近い英文を信頼度（トライグラムの Dice 係数）の高い順に返す"""
+        key = normalize(text)
+        if not key:
+            return []
+        if key in self._by_normalized:
+            return [self._match(self._by_normalized[key], 1.0)]
+
+        grams = ngrams(key)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+
+        numbers = _NUMBER.findall(key)
+        scored = [
+            (2 * count / (len(grams) + self._grams[entry_id]), entry_id)
+            for entry_id, count in shared.items()
+            if self._numbers[entry_id] == numbers
+        ]
+        scored.sort(reverse=True)
+        # 完全一致（1.0）と区別するため、近似一致の信頼度は 1.0 未満にする
+        return [self._match(entry_id, min(score, 0.999)) for score, entry_id in scored[:top]]
+
+    def lookup(self, text: str, min_confidence: float = DEFAULT_MIN_CONFIDENCE) -> Match | None:
+        """採用できる訳文（既定では正規化一致のみ）"""
+        matches = self.search(text, top=1)
+        if matches and matches[0].confidence >= min_confidence:
+            return matches[0]
+        return None
+
+    def near_match(self, text: str, min_confidence: float = REVIEW_MIN_CONFIDENCE) -> Match | None:
+        """確認リスト用の近似一致（完全一致は lookup で引けるので返さない）"""
+        matches = self.search(text, top=1)
+        if matches and min_confidence <= matches[0].confidence < 1.0:
+            return matches[0]
+        return None
+
+
+class SentenceMemory:
+    """
+    文単位の翻訳メモリ（正規化した英文のハッシュ → 訳文）
+
+    英文と訳文の行数・文数が一致する段落だけを文に分けて登録する。
+    一致しない段落は段落のまま unaligned に残す。
+    """
+
+    def __init__(self, entries: dict[str, str] | None = None):
+        self.sentences = {}     # sentence_hash → (英文, 訳文)
+        self.unaligned = {}     # 文に分けられなかった段落 英文 → 訳文
+        self.conflicts = 0      # 同じ英文に別の訳があった数（最初の訳を使う）
+        for source, translation in (entries or {}).items():
+            self.add(source, translation)
+
+    def add(self, source: str, translation: str) -> bool:
+        """段落を文に分けて登録（対応付けできなければ False）"""
+        if not source.strip() or not translation:
+            return False
+        pairs = align_sentences(source, translation)
+        if not pairs:
+            self.unaligned[source] = translation
+            return False
+        for en, ja in pairs:
+            self.add_sentence(en, ja)
+        return True
+
+    def add_sentence(self, source: str, translation: str):
+        """1文を登録（登録済みの文は最初の訳を使う）"""
+        key = sentence_hash(source)
+        if key not in self.sentences:
+            self.sentences[key] = (source, translation)
+        elif self.sentences[key][1] != translation:
+            self.conflicts += 1
+
+    def __len__(self):
+        return len(self.sentences)
+
+    def known_sentences(self, text: str) -> list[str | None]:
+        """text の文ごとの既知の訳（未知の文は None）"""
+        return [
+            (self.sentences.get(sentence_hash(sentence)) or (None, None))[1]
+            for line in split_lines(text)
+            for sentence in split_sentences(line)
+        ]
+
+    def translate(self, text: str, fallback=None) -> tuple[str | None, list[str]]:
+        """
+        既知の文の訳を組み合わせて翻訳する（改行・空行は英文のものをそのまま残す）
+
+        Args:
+            fallback: 未知の文を訳す関数（省略時は未知の文が1つでもあれば訳文は None）
+
+        Returns:
+            (訳文, 未知の文のリスト)
+        """
+        # [行, 区切り, 行, 区切り, 行 ...]
+        parts = _LINE_BREAK.split(text.strip())
+        missing = []
+        for i in range(0, len(parts), 2):
+            translated = ''
+            for sentence in split_sentences(parts[i]):
+                known = self.sentences.get(sentence_hash(sentence))
+                if known:
+                    part = known[1]
+                else:
+                    missing.append(sentence)
+                    if fallback is None:
+                        continue
+                    part = fallback(sentence)
+                # 訳文（「。」終わり）の後は詰め、英文が残っている文の後は空白で区切る
+                translated += part if not translated or translated.endswith('。') else ' ' + part
+            parts[i] = translated
+        for i in range(1, len(parts), 2):
+            parts[i] = '\n' * parts[i].count('\n')
+        if (missing and fallback is None) or not text.strip():
+            return None, missing
+        return ''.join(parts), missing
+
+    @classmethod
+    def from_dictionary(cls, data: dict, sections=PARAGRAPH_SECTIONS) -> 'SentenceMemory':
+        """辞書の sentences を先に登録し、残りの段落の文を足す"""
+        memory = cls()
+        for source, translation in data.get(SENTENCE_SECTION, {}).items():
+            memory.add_sentence(source, translation)
+        for section in sections:
+            for source, translation in data.get(section, {}).items():
+                memory.add(source, translation)
+        return memory
+
+    @classmethod
+    def load(cls, dict_path: Path = DEFAULT_DICTIONARY_PATH, sections=PARAGRAPH_SECTIONS) -> 'SentenceMemory':
+        with open(dict_path, 'r', encoding='utf-8') as f:
+            return cls.from_dictionary(json.load(f), sections)
+
+
+def compact_dictionary(data: dict, sections=PARAGRAPH_SECTIONS) -> dict:
+    """
+    辞書を文単位にする
+
+    同じ文に段落ごとに別の訳がある場合は、一番多く使われている訳を sentences に採る。
+    sentences の訳だけで組み立てて元の訳文と同じになる段落は sentences に移し、
+    ならない段落（対応付けできない・採らなかった訳を含む・改行の位置が違う）は段落のまま残す。
+    既にある sentences の訳はそのまま使う。
+    """
+    chosen = {}
+    for source, translation in data.get(SENTENCE_SECTION, {}).items():
+        chosen.setdefault(sentence_hash(source), (source, translation))
+    votes = defaultdict(Counter)
+    aligned = {}
+    for section in sections:
+        for source, translation in data.get(section, {}).items():
+            pairs = align_sentences(source, translation)
+            if pairs:
+                aligned[section, source] = pairs
+                for pair in pairs:
+                    votes[sentence_hash(pair[0])][pair] += 1
+    for key, counts in votes.items():
+        if key not in chosen:
+            chosen[key] = counts.most_common(1)[0][0]
+
+    memory = SentenceMemory()
+    memory.sentences = chosen
+    used = set(data.get(SENTENCE_SECTION, {}))
+    compacted = {}
+    for section in sections:
+        compacted[section] = {}
+        for source, translation in data.get(section, {}).items():
+            pairs = aligned.get((section, source))
+            # 英文も一字一句同じ文だけで組み立てられる段落を移す（完全一致で引く ApplyTranslations.swift 向け）
+            if (pairs and all(chosen[sentence_hash(en)] == (en, ja) for en, ja in pairs)
+                    and memory.translate(source)[0] == translation):
+                used.update(en for en, _ in pairs)
+                continue
+            compacted[section][source] = translation
+    compacted[SENTENCE_SECTION] = {source: translation for source, translation in chosen.values() if source in used}
+    return compacted
+
+
+def save_dictionary(data: dict, dict_path: Path = DEFAULT_DICTIONARY_PATH):
+    with open(dict_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def compact_main(dict_path: Path = DEFAULT_DICTIONARY_PATH) -> int:
+    with open(dict_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    before = dict_path.stat().st_size
+    compacted = compact_dictionary(data)
+    save_dictionary(compacted, dict_path)
+    after = dict_path.stat().st_size
+
+    paragraphs = sum(len(data.get(section, {})) for section in PARAGRAPH_SECTIONS)
+    kept = sum(len(compacted[section]) for section in PARAGRAPH_SECTIONS)
+    print(f"📦 {dict_path.name}: {before / 1024:.1f} KB → {after / 1024:.1f} KB")
+    print(f"  段落 {paragraphs}件 → {kept}件（{paragraphs - kept}件を文に分割）")
+    print(f"  文 {len(compacted[SENTENCE_SECTION])}件")
+    return 0
+
+def main():
+    args = sys.argv[1:]
+    top = 5
+    if '--top' in args:
+        i = args.index('--top')
+        top = int(args[i + 1])
+        del args[i:i + 2]
+    if args == ['--compact']:
+        return compact_main()
+    if not args:
+        print('使い方: python translation_memory.py "English effect text" [--top N] | --compact')
+        return 1
+
+    memory = TranslationMemory.load()
+    start = time.perf_counter()
+    matches = memory.search(args[0], top=top)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    print(f"🔍 {len(memory)}件から検索 ({elapsed_ms:.2f} ms)")
+    for match in matches:
+        if match.confidence >= DEFAULT_MIN_CONFIDENCE:
+            mark = '✅'
+        elif match.confidence >= REVIEW_MIN_CONFIDENCE:
+            mark = '🔎'
+        else:
+            mark = '  '
+        print(f"{mark} {match.confidence:.3f}  {match.source}")
+        print(f"          → {match.translation}")
+    return 0
+
+
+if __name__ == '__main__':
+    install_hooks()
+    sys.exit(main())
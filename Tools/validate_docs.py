@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Documentation tree validator
+README.md・CHANGELOG.md と docs/ 以下の全マークダウンを検証する
+
+  1. 各ファイルを解析する（見出しのアンカー・リンク・コードブロック・空セクション）。
+     ワーカープールで並列に処理し、結果は mtime・サイズ・内容ハッシュで Tools/.docs_validation_cache.json に保存する。
+     再実行では編集されたファイルだけを解析し直す。
+  2. 全ファイルのアンカーをまとめたリンクグラフを1回だけ作り、
+     ファイル間リンク・アンカーリンクをリンク元のディレクトリ基準で解決して検証する。
+
+使い方:
+  python validate_docs.py [file_or_dir ...] [--jobs N] [--no-cache] [--json report.json]
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from urllib.parse import unquote
+
+from tool_runner import install_hooks
+
+REPO_ROOT = Path(__file__).parent.parent
+DEFAULT_CACHE_PATH = Path(__file__).parent / '.docs_validation_cache.json'
+
+# 解析結果の形式を変えたら上げる（古いキャッシュを使わない）
+PARSER_VERSION = 1
+
+LINK_PATTERN = re.compile(r'(!?)\[([^\]]*)\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"]*")?\s*\)')
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+HTML_ANCHOR_PATTERN = re.compile(r'<a\s+(?:name|id)="([^"]+)"')
+FENCE_PATTERN = re.compile(r'^\s*(```|~~~)')
+EXTERNAL_SCHEMES = ('http://', 'https://', 'mailto:', 'tel:')
+
+
+def default_documents() -> list[Path]:
+    """リポジトリ直下のマークダウンと docs/ 以下の全マークダウン"""
+    documents = sorted(REPO_ROOT.glob('*.md'))
+    documents += sorted((REPO_ROOT / 'docs').rglob('*.md'))
+    return documents
+
+
+def github_anchor(heading: str) -> str:
+    """見出しテキスト → GitHub と同じ規則のアンカー（小文字化・記号除去・空白をハイフンに）"""
+    text = re.sub(r'\[([^\]]*)\]\([^)]*\)', r'\1', heading)  # リンクは表示テキストだけ
+    text = re.sub(r'[`*_~]|<[^>]+>', '', text)
+    text = re.sub(r'[^\w\- ]', '', text.lower())
+    return text.replace(' ', '-')
+
+
+def parse_document(text: str) -> dict:
+    """1ファイル分の解析結果（アンカー・リンク・ファイル内で完結する問題）"""
+    anchors = []
+    anchor_counts = Counter()
+    links = []
+    issues = []
+    fence = None
+    fence_line = 0
+    previous_heading = None
+
+    for number, line in enumerate(text.splitlines(), 1):
+        match = FENCE_PATTERN.match(line)
+        if match:
+            previous_heading = None
+            if fence is None:
+                fence, fence_line = match.group(1), number
+            elif match.group(1) == fence:
+                fence = None
+            continue
+        if fence is not None:
+            continue
+
+        heading = HEADING_PATTERN.match(line)
+        if heading:
+            level = len(heading.group(1))
+            # 本文なしで同じか上のレベルの見出しが続く（小見出しが続くのは空セクションではない）
+            if previous_heading is not None and level <= previous_heading[2]:
+                issues.append({
+                    'severity': 'warning', 'line': previous_heading[0],
+                    'message': f"Empty section: {previous_heading[1][:50]}",
+                })
+            # 同じ見出しは GitHub と同様に -1, -2 ... を付ける
+            anchor = github_anchor(heading.group(2))
+            count = anchor_counts[anchor]
+            anchor_counts[anchor] += 1
+            anchors.append(f"{anchor}-{count}" if count else anchor)
+            previous_heading = (number, line.strip(), level)
+            continue
+        if line.strip():
+            previous_heading = None
+
+        anchors.extend(HTML_ANCHOR_PATTERN.findall(line))
+        # インラインコード内のリンク風の文字列は無視する
+        for image, label, target in LINK_PATTERN.findall(re.sub(r'`[^`]*`', '', line)):
+            links.append({'line': number, 'text': label, 'target': target, 'image': bool(image)})
+
+    if fence is not None:
+        issues.append({'severity': 'error', 'line': fence_line, 'message': f"Unclosed code block ({fence})"})
+
+    return {'anchors': anchors, 'links': links, 'issues': issues}
+
+
+def _parse_file(path: str) -> tuple[str, str, dict]:
+    """ワーカーで実行: (パス, 内容ハッシュ, 解析結果)"""
+    data = Path(path).read_bytes()
+    return path, hashlib.sha256(data).hexdigest(), parse_document(data.decode('utf-8'))
+
+
+class DocsValidator:
+    def __init__(self, documents: list[Path], cache_path: Path | None = DEFAULT_CACHE_PATH, jobs: int | None = None):
+        self.documents = [Path(p).resolve() for p in documents]
+        self.cache_path = cache_path
+        self.jobs = jobs or os.cpu_count() or 1
+        self.cache = self._load_cache()
+        self.parsed = {}
+        self.reparsed = []
+
+    def _load_cache(self) -> dict:
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        with open(self.cache_path, 'r', encoding='utf-8') as f:
+            stored = json.load(f)
+        return stored.get('files', {}) if stored.get('version') == PARSER_VERSION else {}
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': PARSER_VERSION, 'files': self.cache}, f, ensure_ascii=False)
+
+    def parse_all(self):
+        """キャッシュに無い・編集されたファイルだけをワーカープールで解析する"""
+        pending = []
+        for path in self.documents:
+            key = str(path)
+            stat = path.stat()
+            cached = self.cache.get(key)
+            if cached and cached['mtime'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+                self.parsed[key] = cached['result']
+            else:
+                pending.append(key)
+
+        if len(pending) > 1 and self.jobs > 1:
+            with ProcessPoolExecutor(max_workers=min(self.jobs, len(pending))) as executor:
+                results = list(executor.map(_parse_file, pending))
+        else:
+            results = [_parse_file(key) for key in pending]
+
+        for key, digest, result in results:
+            stat = Path(key).stat()
+            cached = self.cache.get(key)
+            # touch されただけ（内容が同じ）なら mtime だけ更新する
+            if not (cached and cached['hash'] == digest):
+                self.reparsed.append(key)
+            self.cache[key] = {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'hash': digest, 'result': result}
+            self.parsed[key] = result
+        # mtime の更新だけでもキャッシュを保存する
+        if results:
+            self._save_cache()
+
+    def _anchors_of(self, path: Path, graph: dict) -> set[str] | None:
+        """リンク先のアンカー（検証対象外のマークダウンはその場で解析する）"""
+        key = str(path)
+        if key not in graph and path.suffix == '.md':
+            graph[key] = set(_parse_file(key)[2]['anchors'])
+        return graph.get(key)
+
+    def check_links(self) -> list[dict]:
+        """全ファイルのアンカーをまとめたグラフでリンクを検証する"""
+        graph = {key: set(result['anchors']) for key, result in self.parsed.items()}
+        issues = []
+        for key, result in self.parsed.items():
+            source = Path(key)
+            for link in result['links']:
+                target = link['target']
+                if target.startswith(EXTERNAL_SCHEMES):
+                    continue
+
+                path_part, _, anchor = target.partition('#')
+                anchor = unquote(anchor)
+                resolved = (source.parent / unquote(path_part)).resolve() if path_part else source
+                location = {'file': key, 'line': link['line'], 'target': target}
+
+                if not resolved.exists():
+                    issues.append({'severity': 'error', 'message': f"Broken link: [{link['text']}]({target})", **location})
+                    continue
+                if anchor and resolved.is_file():
+                    anchors = self._anchors_of(resolved, graph)
+                    if anchors is not None and anchor.lower() not in anchors:
+                        issues.append({'severity': 'error', 'message': f"Missing anchor: [{link['text']}]({target})", **location})
+        return issues
+
+    def validate(self) -> dict:
+        self.parse_all()
+        issues = [
+            {**issue, 'file': key}
+            for key, result in self.parsed.items()
+            for issue in result['issues']
+        ]
+        issues += self.check_links()
+        return {
+            'summary': {
+                'documents': len(self.parsed),
+                'reparsed': len(self.reparsed),
+                'links': sum(len(r['links']) for r in self.parsed.values()),
+                'errors': sum(1 for i in issues if i['severity'] == 'error'),
+                'warnings': sum(1 for i in issues if i['severity'] == 'warning'),
+            },
+            'issues': sorted(issues, key=lambda i: (i['file'], i['line'])),
+        }
+
+
+def main():
+    args = sys.argv[1:]
+    report_path = None
+    if '--json' in args:
+        i = args.index('--json')
+        report_path = Path(args[i + 1])
+        del args[i:i + 2]
+    jobs = None
+    if '--jobs' in args:
+        i = args.index('--jobs')
+        jobs = int(args[i + 1])
+        del args[i:i + 2]
+    cache_path = DEFAULT_CACHE_PATH
+    if '--no-cache' in args:
+        args.remove('--no-cache')
+        cache_path = None
+
+    documents = []
+    for arg in args:
+        path = Path(arg)
+        documents += sorted(path.rglob('*.md')) if path.is_dir() else [path]
+
+    validator = DocsValidator(documents or default_documents(), cache_path, jobs)
+    report = validator.validate()
+    summary = report['summary']
+
+    print(f"📚 {summary['documents']}ファイル / {summary['links']}リンク（再解析: {summary['reparsed']}ファイル）")
+    for issue in report['issues']:
+        mark = '❌' if issue['severity'] == 'error' else '⚠️ '
+        print(f"  {mark} {os.path.relpath(issue['file'], REPO_ROOT)}:{issue['line']}: {issue['message']}")
+    if not report['issues']:
+        print("✅ 問題なし")
+
+    if report_path:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"📝 Report: {report_path}")
+    return 1 if summary['errors'] else 0
+
+
+if __name__ == '__main__':
+    install_hooks()
+    sys.exit(main())
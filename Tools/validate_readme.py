@@ -8,16 +8,21 @@ import re
 import os
 import sys
 from pathlib import Path
+from urllib.parse import unquote
+
+from tool_runner import install_hooks
+
+DEFAULT_README_PATH = Path(__file__).parent.parent / 'README.md'
 
 class READMEValidator:
-    def __init__(self, readme_path='README.md'):
+    def __init__(self, readme_path=DEFAULT_README_PATH):
         self.readme_path = readme_path
         self.errors = []
         self.warnings = []
         
         with open(readme_path, 'r', encoding='utf-8') as f:
             self.content = f.read()
-            self.lines = self.content.split('\n')
+            self.lines = self.content.splitlines()
     
     def validate_all(self):
         """Run all validation checks"""
@@ -68,8 +73,8 @@ class READMEValidator:
             if link_target.startswith('#'):
                 continue
             
-            # Check if file exists
-            link_path = Path(link_target)
+            # Check if file exists (relative to the README, not the working directory)
+            link_path = Path(self.readme_path).parent / unquote(link_target.partition('#')[0])
             if not link_path.exists():
                 self.errors.append(f"Broken link: [{link_text}]({link_target}) - file does not exist")
             else:
@@ -170,5 +175,6 @@ class READMEValidator:
         return 1 if self.errors else 0
 
 if __name__ == '__main__':
+    install_hooks()
     validator = READMEValidator()
     sys.exit(validator.validate_all())
\ No newline at end of file
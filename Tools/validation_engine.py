@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Dataset validation engine
+データセット検証エンジン（check_* スクリプトのルールを1回の読み込み・1回の走査で評価）
+
+各チェックは @rule で登録する Rule クラス:
+  - start(ctx):     索引済みの ValidationContext を受け取る
+  - visit(pokemon): 全ルール共通の1回の走査で、ポケモンごとに呼ばれる
+  - finish():       問題のリストを返す
+
+差分検証（--incremental）:
+  ルールは読むフィールド（fields）・セクション（sections）と、問題がどのグループで決まるか（groups / group_key）を宣言する。
+  前回の検証結果（Tools/.validation_snapshot.json）とポケモンごとのハッシュを比べ、
+  変更されたポケモンが属するグループだけを再検証する。group_key の無いルールは変更があれば全体を再検証する。
+
+使い方:
+  python validation_engine.py [json_path] [--rules id,id] [--incremental] [--compact] [--json report.json] [--junit report.xml]
+  （--compact: compact_dataset.load_compact で読み込み、ピークメモリを減らす）
+"""
+
+import inspect
+import json
+import sys
+import time
+import xml.etree.ElementTree as ET
+from functools import cached_property
+from pathlib import Path
+
+from compact_dataset import load_compact, to_plain
+from tool_runner import install_hooks
+from translation_cache import content_hash
+
+DEFAULT_DATASET_PATH = Path(__file__).parent.parent / 'Pokedex' / 'Pokedex' / 'Resources' / 'PreloadedData' / 'scarlet_violet.json'
+
+DEFAULT_SNAPSHOT_PATH = Path(__file__).parent / '.validation_snapshot.json'
+
+SEVERITIES = ('error', 'warning', 'info')
+
+# ルールID → Rule クラス（登録順）
+RULES = {}
+
+
+def rule(cls):
+    """Rule クラスを登録するデコレーター"""
+    if cls.id in RULES:
+        raise ValueError(f"Duplicate rule id: {cls.id}")
+    RULES[cls.id] = cls
+    return cls
+
+
+class Rule:
+    id = ''
+    description = ''
+    # 差分検証用: ルールが読むポケモンのフィールド（None はレコード全体）
+    fields: tuple[str, ...] | None = None
+    # ポケモン以外に読むセクション（変更されたら全体を再検証）
+    sections: tuple[str, ...] = ()
+    # 問題の詳細のうちグループを表すキー（None なら差分検証せず全体を再検証）
+    group_key: str | None = None
+
+    def groups(self, pokemon: dict) -> list:
+        """ポケモンが属するグループ（あるグループの問題は、そのグループのポケモンだけで決まる）"""
+        return []
+
+    def start(self, ctx: 'ValidationContext'):
+        self.ctx = ctx
+
+    def visit(self, pokemon: dict):
+        pass
+
+    def finish(self) -> list[dict]:
+        return []
+
+    def issue(self, severity: str, message: str, **details) -> dict:
+        return {'rule': self.id, 'severity': severity, 'message': message, **details}
+
+
+class ValidationContext:
+    """1回だけ読み込んだデータセットと、ルール間で共有する索引（必要になったときに作る）"""
+
+    def __init__(self, data: dict, pokemon_list: list[dict] | None = None):
+        self.data = data
+        # 差分検証では再検証するグループのポケモンだけを渡す
+        self.pokemon = data['pokemon'] if pokemon_list is None else pokemon_list
+
+    @cached_property
+    def by_name(self) -> dict[str, dict]:
+        return {p['name']: p for p in self.pokemon}
+
+    @cached_property
+    def form_index(self):
+        from form_index import FormFamilyIndex
+        return FormFamilyIndex(self.pokemon)
+
+    @cached_property
+    def evolution_graph(self):
+        from evolution_checker import EvolutionGraph
+        return EvolutionGraph(self.data, self.pokemon)
+
+    @cached_property
+    def pokedex_names(self) -> list[str]:
+        names = [p['name'] for p in self.data.get('pokedexes', [])]
+        return names or ['paldea', 'kitakami', 'blueberry']
+
+
+def load_rules() -> dict:
+    import validation_rules  # noqa: F401  ルールを登録する
+    return RULES
+
+
+def _select_rules(rule_ids: list[str] | None) -> list[Rule]:
+    registry = load_rules()
+    unknown = [r for r in rule_ids or [] if r not in registry]
+    if unknown:
+        raise KeyError(f"Unknown rule(s): {', '.join(unknown)}")
+    return [registry[r]() for r in (rule_ids or registry)]
+
+
+def _overrides_visit(r: Rule) -> bool:
+    return type(r).visit is not Rule.visit
+
+
+def _build_report(data: dict, rules: list[Rule], results: list[tuple[list[dict], float]], started: float, **summary) -> dict:
+    rule_reports = []
+    all_issues = []
+    for r, (issues, elapsed) in zip(rules, results):
+        rule_reports.append({
+            'id': r.id,
+            'description': r.description,
+            'issues': len(issues),
+            'durationMs': round(elapsed * 1000, 3),
+        })
+        all_issues.extend(issues)
+
+    by_severity = {s: 0 for s in SEVERITIES}
+    for issue in all_issues:
+        by_severity[issue['severity']] += 1
+
+    return {
+        'summary': {
+            'versionGroup': data.get('versionGroup'),
+            'pokemon': len(data['pokemon']),
+            'rules': len(rules),
+            'issues': len(all_issues),
+            'bySeverity': by_severity,
+            **summary,
+            'durationMs': round((time.perf_counter() - started) * 1000, 3),
+        },
+        'rules': rule_reports,
+        'issues': all_issues,
+    }
+
+
+def validate(data: dict, rule_ids: list[str] | None = None) -> dict:
+    """
+    全ルールを評価して機械可読なレポートを返す
+
+    Returns:
+        {"summary": {...}, "rules": [...], "issues": [...]}
+    """
+    rules = _select_rules(rule_ids)
+
+    started = time.perf_counter()
+    ctx = ValidationContext(data)
+    timings = {}
+    for r in rules:
+        t = time.perf_counter()
+        r.start(ctx)
+        timings[r.id] = time.perf_counter() - t
+
+    # 1回の走査で、visit を実装しているルールにだけ渡す
+    visitors = [r for r in rules if _overrides_visit(r)]
+    if visitors:
+        t = time.perf_counter()
+        for pokemon in ctx.pokemon:
+            for r in visitors:
+                r.visit(pokemon)
+        traversal = time.perf_counter() - t
+    else:
+        traversal = 0.0
+
+    def finish(r):
+        t = time.perf_counter()
+        issues = r.finish()
+        return issues, timings[r.id] + time.perf_counter() - t
+
+    results = [finish(r) for r in rules]
+
+    return _build_report(data, rules, results, started, traversalMs=round(traversal * 1000, 3))
+
+
+def _rule_version(r: Rule) -> str:
+    """ルールの定義（モジュールのソース）が変わったら前回の結果を使わない"""
+    module = sys.modules[type(r).__module__]
+    return content_hash(inspect.getsource(module), inspect.getsource(sys.modules[__name__]))
+
+
+def _entity_hashes(pokemon_list: list[dict], fields: tuple[str, ...] | None) -> dict[str, str]:
+    """名前 → ルールが読むフィールドだけのハッシュ"""
+    hashes = {}
+    for pokemon in pokemon_list:
+        content = pokemon if fields is None else {f: pokemon.get(f) for f in fields}
+        hashes[pokemon['name']] = content_hash(json.dumps(content, ensure_ascii=False, sort_keys=True, default=to_plain))
+    return hashes
+
+
+def _run_rule(r: Rule, ctx: ValidationContext) -> list[dict]:
+    r.start(ctx)
+    if _overrides_visit(r):
+        for pokemon in ctx.pokemon:
+            r.visit(pokemon)
+    return r.finish()
+
+
+def validate_incremental(data: dict, snapshot: dict, rule_ids: list[str] | None = None) -> dict:
+    """
+    前回の検証結果 snapshot との差分だけを再検証する（snapshot はこの実行の結果で更新される）
+
+    変更の検出はポケモンごとのハッシュ計算1回分、ルールの再評価は変更されたグループの大きさに比例する。
+    """
+    rules = _select_rules(rule_ids)
+    started = time.perf_counter()
+    pokemon_by_name = {p['name']: p for p in data['pokemon']}
+    section_hashes = {
+        name: content_hash(json.dumps(data.get(name), ensure_ascii=False, sort_keys=True, default=to_plain))
+        for name in sorted({s for r in rules for s in r.sections})
+    }
+    hashes_by_fields = {}
+
+    results = []
+    rule_reports = []
+    changed_entities = set()
+    for r in rules:
+        t = time.perf_counter()
+        if r.fields not in hashes_by_fields:
+            hashes_by_fields[r.fields] = _entity_hashes(data['pokemon'], r.fields)
+        hashes = hashes_by_fields[r.fields]
+
+        state = snapshot.get(r.id)
+        version = _rule_version(r)
+        sections = {name: section_hashes[name] for name in r.sections}
+        if state and state['version'] == version and state['sections'] == sections:
+            old_hashes = state['hashes']
+            changed = {n for n, h in hashes.items() if old_hashes.get(n) != h} | (old_hashes.keys() - hashes.keys())
+        else:
+            state, changed = None, set(hashes)
+        changed_entities |= changed
+
+        if state and not changed:
+            mode, issues, rechecked = 'cached', state['issues'], 0
+            groups = state['groups']
+        elif state and r.group_key is not None:
+            # 変更前・変更後のどちらかで属していたグループを再検証する
+            groups = dict(state['groups'])
+            affected = set()
+            for name in changed:
+                affected.update(groups.pop(name, []))
+                if name in pokemon_by_name:
+                    groups[name] = r.groups(pokemon_by_name[name])
+                    affected.update(groups[name])
+            members = {n for n, gs in groups.items() if not affected.isdisjoint(gs)}
+            subset = [p for p in data['pokemon'] if p['name'] in members]
+
+            found = _run_rule(r, ValidationContext(data, subset))
+            kept = [i for i in state['issues'] if i[r.group_key] not in affected]
+            issues = kept + [i for i in found if i[r.group_key] in affected]
+            mode, rechecked = 'incremental', len(subset)
+        else:
+            issues = _run_rule(r, ValidationContext(data))
+            groups = {p['name']: r.groups(p) for p in data['pokemon']} if r.group_key is not None else {}
+            mode, rechecked = 'full', len(data['pokemon'])
+
+        if r.group_key is not None:
+            # 再検証の有無で並び順が変わらないようにグループ順にそろえる
+            issues = sorted(issues, key=lambda i: str(i[r.group_key]))
+        snapshot[r.id] = {
+            'version': version,
+            'sections': sections,
+            'hashes': hashes,
+            'groups': groups,
+            'issues': issues,
+        }
+        results.append((issues, time.perf_counter() - t))
+        rule_reports.append({'mode': mode, 'rechecked': rechecked})
+
+    report = _build_report(data, rules, results, started, changedEntities=len(changed_entities))
+    for rule_report, extra in zip(report['rules'], rule_reports):
+        rule_report.update(extra)
+    return report
+
+
+def load_snapshot(path: Path = DEFAULT_SNAPSHOT_PATH, dataset: str = '') -> dict:
+    """前回の検証結果（データセットのパスごと）"""
+    if not path.exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f).get(dataset, {})
+
+
+def save_snapshot(snapshot: dict, path: Path = DEFAULT_SNAPSHOT_PATH, dataset: str = ''):
+    stored = {}
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            stored = json.load(f)
+    stored[dataset] = snapshot
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(stored, f, ensure_ascii=False)
+
+
+def to_junit(report: dict) -> ET.ElementTree:
+    """ルールを testcase、error の問題を failure、warning/info を system-out にする"""
+    summary = report['summary']
+    errors_by_rule = {}
+    for issue in report['issues']:
+        errors_by_rule.setdefault(issue['rule'], []).append(issue)
+
+    suite = ET.Element('testsuite', {
+        'name': 'dataset-validation',
+        'tests': str(summary['rules']),
+        'failures': str(sum(1 for r in report['rules'] if any(
+            i['severity'] == 'error' for i in errors_by_rule.get(r['id'], [])))),
+        'time': f"{summary['durationMs'] / 1000:.3f}",
+    })
+    for r in report['rules']:
+        case = ET.SubElement(suite, 'testcase', {
+            'classname': 'validation_rules',
+            'name': r['id'],
+            'time': f"{r['durationMs'] / 1000:.3f}",
+        })
+        issues = errors_by_rule.get(r['id'], [])
+        errors = [i for i in issues if i['severity'] == 'error']
+        if errors:
+            failure = ET.SubElement(case, 'failure', {'message': f"{len(errors)} error(s)"})
+            failure.text = '\n'.join(i['message'] for i in errors)
+        others = [i for i in issues if i['severity'] != 'error']
+        if others:
+            ET.SubElement(case, 'system-out').text = '\n'.join(f"[{i['severity']}] {i['message']}" for i in others)
+    tree = ET.ElementTree(suite)
+    ET.indent(tree)
+    return tree
+
+
+def _pop_option(args: list[str], name: str) -> str | None:
+    if name not in args:
+        return None
+    i = args.index(name)
+    value = args[i + 1]
+    del args[i:i + 2]
+    return value
+
+
+def main():
+    args = sys.argv[1:]
+    json_report = _pop_option(args, '--json')
+    junit_report = _pop_option(args, '--junit')
+    rule_ids = _pop_option(args, '--rules')
+    incremental = '--incremental' in args
+    if incremental:
+        args.remove('--incremental')
+    compact = '--compact' in args
+    if compact:
+        args.remove('--compact')
+
+    json_path = Path(args[0]) if args else DEFAULT_DATASET_PATH
+    if compact:
+        data = load_compact(json_path)
+    else:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+    rule_ids = rule_ids.split(',') if rule_ids else None
+    if incremental:
+        dataset = str(json_path.resolve())
+        snapshot = load_snapshot(dataset=dataset)
+        report = validate_incremental(data, snapshot, rule_ids)
+        save_snapshot(snapshot, dataset=dataset)
+    else:
+        report = validate(data, rule_ids)
+    summary = report['summary']
+
+    print(f"🔍 {json_path.name}: {summary['pokemon']}匹 / {summary['rules']}ルール ({summary['durationMs']:.1f} ms)")
+    if incremental:
+        print(f"  🔁 変更されたポケモン: {summary['changedEntities']}匹")
+    for r in report['rules']:
+        mark = '✅' if not r['issues'] else '⚠️ '
+        mode = f" [{r['mode']}: {r['rechecked']}匹]" if incremental else ''
+        print(f"  {mark} {r['id']}: {r['issues']}件 - {r['description']}{mode}")
+    for issue in report['issues']:
+        if issue['severity'] == 'error':
+            print(f"  ❌ [{issue['rule']}] {issue['message']}")
+
+    if json_report:
+        with open(json_report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"📝 Report: {json_report}")
+    if junit_report:
+        to_junit(report).write(junit_report, encoding='utf-8', xml_declaration=True)
+        print(f"📝 JUnit: {junit_report}")
+
+    return 1 if summary['bySeverity']['error'] else 0
+
+
+if __name__ == '__main__':
+    install_hooks()
+    # validation_rules は validation_engine モジュールに登録するので、そちらの main を実行する
+    import validation_engine
+    sys.exit(validation_engine.main())
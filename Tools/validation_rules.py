@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Validation rules
+データセット検証ルール（check_* スクリプトの内容を validation_engine のルールとして登録）
+"""
+
+from collections import defaultdict
+
+from pokedex_analyzer import PokedexAnalyzer
+from validation_engine import Rule, rule
+
+# 全国図鑑番号 → (基本形, 日本語名, 期待するフォーム数)
+KNOWN_FORM_COUNTS = {
+    201: ('unown', 'アンノーン', 28),  # A-Z + ! + ?
+    386: ('deoxys', 'デオキシス', 4),  # ノーマル/アタック/ディフェンス/スピード
+    412: ('burmy', 'ミノムッチ', 3),  # くさき/すなち/ゴミ
+    413: ('wormadam', 'ミノマダム', 3),  # くさき/すなち/ゴミ
+    422: ('shellos', 'カラナクシ', 2),  # にしのうみ/ひがしのうみ
+    423: ('gastrodon', 'トリトドン', 2),  # にしのうみ/ひがしのうみ
+    487: ('giratina', 'ギラティナ', 2),  # アナザー/オリジン
+    492: ('shaymin', 'シェイミ', 2),  # ランド/スカイ
+    585: ('deerling', 'シキジカ', 4),  # 春夏秋冬
+    586: ('sawsbuck', 'メブキジカ', 4),  # 春夏秋冬
+    592: ('frillish', 'プルリル', 2),  # オス/メス
+    593: ('jellicent', 'ブルンゲル', 2),  # オス/メス
+    641: ('tornadus', 'トルネロス', 2),  # けしん/れいじゅう
+    642: ('thundurus', 'ボルトロス', 2),  # けしん/れいじゅう
+    645: ('landorus', 'ランドロス', 2),  # けしん/れいじゅう
+    647: ('keldeo', 'ケルディオ', 2),  # 通常/かくご
+    648: ('meloetta', 'メロエッタ', 2),  # ボイス/ステップ
+    649: ('genesect', 'ゲノセクト', 5),  # 通常+カセット4種
+    666: ('vivillon', 'ビビヨン', 20),  # 模様違い
+    669: ('flabebe', 'フラベベ', 5),  # 花の色
+    670: ('floette', 'フラエッテ', 6),  # 花の色+エターナル
+    671: ('florges', 'フラージェス', 5),  # 花の色
+    676: ('furfrou', 'トリミアン', 10),  # カット違い
+    678: ('meowstic', 'ニャオニクス', 2),  # オス/メス - 既に登録済み
+    681: ('aegislash', 'ギルガルド', 2),  # シールド/ブレード
+    710: ('pumpkaboo', 'バケッチャ', 4),  # サイズ違い
+    711: ('gourgeist', 'パンプジン', 4),  # サイズ違い
+    718: ('zygarde', 'ジガルデ', 3),  # 10%/50%/パーフェクト
+    720: ('hoopa', 'フーパ', 2),  # いましめ/ときはなた
+    741: ('oricorio', 'オドリドリ', 4),  # スタイル違い - 既に登録済み
+    773: ('silvally', 'シルヴァディ', 18),  # タイプ違い
+    774: ('minior', 'メテノ', 14),  # 色違い - 既に登録済み
+    800: ('necrozma', 'ネクロズマ', 4),  # 通常/たそがれ/あかつき/ウルトラ
+    801: ('magearna', 'マギアナ', 2),  # 通常/500年前
+    888: ('zacian', 'ザシアン', 2),  # れきせん/けんのおう
+    889: ('zamazenta', 'ザマゼンタ', 2),  # れきせん/たてのおう
+    890: ('eternatus', 'ムゲンダイナ', 2),  # 通常/ムゲンダイマックス
+    892: ('urshifu', 'ウーラオス', 2),  # いちげき/れんげき
+    898: ('calyrex', 'バドレックス', 3),  # 通常/はくば/こくば
+}
+
+# 全国図鑑番号 → (基本形, 日本語名, 登録されているべきフォーム名)
+EXPECTED_FORMS = {
+    422: ('shellos', 'カラナクシ', ['shellos', 'shellos-east', 'shellos-west']),
+    423: ('gastrodon', 'トリトドン', ['gastrodon', 'gastrodon-east', 'gastrodon-west']),
+    585: ('deerling', 'シキジカ', ['deerling-spring', 'deerling-summer', 'deerling-autumn', 'deerling-winter']),
+    586: ('sawsbuck', 'メブキジカ', ['sawsbuck-spring', 'sawsbuck-summer', 'sawsbuck-autumn', 'sawsbuck-winter']),
+    592: ('frillish', 'プルリル', ['frillish-male', 'frillish-female']),
+    593: ('jellicent', 'ブルンゲル', ['jellicent-male', 'jellicent-female']),
+    666: ('vivillon', 'ビビヨン', ['vivillon-meadow', 'vivillon-icy-snow', 'vivillon-polar']),  # 20種あるが代表例
+    669: ('flabebe', 'フラベベ', ['flabebe-red', 'flabebe-yellow', 'flabebe-orange', 'flabebe-blue', 'flabebe-white']),
+    670: ('floette', 'フラエッテ', ['floette-red', 'floette-yellow', 'floette-orange', 'floette-blue', 'floette-white']),
+    671: ('florges', 'フラージェス', ['florges-red', 'florges-yellow', 'florges-orange', 'florges-blue', 'florges-white']),
+    710: ('pumpkaboo', 'バケッチャ', ['pumpkaboo-small', 'pumpkaboo-average', 'pumpkaboo-large', 'pumpkaboo-super']),
+    711: ('gourgeist', 'パンプジン', ['gourgeist-small', 'gourgeist-average', 'gourgeist-large', 'gourgeist-super']),
+    801: ('magearna', 'マギアナ', ['magearna', 'magearna-original']),
+    890: ('eternatus', 'ムゲンダイナ', ['eternatus', 'eternatus-eternamax']),
+}
+
+# 基本形 → 登場するなら揃っているべきコスメティックフォーム
+EXPECTED_COSMETIC_FORMS = {
+    'flabebe': ['flabebe', 'flabebe-red', 'flabebe-yellow', 'flabebe-orange', 'flabebe-blue', 'flabebe-white'],
+    'floette': ['floette', 'floette-red', 'floette-yellow', 'floette-orange', 'floette-blue', 'floette-white'],
+    'florges': ['florges', 'florges-red', 'florges-yellow', 'florges-orange', 'florges-blue', 'florges-white'],
+    'pumpkaboo': ['pumpkaboo', 'pumpkaboo-small', 'pumpkaboo-large', 'pumpkaboo-super'],
+    'gourgeist': ['gourgeist', 'gourgeist-small', 'gourgeist-large', 'gourgeist-super'],
+    'furfrou': [
+        'furfrou', 'furfrou-heart', 'furfrou-star', 'furfrou-diamond',
+        'furfrou-debutante', 'furfrou-matron', 'furfrou-dandy',
+        'furfrou-la-reine', 'furfrou-kabuki', 'furfrou-pharaoh'
+    ],
+    'cetoddle': ['cetoddle', 'cetoddle-curly'],
+    'cetitan': ['cetitan', 'cetitan-curly'],
+}
+
+# 性別で姿が違うポケモン（代表例）
+GENDER_DIFFERENCE_POKEMON = [
+    'hippopotas',    # ヒポポタス
+    'hippowdon',     # カバルドン
+    'pyroar',        # カエンジシ
+    'meowstic',      # ニャオニクス - 既に別登録
+    'indeedee',      # イエッサン - 既に別登録
+    'unfezant',      # ケンホロウ
+    'frillish',      # プルリル
+    'jellicent',     # ブルンゲル
+]
+
+
+@rule
+class UniqueIdRule(Rule):
+    id = 'unique_ids'
+    description = 'ポケモンIDの重複'
+    fields = ('id', 'name')
+    group_key = 'id'
+
+    def groups(self, pokemon):
+        return [pokemon['id']]
+
+    def start(self, ctx):
+        super().start(ctx)
+        self.names_by_id = defaultdict(list)
+
+    def visit(self, pokemon):
+        self.names_by_id[pokemon['id']].append(pokemon['name'])
+
+    def finish(self):
+        return [
+            self.issue('error', f"ID {pokemon_id} が重複: {', '.join(names)}", id=pokemon_id, names=names)
+            for pokemon_id, names in sorted(self.names_by_id.items())
+            if len(names) > 1
+        ]
+
+
+@rule
+class PokedexNumbersRule(Rule):
+    """check_pokedex_continuity.py / check_pokedex_duplicates.py（pokedex_analyzer で集計）"""
+    id = 'pokedex_numbers'
+    description = '地方図鑑番号の欠番・重複・speciesIds との食い違い'
+    fields = ('name', 'nationalDexNumber', 'pokedexNumbers')
+    sections = ('pokedexes',)
+    group_key = 'pokedex'
+
+    def groups(self, pokemon):
+        return list(pokemon.get('pokedexNumbers') or {})
+
+    def start(self, ctx):
+        super().start(ctx)
+        self.analyzer = PokedexAnalyzer(ctx.data.get('pokedexes'))
+
+    def visit(self, pokemon):
+        self.analyzer.add(pokemon)
+
+    def finish(self):
+        issues = []
+        for pokedex_name, result in self.analyzer.report().items():
+            for start, length in result['gapRuns']:
+                missing = list(range(start, start + length))
+                issues.append(self.issue(
+                    'warning', f"{pokedex_name}: #{start - 1} → #{start + length} 欠番 {missing}",
+                    pokedex=pokedex_name, missing=missing,
+                ))
+            for num, names in result['duplicates'].items():
+                issues.append(self.issue(
+                    'warning', f"{pokedex_name}: #{num} が重複: {', '.join(names)}",
+                    pokedex=pokedex_name, number=num, names=names,
+                ))
+            if result.get('missingSpecies'):
+                issues.append(self.issue(
+                    'warning', f"{pokedex_name}: speciesIds にあるが図鑑番号が無い種族 {result['missingSpecies']}",
+                    pokedex=pokedex_name, species=result['missingSpecies'],
+                ))
+            if result.get('unlistedSpecies'):
+                issues.append(self.issue(
+                    'warning', f"{pokedex_name}: 図鑑番号があるが speciesIds に無い種族 {result['unlistedSpecies']}",
+                    pokedex=pokedex_name, species=result['unlistedSpecies'],
+                ))
+        return issues
+
+
+@rule
+class FormCountRule(Rule):
+    """check_all_forms.py"""
+    id = 'form_counts'
+    description = 'フォーム数が不足している可能性のあるポケモン'
+    fields = ('name', 'nationalDexNumber')
+    group_key = 'nationalDexNumber'
+
+    def groups(self, pokemon):
+        return [pokemon['nationalDexNumber']] if pokemon.get('nationalDexNumber') else []
+
+    def finish(self):
+        by_national = self.ctx.form_index.by_national
+        issues = []
+        for nat_num, (base_name, name_ja, expected) in KNOWN_FORM_COUNTS.items():
+            actual = by_national.get(nat_num)
+            if actual and len(actual) < expected:
+                issues.append(self.issue(
+                    'info', f"#{nat_num:03d} {name_ja} ({base_name}): {len(actual)}/{expected}フォーム",
+                    nationalDexNumber=nat_num, expected=expected, actual=list(actual),
+                ))
+        return issues
+
+
+@rule
+class ExpectedFormsRule(Rule):
+    """check_forms_by_pokedex.py"""
+    id = 'expected_forms'
+    description = '図鑑ごとのフォーム不足'
+    fields = ('name', 'nationalDexNumber', 'pokedexNumbers')
+    sections = ('pokedexes',)
+    group_key = 'nationalDexNumber'
+
+    def groups(self, pokemon):
+        return [pokemon['nationalDexNumber']] if pokemon.get('nationalDexNumber') else []
+
+    def finish(self):
+        index = self.ctx.form_index
+        scopes = [(name, index.by_national_in_dex[name]) for name in self.ctx.pokedex_names]
+        scopes.append(('national', index.by_national))
+
+        issues = []
+        for scope, by_national in scopes:
+            for nat_num, (base_name, name_ja, expected) in EXPECTED_FORMS.items():
+                actual = by_national.get(nat_num)
+                if not actual:
+                    continue
+                actual_set = set(actual)
+                missing = [f for f in expected if f not in actual_set]
+                if missing:
+                    issues.append(self.issue(
+                        'warning', f"{scope}: #{nat_num:03d} {name_ja} ({base_name}) 未登録: {', '.join(missing)}",
+                        pokedex=scope, nationalDexNumber=nat_num, missing=missing,
+                    ))
+        return issues
+
+
+@rule
+class CosmeticFormsRule(Rule):
+    """check_missing_cosmetic_forms.py"""
+    id = 'cosmetic_forms'
+    description = '登場するポケモンのコスメティックフォーム不足'
+    fields = ('name',)
+    group_key = 'base'
+
+    def groups(self, pokemon):
+        return [pokemon['name'].split('-')[0]]
+
+    def finish(self):
+        index = self.ctx.form_index
+        issues = []
+        for base_name, forms in EXPECTED_COSMETIC_FORMS.items():
+            if not index.names_with_prefix(base_name):
+                continue
+            missing = [f for f in forms if f not in index.by_name]
+            if missing:
+                issues.append(self.issue(
+                    'warning', f"{base_name}: 未登録 {', '.join(missing)}", base=base_name, missing=missing,
+                ))
+        return issues
+
+
+@rule
+class GenderSpritesRule(Rule):
+    """check_gender_differences.py（PokeAPI への問い合わせ部分は含まない）"""
+    id = 'gender_sprites'
+    description = '性別違いポケモンのスプライト'
+    fields = ('name', 'sprites')
+    group_key = 'base'
+
+    def groups(self, pokemon):
+        return [pokemon['name'].split('-')[0]]
+
+    def finish(self):
+        index = self.ctx.form_index
+        issues = []
+        for base_name in GENDER_DIFFERENCE_POKEMON:
+            for name in index.names_with_prefix(base_name):
+                sprites = index.by_name[name].get('sprites') or {}
+                missing = [k for k in ('normal', 'shiny') if not sprites.get(k)]
+                if missing:
+                    issues.append(self.issue(
+                        'error', f"{name}: スプライトなし ({', '.join(missing)})", base=base_name, name=name, missing=missing,
+                    ))
+        return issues
+
+
+@rule
+class EvolutionRule(Rule):
+    """evolution_checker.py"""
+    id = 'evolution'
+    description = '進化チェーンの整合性（技継承・ステージ・リージョン・参照）'
+    # 他のチェーンから削除されたIDへの参照（dangling_reference）は、参照元のチェーンが再検証されるまで検出されない
+    fields = ('id', 'name', 'nameJa', 'evolutionChain', 'moves')
+    sections = ('moves',)
+    group_key = 'chainId'
+
+    def groups(self, pokemon):
+        chain_id = (pokemon.get('evolutionChain') or {}).get('chainId')
+        return [chain_id] if chain_id is not None else []
+
+    def finish(self):
+        issues = []
+        for found in self.ctx.evolution_graph.check():
+            subject = found.get('pokemon') or {}
+            label = f"{subject.get('nameJa') or subject.get('name', '')} " if subject else ''
+            details = {k: v for k, v in found.items() if k != 'severity'}
+            issues.append(self.issue(
+                found['severity'], f"chain {found['chainId']}: {label}{found['kind']}", **details,
+            ))
+        return issues